@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Benchmark de vazão de blits dos sprites do Pac-Man
+
+Compara, para cada grupo de sprites (Pacman colorido, fantasmas, frutas), a
+quantidade de blits por segundo sobre o tabuleiro com as superfícies como
+saem do PNG e depois de preparadas para o formato do display
+(src/assets.py: colorkey com RLE, convert ou convert_alpha). O resultado é
+salvo em JSON para comparação entre versões.
+
+Uso:
+    python benchmarks/blit_throughput.py [--scale 16] [--blits 20000] [--output benchmarks/results/blit_throughput.json]
+"""
+
+import os
+import sys
+import time
+import argparse
+import platform
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+import pygame as pg
+from src.game import PacMan
+from src.assets import prepare_surface, alpha_kind
+from src.constants import PLAYER_1_COLOR
+from frame_stages import git_revision, save_results, RESULTS_DIR
+
+IMG_DIR = os.path.join(ROOT_DIR, "img")
+SPRITE_GROUPS = {
+    "pacman": [f"Pac_Man_{i}.png" for i in range(1, 18)],
+    "ghosts": [f"{color}_Ghost_{look}_{frame}.png"
+               for color in ("Blue", "Orange", "Pink", "Red")
+               for look in ("Down_Right", "Down", "Up")
+               for frame in range(2)],
+    "fruits": ["Cherry.png", "Strawberry.png", "Tangerine.png", "Apple.png",
+               "Bell.png", "Key.png", "Green Coconut.png", "Strange Flower.png"],
+}
+
+
+def load_raw(game, group):
+    """Carrega os sprites do grupo como os loaders fazem, sem conversão de formato"""
+    size = (game.scale * 1.2, game.scale * 1.2) if group == "fruits" else (game.scale * 1.3, game.scale * 1.3)
+    sprites = []
+    for filename in SPRITE_GROUPS[group]:
+        sprite = pg.transform.scale(pg.image.load(os.path.join(IMG_DIR, filename)), size)
+        if group == "pacman":
+            sprite = game._colorize_sprite(sprite, PLAYER_1_COLOR)
+        sprites.append(sprite)
+    return sprites
+
+
+def blits_per_second(window, background, sprites, blits):
+    """Blits por segundo dos sprites em posições variadas sobre o fundo"""
+    window.blit(background, (0, 0))
+    width = window.get_width() - 40
+    start = time.perf_counter()
+    for i in range(blits):
+        window.blit(sprites[i % len(sprites)], ((i * 7) % width, (i * 13) % 200 + 20))
+    return blits / (time.perf_counter() - start)
+
+
+def main():
+    """Função principal do benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark de vazão de blits dos sprites")
+    parser.add_argument("--scale", type=int, default=16, help="escala da janela")
+    parser.add_argument("--blits", type=int, default=20000, help="blits medidos por grupo e formato")
+    parser.add_argument("--output", default=os.path.join(RESULTS_DIR, "blit_throughput.json"),
+                        help="arquivo JSON de saída")
+    args = parser.parse_args()
+
+    pg.init()
+    game = PacMan(args.scale, None)
+    background = game.board_renderer.update(game.map, game.dot_index)
+
+    results = {
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "pygame": pg.version.ver,
+        "video_driver": pg.display.get_driver(),
+        "scale": args.scale,
+        "blits": args.blits,
+        "groups": {},
+    }
+    for group in SPRITE_GROUPS:
+        raw = load_raw(game, group)
+        prepared = [prepare_surface(sprite) for sprite in raw]
+        raw_rate = blits_per_second(game.window, background, raw, args.blits)
+        prepared_rate = blits_per_second(game.window, background, prepared, args.blits)
+        results["groups"][group] = summary = {
+            "alpha": sorted({alpha_kind(sprite) for sprite in raw}),
+            "raw_blits_per_s": round(raw_rate),
+            "prepared_blits_per_s": round(prepared_rate),
+            "speedup": round(prepared_rate / raw_rate, 2),
+        }
+        print(f"📊 {group:<7} ({', '.join(summary['alpha'])}): "
+              f"PNG {summary['raw_blits_per_s']:>9} blits/s   "
+              f"preparado {summary['prepared_blits_per_s']:>9} blits/s   ({summary['speedup']}x)")
+
+    save_results(results, args.output)
+    print(f"\n✅ Resultados salvos em {args.output}")
+
+    pg.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Benchmark do custo por etapa do loop principal do Pac-Man
+
+Roda cenários roteirizados (1, 2 e 3 jogadores; início de jogo, fim de
+jogo e modo inofensivo) com o driver de vídeo dummy do SDL e mede cada
+etapa do frame. O resultado (média e p99 por etapa, FPS) é salvo em JSON
+para comparação entre versões.
+
+Uso:
+    python benchmarks/frame_stages.py [--frames 600] [--scale 16] [--render-scale 8] [--render full|dirty]
+                                      [--output benchmarks/results/frame_stages.json]
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import subprocess
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+# Saída padrão dos benchmarks (ignorada pelo git)
+RESULTS_DIR = os.path.join(ROOT_DIR, "benchmarks", "results")
+
+import pygame as pg
+from src.game import PacMan
+from src.constants import EMPTY
+
+# Etapas do frame, na mesma ordem de PacMan.run (lógica de step() e depois renderização)
+LOGIC_STAGES = [
+    "animation_step",
+    "_update_fruits",
+    "player",
+    "ghost",
+    "collect_dots",
+    "collect_fruits",
+    "ghost_manager",
+    "ghost_and_pacman_collider",
+    "restart_ghost_collision",
+    "collect_all_dots",
+]
+RENDER_STAGES = [
+    "board",
+    "draw_players",
+    "draw_ghosts",
+    "scoreboard",
+    "handle_controller_input",
+]
+# Com retângulos sujos o desenho é uma única etapa e o display recebe só as áreas alteradas
+DIRTY_RENDER_STAGES = [
+    "draw_dirty_frame",
+    "handle_controller_input",
+]
+DISPLAY_STAGE = "display_update"
+
+GAME_MODES = {1: "Player 1", 2: "Player 2", 3: "Player 3"}
+STATES = ["early", "late", "harmless"]
+
+# Teclas de cada jogador usadas nas entradas roteirizadas
+PLAYER_KEYS = {
+    1: ["w", "a", "s", "d"],
+    2: ["up", "left", "down", "right"],
+    3: ["i", "j", "k", "l"],
+}
+
+WARMUP_FRAMES = 120  # Frames antes da medição (fantasmas saindo da casa)
+LATE_GAME_DOTS = 20  # Pontos restantes no cenário de fim de jogo
+
+
+def prepare_late_game(game):
+    """Remove quase todos os pontos e power pellets do mapa"""
+    remaining = sorted(game.dot_index.dots)[::len(game.dot_index.dots) // LATE_GAME_DOTS][:LATE_GAME_DOTS]
+    for tile in sorted(game.dot_index.dots):
+        if tile not in remaining:
+            game.map[tile[1]][tile[0]] = EMPTY
+            game.dot_index.remove_dot(tile)
+    for tile in sorted(game.dot_index.power_pellets):
+        game.map[tile[1]][tile[0]] = EMPTY
+        game.dot_index.remove_power_pellet(tile)
+
+
+def activate_harmless_mode(game):
+    """Coloca todos os fantasmas em modo inofensivo (como ao comer um power pellet)"""
+    game.harmless_mode = True
+    game.harmless_mode_timer = 0
+    game.harmless_mode_ghost_blue = True
+    game.harmless_mode_ghost_orange = True
+    game.harmless_mode_ghost_pink = True
+    game.harmless_mode_ghost_red = True
+
+
+def percentile(sorted_values, fraction):
+    """Percentil por posição em uma lista já ordenada"""
+    if not sorted_values:
+        return 0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def run_scenario(game, players, state, frames, seed, render="full"):
+    """Executa um cenário e retorna os tempos (ns) de cada etapa por frame"""
+    game.restart()
+    game.invalidate_frame()
+    game.game_mode = GAME_MODES[players]
+    random.seed(seed)
+    inputs = random.Random(seed)
+    keys = [key for player in range(1, players + 1) for key in PLAYER_KEYS[player]]
+
+    if state == "late":
+        prepare_late_game(game)
+
+    render_stages = DIRTY_RENDER_STAGES if render == "dirty" else RENDER_STAGES
+    stages = [(name, getattr(game, name)) for name in LOGIC_STAGES + render_stages]
+    timings = {name: [] for name, _ in stages}
+    timings[DISPLAY_STAGE] = []
+    frame_times = []
+
+    for frame in range(WARMUP_FRAMES + frames):
+        # Entradas e ajustes do cenário ficam fora da medição
+        if inputs.random() < 0.05:
+            game.move(inputs.choice(keys))
+        if game.lives < 1:
+            game.lives = 2  # Evita fim de jogo durante a medição
+        if state == "harmless" and not game.harmless_mode:
+            activate_harmless_mode(game)
+
+        measured = frame >= WARMUP_FRAMES
+        frame_start = time.perf_counter_ns()
+        dirty_rects = None
+        for name, stage in stages:
+            start = time.perf_counter_ns()
+            result = stage()
+            if measured:
+                timings[name].append(time.perf_counter_ns() - start)
+            if name == "draw_dirty_frame":
+                dirty_rects = result
+        start = time.perf_counter_ns()
+        game.render_target.present(dirty_rects)
+        if measured:
+            timings[DISPLAY_STAGE].append(time.perf_counter_ns() - start)
+        if measured:
+            frame_times.append(time.perf_counter_ns() - frame_start)
+
+    return timings, frame_times
+
+
+def summarize(timings, frame_times):
+    """Calcula média e p99 (em microssegundos) por etapa e o FPS sem limite"""
+    stages = {}
+    for name, values in timings.items():
+        ordered = sorted(values)
+        stages[name] = {
+            "mean_us": round(sum(ordered) / len(ordered) / 1000, 2),
+            "p99_us": round(percentile(ordered, 0.99) / 1000, 2),
+        }
+    ordered = sorted(frame_times)
+    mean_frame = sum(ordered) / len(ordered)
+    return {
+        "stages": stages,
+        "frame": {
+            "mean_us": round(mean_frame / 1000, 2),
+            "p99_us": round(percentile(ordered, 0.99) / 1000, 2),
+        },
+        "fps": round(1e9 / mean_frame, 1),
+    }
+
+
+def git_revision():
+    """Commit atual do repositório (None fora de um checkout git)"""
+    try:
+        result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT_DIR,
+                                capture_output=True, text=True, check=True)
+        return result.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def save_results(results, path):
+    """Grava os resultados em JSON, criando a pasta de destino se preciso"""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as output:
+        json.dump(results, output, indent=2)
+
+
+def print_report(results):
+    """Mostra a tabela de resultados no terminal"""
+    for scenario, summary in results["scenarios"].items():
+        print(f"\n📊 {scenario}: {summary['fps']} FPS "
+              f"(frame médio {summary['frame']['mean_us']} µs, p99 {summary['frame']['p99_us']} µs)")
+        for name, stats in summary["stages"].items():
+            print(f"   {name:<28} média {stats['mean_us']:>9.2f} µs   p99 {stats['p99_us']:>9.2f} µs")
+
+
+def main():
+    """Função principal do benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark do custo por etapa do loop principal")
+    parser.add_argument("--frames", type=int, default=600, help="frames medidos por cenário")
+    parser.add_argument("--scale", type=int, default=16, help="escala da janela")
+    parser.add_argument("--render-scale", type=int, default=None,
+                        help="escala lógica de renderização (ampliada para a janela)")
+    parser.add_argument("--render", choices=["full", "dirty"], default="full",
+                        help="frame completo ou apenas retângulos sujos")
+    parser.add_argument("--seed", type=int, default=1234, help="semente das entradas roteirizadas")
+    parser.add_argument("--output", default=os.path.join(RESULTS_DIR, "frame_stages.json"),
+                        help="arquivo JSON de saída")
+    args = parser.parse_args()
+
+    pg.init()
+    game = PacMan(args.scale, args.render_scale)
+
+    results = {
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "pygame": pg.version.ver,
+        "video_driver": pg.display.get_driver(),
+        "scale": args.scale,
+        "render_scale": args.render_scale,
+        "render": args.render,
+        "frames": args.frames,
+        "seed": args.seed,
+        "scenarios": {},
+    }
+    for players in GAME_MODES:
+        for state in STATES:
+            timings, frame_times = run_scenario(game, players, state, args.frames, args.seed, args.render)
+            results["scenarios"][f"{players}p_{state}"] = summarize(timings, frame_times)
+
+    print_report(results)
+    save_results(results, args.output)
+    print(f"\n✅ Resultados salvos em {args.output}")
+
+    pg.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
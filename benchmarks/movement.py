@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Benchmark do movimento com muitos agentes
+
+Compara, para cada quantidade de agentes, o passo por agente da simulação
+(turning_corner, collider e pacman_tunnel) com o MovementEngine vetorizado:
+com o estado mantido nos arrays do motor entre os passos (caso das
+variantes de estresse) e convertendo listas a cada chamada (move_agents,
+caso do jogo). Os agentes partem dos pontos de nascimento e trocam de
+direção ao acaso; ao final as posições dos dois caminhos são comparadas.
+O resultado é salvo em JSON para comparação entre versões.
+
+Uso:
+    python benchmarks/movement.py [--agents 7 100 2000] [--steps 200]
+                                  [--output benchmarks/results/movement.json]
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+import platform
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from src.simulation import GameSimulation
+from src.movement import MovementEngine, np
+from src.constants import (PACMAN_START_POS, PACMAN_2_START_POS, PACMAN_3_START_POS,
+                           GHOST_EXIT_POS)
+from frame_stages import git_revision, save_results, RESULTS_DIR
+
+SPAWNS = [PACMAN_START_POS, PACMAN_2_START_POS, PACMAN_3_START_POS, GHOST_EXIT_POS]
+DIRECTIONS = [[1, 0], [0, 1], [-1, 0], [0, -1]]
+
+
+def scripted_turns(count, steps, seed):
+    """Agentes iniciais e, para cada passo, as trocas de direção (índice, direção)"""
+    rng = random.Random(seed)
+    agents = [(list(rng.choice(SPAWNS)), list(rng.choice(DIRECTIONS))) for _ in range(count)]
+    turns = [[(rng.randrange(count), rng.choice(DIRECTIONS)) for _ in range(max(1, count // 20))]
+             for _ in range(steps)]
+    return agents, turns
+
+
+def run_scalar(sim, agents, turns):
+    """Move os agentes um a um como GameSimulation.player; retorna (ms por passo, posições)"""
+    positions = [position[:] for position, _ in agents]
+    directions = [direction[:] for _, direction in agents]
+    next_directions = [direction[:] for _, direction in agents]
+    start = time.perf_counter()
+    for step_turns in turns:
+        for index, direction in step_turns:
+            next_directions[index] = list(direction)
+        for index in range(len(positions)):
+            sim.turning_corner(positions[index], directions[index], next_directions[index])
+            position = sim.collider(positions[index], directions[index])
+            positions[index] = sim.pacman_tunnel(position)
+    elapsed = time.perf_counter() - start
+    return elapsed * 1000 / len(turns), positions
+
+
+def run_engine(engine, agents, turns):
+    """Estado mantido nos arrays do motor; retorna (ms por passo, posições)"""
+    engine.load([position for position, _ in agents], [direction for _, direction in agents],
+                [direction for _, direction in agents])
+    start = time.perf_counter()
+    for step_turns in turns:
+        for index, direction in step_turns:
+            engine.next_directions[index] = direction
+        engine.step()
+    elapsed = time.perf_counter() - start
+    return elapsed * 1000 / len(turns), engine.positions.tolist()
+
+
+def run_engine_lists(engine, agents, turns):
+    """Listas convertidas a cada passo, como no jogo; retorna (ms por passo, posições)"""
+    positions = [position[:] for position, _ in agents]
+    directions = [direction[:] for _, direction in agents]
+    next_directions = [direction[:] for _, direction in agents]
+    start = time.perf_counter()
+    for step_turns in turns:
+        for index, direction in step_turns:
+            next_directions[index] = list(direction)
+        positions = engine.move_agents(positions, directions, next_directions)
+    elapsed = time.perf_counter() - start
+    return elapsed * 1000 / len(turns), positions
+
+
+def main():
+    """Função principal do benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark do movimento com muitos agentes")
+    parser.add_argument("--agents", type=int, nargs="+", default=[7, 100, 2000], help="quantidades de agentes")
+    parser.add_argument("--steps", type=int, default=200, help="passos medidos por quantidade")
+    parser.add_argument("--seed", type=int, default=1234, help="semente das trocas de direção")
+    parser.add_argument("--output", default=os.path.join(RESULTS_DIR, "movement.json"),
+                        help="arquivo JSON de saída")
+    args = parser.parse_args()
+
+    if not MovementEngine.available():
+        print("❌ numpy não instalado: o MovementEngine não está disponível")
+        return 1
+
+    sim = GameSimulation()
+    engine = MovementEngine(sim.collision_grid)
+    results = {
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "steps": args.steps,
+        "seed": args.seed,
+        "agents": {},
+    }
+    for count in args.agents:
+        agents, turns = scripted_turns(count, args.steps, args.seed)
+        scalar_ms, expected = run_scalar(sim, agents, turns)
+        engine_ms, positions = run_engine(engine, agents, turns)
+        lists_ms, list_positions = run_engine_lists(engine, agents, turns)
+        results["agents"][str(count)] = summary = {
+            "scalar_ms": round(scalar_ms, 3),
+            "batched_ms": round(engine_ms, 3),
+            "batched_lists_ms": round(lists_ms, 3),
+            "identical": positions == expected and list_positions == expected,
+        }
+        print(f"📊 {count:>5} agentes: por agente {summary['scalar_ms']:>8.3f} ms   "
+              f"vetorizado {summary['batched_ms']:>7.3f} ms   "
+              f"com listas {summary['batched_lists_ms']:>7.3f} ms   "
+              f"{'idêntico' if summary['identical'] else 'DIFERENTE'}")
+
+    save_results(results, args.output)
+    print(f"\n✅ Resultados salvos em {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Benchmark do tempo de carregamento do Pac-Man
+
+Mede, para cada escala, o tempo de criação do jogo (janela, fontes e
+sprites) e o tempo para colorir os sprites do Pacman dos três jogadores
+pelo caminho vetorizado (numpy) e pelo caminho pixel a pixel original.
+A inicialização a frio (processo novo com o cache de sprites e tabelas
+vazio) e a de um segundo processo com o cache já gravado são medidas em
+subprocessos, separadas das repetições dentro deste processo, em que os
+caches já estão quentes. O resultado é salvo em JSON para comparação entre
+versões.
+
+Uso:
+    python benchmarks/startup.py [--scales 16 26 48] [--repeat 3]
+                                 [--output benchmarks/results/startup.json]
+"""
+
+import time
+
+# Início do processo: a medição a frio inclui a importação do pygame e do jogo
+PROCESS_START = time.perf_counter()
+
+import os
+import sys
+import argparse
+import platform
+import tempfile
+import subprocess
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+import pygame as pg
+from src.game import PacMan, load_numpy
+from src.constants import PLAYER_1_COLOR, PLAYER_2_COLOR, PLAYER_3_COLOR
+from frame_stages import git_revision, save_results, RESULTS_DIR
+
+PLAYER_COLORS = [PLAYER_1_COLOR, PLAYER_2_COLOR, PLAYER_3_COLOR]
+PACMAN_FRAMES = 17
+
+
+def load_scaled_sprites(scale):
+    """Carrega e redimensiona os sprites do Pacman como em _load_pacman_sprites"""
+    img_dir = os.path.join(ROOT_DIR, "img")
+    sprites = []
+    for i in range(1, PACMAN_FRAMES + 1):
+        sprite = pg.image.load(os.path.join(img_dir, f"Pac_Man_{i}.png"))
+        sprites.append(pg.transform.scale(sprite, (scale * 1.3, scale * 1.3)))
+    return sprites
+
+
+def time_colorize(colorize, sprites):
+    """Tempo (ms) para colorir todos os sprites para os três jogadores"""
+    start = time.perf_counter()
+    for color in PLAYER_COLORS:
+        for sprite in sprites:
+            colorize(sprite, color)
+    return (time.perf_counter() - start) * 1000
+
+
+def time_startup(scale):
+    """Tempo (ms) de criação do jogo e a instância criada"""
+    start = time.perf_counter()
+    game = PacMan(scale)
+    return (time.perf_counter() - start) * 1000, game
+
+
+def time_process_startup(scale, cache_dir):
+    """Tempo (ms) do início de um processo novo até o jogo criado, com o cache em cache_dir"""
+    env = dict(os.environ, PACMAN_CACHE_DIR=cache_dir)
+    result = subprocess.run([sys.executable, os.path.abspath(__file__), "--child-scale", str(scale)],
+                            cwd=ROOT_DIR, env=env, capture_output=True, text=True, check=True)
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def measure_processes(scale):
+    """Inicialização a frio (cache vazio) e a de um segundo processo (cache gravado pelo primeiro)"""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cold = time_process_startup(scale, cache_dir)
+        cached = time_process_startup(scale, cache_dir)
+    return {
+        "cold_process_ms": round(cold, 2),
+        "cached_process_ms": round(cached, 2),
+    }
+
+
+def measure(scale, repeat):
+    """Melhor tempo de cada medição em algumas repetições no mesmo processo (caches quentes)"""
+    np = load_numpy()
+    startup = []
+    vectorized = []
+    per_pixel = []
+    for _ in range(repeat):
+        elapsed, game = time_startup(scale)
+        startup.append(elapsed)
+        sprites = load_scaled_sprites(scale)
+        if np is not None:
+            vectorized.append(time_colorize(game._colorize_sprite, sprites))
+        per_pixel.append(time_colorize(game._colorize_sprite_pixels, sprites))
+    return {
+        "warm_startup_ms": round(min(startup), 2),
+        "colorize_vectorized_ms": round(min(vectorized), 2) if vectorized else None,
+        "colorize_per_pixel_ms": round(min(per_pixel), 2),
+    }
+
+
+def main():
+    """Função principal do benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark do tempo de carregamento")
+    parser.add_argument("--scales", type=int, nargs="+", default=[16, 26, 48], help="escalas medidas")
+    parser.add_argument("--repeat", type=int, default=3, help="repetições por escala (vale a melhor)")
+    parser.add_argument("--output", default=os.path.join(RESULTS_DIR, "startup.json"),
+                        help="arquivo JSON de saída")
+    parser.add_argument("--child-scale", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    pg.init()
+    if args.child_scale is not None:
+        # Subprocesso de measure_processes: só cria o jogo e informa o tempo desde o início
+        PacMan(args.child_scale)
+        print((time.perf_counter() - PROCESS_START) * 1000)
+        pg.quit()
+        return 0
+
+    np = load_numpy()
+    results = {
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "pygame": pg.version.ver,
+        "numpy": np.__version__ if np is not None else None,
+        "video_driver": None,
+        "repeat": args.repeat,
+        "scales": {},
+    }
+    for scale in args.scales:
+        summary = measure_processes(scale)
+        summary.update(measure(scale, args.repeat))
+        results["scales"][str(scale)] = summary
+        results["video_driver"] = pg.display.get_driver()
+        print(f"\n📊 escala {scale}: processo novo a frio {summary['cold_process_ms']} ms, "
+              f"com cache em disco {summary['cached_process_ms']} ms")
+        print(f"   criação do jogo com caches quentes {summary['warm_startup_ms']} ms")
+        print(f"   colorir {len(PLAYER_COLORS) * PACMAN_FRAMES} sprites: "
+              f"vetorizado {summary['colorize_vectorized_ms']} ms, "
+              f"pixel a pixel {summary['colorize_per_pixel_ms']} ms")
+
+    save_results(results, args.output)
+    print(f"\n✅ Resultados salvos em {args.output}")
+
+    pg.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
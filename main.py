@@ -4,17 +4,27 @@ Pac-Man Game - Python/pygame version
 Baseado na lógica do arquivo Pac_Man.py
 """
 
-import pygame
+import os
 import sys
+import argparse
+import pygame
 from src.game import PacMan
 
 def main():
     """Função principal do jogo"""
+    parser = argparse.ArgumentParser(description="Pac-Man")
+    parser.add_argument("--profile", metavar="ARQUIVO", default=os.environ.get("PACMAN_PROFILE"),
+                        help="mede cada etapa dos frames e salva em CSV (ou JSON, se terminar em .json) "
+                             "ao sair ou com F12; também via PACMAN_PROFILE")
+    args = parser.parse_args()
+    
     # Inicializar pygame
     pygame.init()
     
     # Criar instância do jogo com escala 16
     jogo = PacMan(16)
+    if args.profile:
+        jogo.enable_profiler(args.profile)
     
     # Executar o jogo
     jogo.run()
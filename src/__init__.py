@@ -1,5 +1,13 @@
 # Pacman Game Package
-from .game import PacMan
+from .simulation import GameSimulation
 from .constants import *
 
-__all__ = ['PacMan']
+__all__ = ['PacMan', 'GameSimulation']
+
+
+def __getattr__(name):
+    """Importa PacMan (e o pygame) só quando usado: a simulação roda sem display"""
+    if name == 'PacMan':
+        from .game import PacMan
+        return PacMan
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
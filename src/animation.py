@@ -0,0 +1,29 @@
+"""
+Animações do Pac-Man definidas como dados
+Cada clipe vira uma tabela indexada diretamente por sprite_frame
+"""
+
+
+class AnimationClip:
+    """Tabela sprite_frame -> quadro de uma animação
+
+    O clipe é descrito por passos (último sprite_frame do passo, chave do
+    quadro) em ordem crescente; na criação cada passo é expandido para todas
+    as posições que cobre, então escolher o quadro é um único acesso à
+    lista. Os quadros podem ser superfícies ou tuplas de superfícies por
+    direção.
+    """
+
+    def __init__(self, steps, frames):
+        """Expande os passos do clipe usando frames[chave] como quadro"""
+        self.table = []
+        for last_frame, key in steps:
+            frame = frames[key]
+            while len(self.table) <= last_frame:
+                self.table.append(frame)
+
+    def frame(self, sprite_frame):
+        """Quadro para o sprite_frame atual (None fora do clipe, como nas cadeias originais)"""
+        if sprite_frame < len(self.table):
+            return self.table[sprite_frame]
+        return None
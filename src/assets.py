@@ -0,0 +1,55 @@
+"""
+Preparação das superfícies carregadas para o formato do display
+Converte sprites e escolhe a forma de transparência mais barata de desenhar
+"""
+
+import pygame as pg
+
+# Cores candidatas a colorkey (a primeira ausente nos pixels opacos do sprite é usada)
+COLORKEY_CANDIDATES = [(255, 0, 255), (0, 255, 1), (1, 2, 3), (254, 1, 253)]
+
+
+def alpha_kind(surface):
+    """Classifica o alpha do sprite: 'opaque', 'binary' (só 0 e 255) ou 'partial'"""
+    if not surface.get_flags() & pg.SRCALPHA:
+        return 'opaque'
+    visible = pg.mask.from_surface(surface, 0).count()      # alpha > 0
+    solid = pg.mask.from_surface(surface, 254).count()      # alpha == 255
+    if solid == surface.get_width() * surface.get_height():
+        return 'opaque'
+    if visible == solid:
+        return 'binary'
+    return 'partial'
+
+
+def _free_colorkey(surface):
+    """Primeira cor candidata que não aparece em nenhum pixel opaco (None se todas aparecem)"""
+    for color in COLORKEY_CANDIDATES:
+        # Pixels opacos com exatamente essa cor (diferença de alpha < 255 exclui os transparentes)
+        matches = pg.mask.from_threshold(surface, color + (255,), (1, 1, 1, 255))
+        if matches.count() == 0:
+            return color
+    return None
+
+
+def prepare_surface(surface):
+    """Retorna o sprite no formato do display, pronto para blits rápidos
+
+    Requer a janela já criada. Sprites opacos viram superfícies sem alpha;
+    sprites com alpha só 0/255 (todos os do jogo) viram superfícies com
+    colorkey e aceleração RLE, bem mais rápidas que alpha por pixel; alpha
+    parcial usa convert_alpha. O resultado do blit é idêntico ao do sprite
+    original.
+    """
+    kind = alpha_kind(surface)
+    if kind == 'opaque':
+        return surface.convert()
+    if kind == 'binary':
+        key = _free_colorkey(surface)
+        if key is not None:
+            prepared = pg.Surface(surface.get_size()).convert()
+            prepared.fill(key)
+            prepared.blit(surface, (0, 0))
+            prepared.set_colorkey(key, pg.RLEACCEL)
+            return prepared
+    return surface.convert_alpha()
@@ -0,0 +1,97 @@
+"""
+Camadas pré-renderizadas do tabuleiro do Pac-Man
+Fundo estático do labirinto e camada de pontos atualizada incrementalmente
+"""
+
+import pygame as pg
+from .constants import WALL, DOT, POWER_PELLET, EMPTY, BLACK, BLUE, WHITE
+
+
+class BoardRenderer:
+    """Cache do tabuleiro desenhado para uma escala
+
+    As paredes e corredores não mudam durante um nível, então são desenhados
+    uma única vez numa superfície de fundo do tamanho da janela (cache por
+    layout do labirinto). Sobre uma cópia desse fundo ficam os pontos e power
+    pellets; quando um é coletado, apenas o retângulo dele é restaurado a
+    partir do fundo. A cada frame o tabuleiro vira um único blit.
+    """
+
+    def __init__(self, scale, window):
+        """Prepara o cache para a escala e o formato de pixels da janela"""
+        self.scale = scale
+        self.window = window
+        self._backgrounds = {}
+
+        # Camada fundo + pontos e o índice de pontos que ela representa
+        self.surface = None
+        self._dot_index = None
+        self._drawn_dots = {}  # tile -> retângulo desenhado
+
+        # O que mudou na última chamada de update (para a renderização por retângulos sujos)
+        self.rebuilt = False
+        self.changed_rects = []
+
+    @staticmethod
+    def _layout_key(game_map):
+        """Chave do layout: pontos coletados não alteram o fundo"""
+        return tuple(''.join(EMPTY if cell in (DOT, POWER_PELLET) else cell for cell in row)
+                     for row in game_map)
+
+    def background(self, game_map):
+        """Retorna o fundo do labirinto, desenhando-o apenas na primeira vez"""
+        key = self._layout_key(game_map)
+        if key not in self._backgrounds:
+            self._backgrounds[key] = self._draw_background(game_map)
+        return self._backgrounds[key]
+
+    def _draw_background(self, game_map):
+        """Desenha paredes e corredores (mesma ordem do desenho original)"""
+        scale = self.scale
+        surface = pg.Surface(self.window.get_size(), 0, self.window)
+        surface.fill(BLACK)
+        for y in range(len(game_map)):
+            for x in range(len(game_map[0])):
+                if game_map[y][x] == WALL:
+                    pg.draw.rect(surface, BLUE, (x * scale, y * scale, scale, scale))
+                if game_map[y][x] == EMPTY or game_map[y][x] == DOT or game_map[y][x] == POWER_PELLET:
+                    pg.draw.rect(surface, BLACK, ((x * scale) - (scale / 2), (y * scale) - (scale / 2), scale * 1.5, scale * 1.5))
+        return surface
+
+    def _draw_dot(self, tile, cell):
+        """Desenha um ponto ou power pellet e retorna o retângulo afetado"""
+        scale = self.scale
+        x, y = tile
+        center = ((x * scale) + (scale / 4), (y * scale) + (scale / 4))
+        radius = scale / 5 if cell == DOT else scale / 2
+        return pg.draw.circle(self.surface, WHITE, center, radius)
+
+    def update(self, game_map, dot_index):
+        """Sincroniza a camada de pontos com o índice e retorna a superfície do tabuleiro
+
+        Um novo índice (nível carregado ou reiniciado) redesenha a camada a
+        partir do fundo; caso contrário apenas os pontos coletados desde o
+        último frame são apagados. Os retângulos apagados ficam em
+        changed_rects e rebuilt indica que a camada inteira foi redesenhada.
+        """
+        self.rebuilt = False
+        self.changed_rects = []
+        if dot_index is not self._dot_index:
+            background = self.background(game_map)
+            self.surface = background.copy()
+            self._drawn_dots = {}
+            for y in range(len(game_map)):
+                for x in range(len(game_map[0])):
+                    if game_map[y][x] == DOT or game_map[y][x] == POWER_PELLET:
+                        self._drawn_dots[(x, y)] = self._draw_dot((x, y), game_map[y][x])
+            self._dot_index = dot_index
+            self.rebuilt = True
+        elif len(self._drawn_dots) != dot_index.remaining:
+            background = self.background(game_map)
+            eaten = [tile for tile in self._drawn_dots
+                     if tile not in dot_index.dots and tile not in dot_index.power_pellets]
+            for tile in eaten:
+                rect = self._drawn_dots.pop(tile)
+                self.surface.blit(background, rect, rect)
+                self.changed_rects.append(rect)
+        return self.surface
@@ -0,0 +1,229 @@
+"""
+Sistema de colisão do Pac-Man
+Grade de ocupação de paredes/túneis pré-calculada a partir do mapa
+"""
+
+from array import array
+
+from .constants import WALL, TUNNEL, SUBSTEPS, WALL_BOX_START, WALL_BOX_END
+from .table_cache import load_tables, save_tables
+
+# Cache por layout de paredes e túneis: reinícios e novos níveis reaproveitam
+_grid_cache = {}
+_turn_table_cache = {}
+
+
+class CollisionGrid:
+    """Grade de ocupação construída uma vez quando o mapa é carregado
+
+    As posições são o centro do agente em passos inteiros de 1/16 de tile,
+    independentes da escala da tela. Cada parede ocupa uma caixa inflada
+    [x * 16 + WALL_BOX_START, x * 16 + WALL_BOX_END] em cada eixo (mesma
+    geometria usada originalmente no collider), então um ponto só pode estar
+    dentro das caixas de no máximo duas colunas e duas linhas vizinhas.
+    """
+
+    def __init__(self, game_map):
+        """Constrói a grade de ocupação a partir do mapa"""
+        self.height = len(game_map)
+        self.width = len(game_map[0]) if self.height > 0 else 0
+
+        # Ocupação: paredes e túneis bloqueiam o movimento
+        self.walls = [[cell == WALL for cell in row] for row in game_map]
+        self.solid = [
+            [cell == WALL or cell == TUNNEL for cell in row]
+            for row in game_map
+        ]
+
+    @classmethod
+    def for_map(cls, game_map):
+        """Retorna a grade do mapa, reaproveitando a construída para o mesmo layout"""
+        key = tuple(''.join('#' if cell == WALL else '=' if cell == TUNNEL else ' ' for cell in row)
+                    for row in game_map)
+        if key not in _grid_cache:
+            _grid_cache[key] = cls(game_map)
+        return _grid_cache[key]
+
+    @staticmethod
+    def covering_range(coordinate):
+        """Retorna o primeiro e o último tile cujas caixas contêm a coordenada"""
+        first = (coordinate - WALL_BOX_END + SUBSTEPS - 1) // SUBSTEPS
+        last = (coordinate - WALL_BOX_START) // SUBSTEPS
+        return first, last
+
+    def hits(self, x, y, include_tunnel=True):
+        """Retorna as células sólidas (índice linear y * largura + x) que contêm o ponto
+
+        A lista vem em ordem de varredura do mapa (linha a linha). Com
+        include_tunnel=False apenas paredes são consideradas.
+        """
+        first_column, last_column = self.covering_range(x)
+        first_column = max(first_column, 0)
+        last_column = min(last_column, self.width - 1)
+        if first_column > last_column:
+            return []
+        first_row, last_row = self.covering_range(y)
+        occupancy = self.solid if include_tunnel else self.walls
+        hit_cells = []
+        for row in range(max(first_row, 0), min(last_row, self.height - 1) + 1):
+            occupied_row = occupancy[row]
+            for column in range(first_column, last_column + 1):
+                if occupied_row[column]:
+                    hit_cells.append(row * self.width + column)
+        return hit_cells
+
+    def point_collides(self, x, y, include_tunnel=True):
+        """Verifica se um ponto (centro do agente) está dentro de alguma caixa de parede"""
+        return bool(self.hits(x, y, include_tunnel))
+
+    def agent_collides(self, position, direction=(0, 0), include_tunnel=True):
+        """Verifica se a caixa do agente, após um passo em direction, toca alguma parede
+
+        Testar o centro contra as caixas infladas equivale a testar a caixa
+        do agente contra os tiles de parede.
+        """
+        return self.point_collides(position[0] + direction[0], position[1] + direction[1], include_tunnel)
+
+    def move(self, position, direction):
+        """Move o agente e desfaz o passo para cada parede atingida
+
+        Reproduz exatamente a varredura original: as células são visitadas em
+        ordem de linha e, a cada parede atingida, o passo é desfeito e as
+        células seguintes passam a ser testadas com a posição já corrigida.
+        """
+        position[0] += direction[0]
+        position[1] += direction[1]
+        last_cell = -1
+        while True:
+            next_cell = None
+            for cell in self.hits(position[0], position[1]):
+                if cell > last_cell:
+                    next_cell = cell
+                    break
+            if next_cell is None:
+                return position
+            position[0] -= direction[0]
+            position[1] -= direction[1]
+            last_cell = next_cell
+
+
+# Índices das direções na tabela de curvas
+TURN_RIGHT = 0
+TURN_DOWN = 1
+TURN_LEFT = 2
+TURN_UP = 3
+
+# Deslocamento (em tiles) de cada direção
+TURN_OFFSETS = {
+    TURN_RIGHT: (1, 0),
+    TURN_DOWN: (0, 1),
+    TURN_LEFT: (-1, 0),
+    TURN_UP: (0, -1),
+}
+
+# Vetor de direção (um passo por frame) -> índice na tabela
+TURN_DIRECTIONS = {offset: turn for turn, offset in TURN_OFFSETS.items()}
+
+# Segmento de cada passo dentro do tile: 0 enquanto a caixa do tile anterior
+# ainda cobre o centro, 2 quando a do próximo tile já cobre, 1 entre os dois
+SUBSTEP_SEGMENTS = [
+    0 if step <= WALL_BOX_END - SUBSTEPS else 2 if step >= SUBSTEPS + WALL_BOX_START else 1
+    for step in range(SUBSTEPS)
+]
+
+
+class TurnTable:
+    """Tabela de curvas permitidas por tile, posição sub-tile e direção
+
+    Dentro de um tile, o conjunto de caixas de parede que cobrem o centro do
+    agente só muda em dois pontos de cada eixo (fim da caixa do tile anterior
+    e início da caixa do próximo). Cada eixo tem então 3 segmentos e cada
+    tile 3x3 posições sub-tile distintas. Para cada uma delas guardamos uma
+    máscara de 4 bits dizendo se o agente pode virar para a direita, baixo,
+    esquerda ou cima (teste um tile à frente, como no turning_corner).
+    """
+
+    # Margem de tiles fora do mapa (túneis e sondagem um tile à frente)
+    PADDING = 4
+    TABLE_VERSION = 1  # Incrementar ao mudar o cálculo (invalida o cache em disco)
+
+    def __init__(self, grid, masks=None):
+        """Pré-calcula a tabela a partir da grade de colisão (ou usa masks já calculadas)"""
+        self.grid = grid
+        self.padded_width = grid.width + 2 * self.PADDING
+        self.padded_height = grid.height + 2 * self.PADDING
+
+        if masks is not None and len(masks) == self.padded_width * self.padded_height * 9:
+            self.masks = masks
+            return
+
+        blocked = self._build_blocked_table()
+        self.masks = [0] * len(blocked)
+        for ty in range(-self.PADDING + 1, grid.height + self.PADDING - 1):
+            for tx in range(-self.PADDING + 1, grid.width + self.PADDING - 1):
+                base = self._tile_index(tx, ty) * 9
+                for segment in range(9):
+                    mask = 0
+                    for turn, (dx, dy) in TURN_OFFSETS.items():
+                        if not blocked[self._tile_index(tx + dx, ty + dy) * 9 + segment]:
+                            mask |= 1 << turn
+                    self.masks[base + segment] = mask
+
+    @classmethod
+    def for_grid(cls, grid):
+        """Retorna a tabela da grade, calculada uma única vez por grade
+
+        Fora do cache da execução, as máscaras são lidas do cache em disco
+        (chave: sha1 das células sólidas e da geometria das caixas); só na
+        primeira execução com um layout novo a tabela é calculada e gravada.
+        """
+        if grid not in _turn_table_cache:
+            disk_key = (*(''.join('#' if solid else ' ' for solid in row) for row in grid.solid),
+                        SUBSTEPS, WALL_BOX_START, WALL_BOX_END, cls.PADDING, cls.TABLE_VERSION)
+            tables = load_tables("turns", disk_key, "B")
+            masks = tables[0].tolist() if tables else None
+            table = cls(grid, masks)
+            if table.masks is not masks:  # Calculada agora
+                save_tables("turns", disk_key, [array('B', table.masks)])
+            _turn_table_cache[grid] = table
+        return _turn_table_cache[grid]
+
+    def _tile_index(self, tx, ty):
+        """Índice do tile na tabela com margem"""
+        return (ty + self.PADDING) * self.padded_width + (tx + self.PADDING)
+
+    def _build_blocked_table(self):
+        """Marca, para cada tile e segmento, se o centro do agente colide"""
+        grid = self.grid
+        blocked = [False] * (self.padded_width * self.padded_height * 9)
+        for ty in range(-self.PADDING, grid.height + self.PADDING):
+            for tx in range(-self.PADDING, grid.width + self.PADDING):
+                base = self._tile_index(tx, ty) * 9
+                for sy in range(3):
+                    rows = [ty + d for d in (-1, 0, 1) if (d == -1 and sy == 0) or d == 0 or (d == 1 and sy == 2)]
+                    for sx in range(3):
+                        columns = [tx + d for d in (-1, 0, 1) if (d == -1 and sx == 0) or d == 0 or (d == 1 and sx == 2)]
+                        blocked[base + sy * 3 + sx] = any(
+                            0 <= y < grid.height and 0 <= x < grid.width and grid.solid[y][x]
+                            for y in rows for x in columns
+                        )
+        return blocked
+
+    def allowed_turns(self, position):
+        """Retorna a máscara de curvas permitidas a partir da posição do agente"""
+        tx, sx = divmod(position[0], SUBSTEPS)
+        ty, sy = divmod(position[1], SUBSTEPS)
+        if not (-self.PADDING < tx < self.grid.width + self.PADDING - 1 and
+                -self.PADDING < ty < self.grid.height + self.PADDING - 1):
+            return None
+        return self.masks[self._tile_index(tx, ty) * 9 + SUBSTEP_SEGMENTS[sy] * 3 + SUBSTEP_SEGMENTS[sx]]
+
+    def can_turn(self, position, next_direction):
+        """Verifica se o agente pode seguir next_direction a partir da posição"""
+        turn = TURN_DIRECTIONS.get((next_direction[0], next_direction[1]))
+        mask = self.allowed_turns(position) if turn is not None else None
+        if mask is None:
+            # Direção fora do padrão ou agente fora da tabela: consulta direta
+            return not self.grid.point_collides(position[0] + next_direction[0] * SUBSTEPS,
+                                                position[1] + next_direction[1] * SUBSTEPS)
+        return bool(mask & (1 << turn))
@@ -29,12 +29,28 @@ PLAYING = 1
 FAILED = 2
 WON = 3
 
-# Direções como vetores [x, y]
+# Transições entre estados (em segundos, sem bloquear o loop principal)
+START_COUNTDOWN = 3        # Contagem regressiva antes de iniciar a partida
+COUNTDOWN_GO_TIME = 0.5    # Tempo do "GO" no fim da contagem e após renascer
+LEVEL_CLEAR_TIME = 2.0     # Pausa ao limpar o nível, antes do "GO"
+
+# Sistema de coordenadas em ponto fixo
+# Posições dos agentes são inteiros em passos de 1/16 de tile (tile * 16 + passo)
+# e marcam o centro do agente; a conversão para pixels só ocorre ao desenhar.
+SUBSTEPS = 16
+AGENT_CENTER_OFFSET = 10.4  # Centro do sprite (0.65 tile) em passos
+
+# Caixa de colisão de uma parede no tile x, para o centro do agente:
+# [x * 16 + WALL_BOX_START, x * 16 + WALL_BOX_END] (inflada de -0.65 a +1.2 tile)
+WALL_BOX_START = -10
+WALL_BOX_END = 19
+
+# Direções como vetores [x, y] (em passos por frame)
 DIRECTIONS = {
-    'right': [SCALE/16, 0],
-    'down': [0, SCALE/16],
-    'left': [-SCALE/16, 0],
-    'up': [0, -SCALE/16]
+    'right': [1, 0],
+    'down': [0, 1],
+    'left': [-1, 0],
+    'up': [0, -1]
 }
 
 # Tipos de célula do mapa (baseado no arquivo de referência)
@@ -79,19 +95,36 @@ GAME_MAP = [
     ['#','#','#','#','#','#','#','#','#','#','#','#','#','#','#','#','#','#','#','#','#','#','#','#','#','#','#','#']
 ]
 
-# Posições iniciais (baseadas no arquivo de referência)
-PACMAN_START_POS = [SCALE * 13.1, SCALE * 22.6]
-PACMAN_START_DIR = [SCALE/16, 0]
+# Posições iniciais (centro do agente em passos de 1/16 de tile)
+PACMAN_START_POS = [13 * SUBSTEPS + 12, 23 * SUBSTEPS + 4]
+PACMAN_2_START_POS = [12 * SUBSTEPS + 12, 23 * SUBSTEPS + 4]  # Player 2 - à esquerda
+PACMAN_3_START_POS = [14 * SUBSTEPS + 12, 23 * SUBSTEPS + 4]  # Player 3 - à direita
+PACMAN_START_DIR = [1, 0]
+
+# Posições iniciais dos fantasmas (dentro da casa)
+GHOST_BLUE_POS = [12 * SUBSTEPS + 10, 13 * SUBSTEPS + 10]
+GHOST_ORANGE_POS = [12 * SUBSTEPS + 10, 15 * SUBSTEPS + 2]
+GHOST_PINK_POS = [14 * SUBSTEPS + 10, 13 * SUBSTEPS + 10]
+GHOST_RED_POS = [14 * SUBSTEPS + 10, 15 * SUBSTEPS + 2]
+
+# Posição onde os fantasmas entram no labirinto ao sair da casa
+GHOST_EXIT_POS = [13 * SUBSTEPS + 12, 11 * SUBSTEPS + 4]
 
-# Posições iniciais dos fantasmas
-GHOST_BLUE_POS = [SCALE * 12, SCALE * 13]
-GHOST_ORANGE_POS = [SCALE * 12, SCALE * 14.5]
-GHOST_PINK_POS = [SCALE * 14, SCALE * 13]
-GHOST_RED_POS = [SCALE * 14, SCALE * 14.5]
+# Túnel lateral: limites do centro do agente e posição após atravessar
+TUNNEL_RIGHT_EDGE = 451
+TUNNEL_LEFT_EDGE = -11
+TUNNEL_RIGHT_ENTRY = 450
+TUNNEL_LEFT_ENTRY = -10
 
 # Pontuação
 DOT_POINTS = 1
 POWER_PELLET_POINTS = 5
+
+# Alcance de coleta (em passos, a partir do canto do tile) para o centro do Pacman
+DOT_HIT_START = 1
+DOT_HIT_END = 7
+POWER_PELLET_HIT_START = -4
+POWER_PELLET_HIT_END = 12
 GHOST_POINTS = 10
 
 # Tipos de frutas
@@ -127,6 +160,81 @@ FRUIT_POSITIONS = [
     (19, 15),  # Corredor direito inferior
 ]
 
-# Configurações de colisão
-COLLISION_DISTANCE = SCALE * 0.8  # Reduzido para colisão mais precisa
-HUNT_DISTANCE = SCALE * 10
+# Motor de movimento vetorizado (requer numpy; útil com muitos agentes)
+BATCHED_MOVEMENT = False
+
+# Variante direcional do sprite (rotação do Pacman, olhar do fantasma), indexada
+# por [dx + 1][dy + 1] (0: original/direita, 1: baixo, 2: esquerda, 3: cima)
+SPRITE_DIRECTION_INDEX = [
+    [0, 2, 0],
+    [3, 0, 1],
+    [0, 0, 0],
+]
+
+# Animações como dados: passos (último sprite_frame do passo, quadro do sprite)
+PACMAN_ALIVE_ANIMATION = [(12, 1), (18, 2), (24, 3), (30, 4), (36, 5), (42, 4), (48, 3), (54, 2), (60, 1)]
+PACMAN_DEATH_ANIMATION = [(5, 6), (10, 7), (15, 8), (20, 9), (25, 10), (30, 11),
+                          (35, 12), (40, 13), (45, 14), (50, 15), (55, 16), (60, 17)]
+GHOST_ANIMATION = [(15, 0), (30, 1), (45, 0), (60, 1)]
+
+# Cache em disco dos sprites redimensionados e coloridos (um arquivo por escala
+# em PACMAN_CACHE_DIR ou ~/.cache/pacman)
+SPRITE_CACHE = True
+# Versão da coloração dos sprites na chave do cache: incrementar ao mudar
+# _colorize_sprite para descartar os sprites coloridos já gravados
+SPRITE_PROCESS_VERSION = 1
+
+# Cache em disco das tabelas do labirinto (distâncias e curvas), no mesmo
+# diretório do cache de sprites e com chave pelo sha1 do layout de paredes
+TABLE_CACHE = True
+
+# Escala lógica de renderização: com um valor (ex.: 8) o jogo é desenhado nessa
+# escala fora da tela e ampliado para a janela, que pode ser redimensionada;
+# None desenha direto na resolução da janela
+RENDER_SCALE = None
+RENDER_SMOOTH = False  # smoothscale em vez de ampliação por vizinho mais próximo
+
+# Tempo máximo (ms) que o menu fica bloqueado esperando eventos quando ocioso
+MENU_IDLE_TIMEOUT = 500
+
+# Máximo de textos renderizados mantidos em cache (placar e status dos controles)
+TEXT_CACHE_SIZE = 64
+
+# Renderização por retângulos sujos: redesenha e envia ao display apenas as
+# áreas que mudaram (sprites, frutas, pontos coletados e textos do placar).
+# Desligado, cada frame é desenhado e enviado inteiro
+DIRTY_RECT_RENDERING = False
+
+# Loop de passo fixo: a lógica roda sempre a LOGIC_RATE passos por segundo,
+# independente da taxa de renderização; um frame atrasado executa no máximo
+# MAX_CATCH_UP_STEPS passos e o atraso restante é descartado
+LOGIC_RATE = FPS
+MAX_CATCH_UP_STEPS = 5
+MAX_RENDER_FPS = 240  # Limite de frames desenhados por segundo (0 = sem limite)
+INTERPOLATE_POSITIONS = True  # Desenhar agentes entre os dois últimos passos da lógica
+
+# Ritmo adaptativo: quando a volta média do loop passa do tempo de um passo da
+# lógica por PACING_WINDOW voltas, o trabalho opcional é reduzido um nível por
+# vez, na ordem abaixo; é restaurado quando o trabalho cai para menos de
+# PACING_RECOVERY do passo. A lógica nunca é afetada.
+ADAPTIVE_PACING = True
+PACING_WINDOW = 30
+PACING_RECOVERY = 0.5
+PACING_SKIP_HUD = 1                # Placar atualizado só a cada PACING_HUD_INTERVAL voltas
+PACING_SKIP_CONTROLLER_PANEL = 2   # Painel de status dos controles oculto
+PACING_REDUCE_ANIMATION = 3        # Quadro de animação trocado só a cada PACING_ANIMATION_INTERVAL voltas
+PACING_SKIP_FRAMES = 4             # Desenha uma a cada PACING_FRAME_SKIP voltas
+PACING_HUD_INTERVAL = 15
+PACING_ANIMATION_INTERVAL = 4
+PACING_FRAME_SKIP = 2
+
+# Profiler de frames (python main.py --profile arquivo.csv ou PACMAN_PROFILE):
+# etapas medidas, na ordem do frame, e quantos frames recentes são guardados
+PROFILER_STAGES = ["input", "board", "fruits", "player", "ghost", "collection",
+                   "ghost_manager", "collision", "hud", "present"]
+PROFILER_FRAMES = 3600
+PROFILER_DUMP_KEY = 'f12'  # Salva o arquivo do profiler durante o jogo
+
+# Configurações de colisão (em passos de 1/16 de tile)
+COLLISION_DISTANCE = 12  # Distância máxima entre centros (2 * 0.4 tile)
+HUNT_DISTANCE = SUBSTEPS * 10
@@ -42,16 +42,59 @@ class ControllerButton(Enum):
     DPAD_RIGHT = "dpad_right"
 
 
+class ControllerState:
+    """Estado compacto de um controle, atualizado apenas quando chegam eventos
+
+    Guarda o joystick aberto, seu tipo e nome (lidos uma vez na conexão), o
+    valor do hat principal, os eixos, os botões pressionados como máscara
+    de bits e a direção de movimento já resolvida, que é o que o jogo
+    consulta a cada frame.
+    """
+    
+    __slots__ = ('joystick', 'instance_id', 'type', 'name', 'hat', 'axes', 'buttons', 'direction')
+    
+    def __init__(self, joystick: pg.joystick.Joystick, controller_type: ControllerType):
+        """Abre o estado do controle lendo seus valores atuais uma única vez"""
+        self.joystick = joystick
+        self.instance_id = joystick.get_instance_id()
+        self.type = controller_type
+        self.name = joystick.get_name()
+        self.hat = joystick.get_hat(0) if joystick.get_numhats() else (0, 0)
+        self.axes = [joystick.get_axis(axis) for axis in range(joystick.get_numaxes())]
+        self.buttons = 0
+        for button in range(joystick.get_numbuttons()):
+            if joystick.get_button(button):
+                self.buttons |= 1 << button
+        self.direction = ""
+
+
 class ControllerManager:
-    """Gerenciador de controles para o jogo Pac-Man"""
+    """Gerenciador de controles para o jogo Pac-Man
+    
+    Orientado a eventos: handle_event recebe os eventos de joystick do pygame
+    (movimento de hat e eixos, botões, conexão e desconexão) e atualiza o
+    ControllerState do dispositivo correspondente. As consultas do jogo a
+    cada frame só leem esse estado, sem chamar o driver do joystick, e a
+    conexão de um controle abre apenas aquele dispositivo.
+    """
+    
+    EVENT_TYPES = (pg.JOYAXISMOTION, pg.JOYHATMOTION, pg.JOYBUTTONDOWN, pg.JOYBUTTONUP,
+                   pg.JOYDEVICEADDED, pg.JOYDEVICEREMOVED)
     
     def __init__(self):
         """Inicializa o gerenciador de controles"""
-        self.controllers: List[pg.joystick.Joystick] = []
-        self.controller_types: List[ControllerType] = []
+        self.controllers: List[ControllerState] = []
         self.deadzone = 0.3  # Zona morta para analógicos
         self.button_mappings = self._create_button_mappings()
         
+        # Botão físico -> botão mapeado, por tipo de controle (para eventos de botão)
+        button_values = {button.value for button in ControllerButton}
+        self.button_names = {
+            controller_type: {button_id: ControllerButton(name) for name, button_id in mapping.items()
+                              if name in button_values and isinstance(button_id, int)}
+            for controller_type, mapping in self.button_mappings.items()
+        }
+        
         # Inicializar pygame.joystick
         pg.joystick.init()
         
@@ -77,8 +120,8 @@ class ControllerManager:
                 # D-pad (hat)
                 'dpad_up': (0, 1),
                 'dpad_down': (0, -1),
-                'dpad_left': (0, -1),
-                'dpad_right': (0, 1),
+                'dpad_left': (-1, 0),
+                'dpad_right': (1, 0),
                 
                 # Analógicos
                 'left_stick_x': 0,
@@ -104,8 +147,8 @@ class ControllerManager:
                 # D-pad
                 'dpad_up': (0, 1),
                 'dpad_down': (0, -1),
-                'dpad_left': (0, -1),
-                'dpad_right': (0, 1),
+                'dpad_left': (-1, 0),
+                'dpad_right': (1, 0),
                 
                 # Analógicos
                 'left_stick_x': 0,
@@ -118,27 +161,76 @@ class ControllerManager:
         }
     
     def _detect_controllers(self):
-        """Detecta controles conectados e identifica seus tipos"""
+        """Detecta os controles já conectados (depois disso, só por eventos)"""
         self.controllers.clear()
-        self.controller_types.clear()
+        for i in range(pg.joystick.get_count()):
+            self._add_controller(i)
+    
+    def _add_controller(self, device_index: int) -> Optional[ControllerState]:
+        """Abre o controle no índice do dispositivo, se ainda não estiver aberto"""
+        try:
+            controller = pg.joystick.Joystick(device_index)
+            controller.init()
+            if self._find(controller.get_instance_id()) is not None:
+                return None  # Já conhecido (SDL também anuncia os presentes ao iniciar)
+            
+            # Identificar tipo do controle
+            state = ControllerState(controller, self._identify_controller_type(controller))
+            self._update_direction(state)
+            self.controllers.append(state)
+            return state
+        except pg.error:
+            # Erro ao inicializar controle - continuar com outros
+            return None
+    
+    def _find(self, instance_id: int) -> Optional[int]:
+        """Índice do controle com o id de instância do SDL (None se desconhecido)"""
+        for index, state in enumerate(self.controllers):
+            if state.instance_id == instance_id:
+                return index
+        return None
+    
+    def sync(self):
+        """Relê os controles conectados (após telas que consumiram a fila de eventos)"""
+        self._detect_controllers()
+    
+    def handle_event(self, event) -> Optional[Tuple[int, ControllerButton]]:
+        """Atualiza o estado com um evento de joystick
         
-        num_joysticks = pg.joystick.get_count()
+        Retorna (índice do controle, botão) quando um botão mapeado é
+        pressionado; None para os demais eventos.
+        """
+        if event.type == pg.JOYDEVICEADDED:
+            self._add_controller(event.device_index)
+            return None
+        
+        index = self._find(event.instance_id)
+        if index is None:
+            return None
+        state = self.controllers[index]
         
-        for i in range(num_joysticks):
+        if event.type == pg.JOYDEVICEREMOVED:
+            del self.controllers[index]
             try:
-                controller = pg.joystick.Joystick(i)
-                controller.init()
-                self.controllers.append(controller)
-                
-                # Identificar tipo do controle
-                controller_type = self._identify_controller_type(controller)
-                self.controller_types.append(controller_type)
-                
-                # Controle detectado e inicializado
-                
-            except Exception:
-                # Erro ao inicializar controle - continuar com outros
+                state.joystick.quit()
+            except pg.error:
                 pass
+        elif event.type == pg.JOYHATMOTION:
+            if event.hat == 0:
+                state.hat = event.value
+                self._update_direction(state)
+        elif event.type == pg.JOYAXISMOTION:
+            if event.axis < len(state.axes):
+                state.axes[event.axis] = event.value
+                self._update_direction(state)
+        elif event.type == pg.JOYBUTTONDOWN:
+            state.buttons |= 1 << event.button
+            button = self.button_names[state.type].get(event.button)
+            if button is not None:
+                return index, button
+        elif event.type == pg.JOYBUTTONUP:
+            state.buttons &= ~(1 << event.button)
+        return None
     
     def _identify_controller_type(self, controller: pg.joystick.Joystick) -> ControllerType:
         """Identifica o tipo do controle baseado no nome"""
@@ -167,13 +259,13 @@ class ControllerManager:
     def get_controller_name(self, index: int = 0) -> str:
         """Retorna o nome do controle"""
         if self.is_controller_connected(index):
-            return self.controllers[index].get_name()
+            return self.controllers[index].name
         return "Nenhum controle conectado"
     
     def get_controller_type(self, index: int = 0) -> ControllerType:
         """Retorna o tipo do controle"""
         if self.is_controller_connected(index):
-            return self.controller_types[index]
+            return self.controllers[index].type
         return ControllerType.UNKNOWN
     
     def get_button_pressed(self, button: ControllerButton, controller_index: int = 0) -> bool:
@@ -181,77 +273,72 @@ class ControllerManager:
         if not self.is_controller_connected(controller_index):
             return False
         
-        controller = self.controllers[controller_index]
-        controller_type = self.controller_types[controller_index]
-        
+        state = self.controllers[controller_index]
         try:
             if button.value in ['dpad_up', 'dpad_down', 'dpad_left', 'dpad_right']:
                 # D-pad
-                hat_value = controller.get_hat(0)
-                dpad_mapping = self.button_mappings[controller_type][button.value]
-                return hat_value == dpad_mapping
+                return state.hat == self.button_mappings[state.type][button.value]
             else:
                 # Botões normais
-                button_id = self.button_mappings[controller_type][button.value]
-                return controller.get_button(button_id)
-        except (IndexError, KeyError):
+                button_id = self.button_mappings[state.type][button.value]
+                return bool(state.buttons & (1 << button_id))
+        except KeyError:
             return False
     
-    def get_analog_input(self, axis: str, controller_index: int = 0) -> float:
-        """Retorna o valor do analógico (entre -1.0 e 1.0)"""
-        if not self.is_controller_connected(controller_index):
+    def _axis_value(self, state: ControllerState, axis: str) -> float:
+        """Valor do eixo no estado do controle, com zona morta aplicada"""
+        axis_id = self.button_mappings[state.type].get(axis)
+        if axis_id is None or axis_id >= len(state.axes):
             return 0.0
+        value = state.axes[axis_id]
         
-        controller = self.controllers[controller_index]
-        controller_type = self.controller_types[controller_index]
-        
-        try:
-            axis_id = self.button_mappings[controller_type][axis]
-            value = controller.get_axis(axis_id)
-            
-            # Aplicar zona morta
-            if abs(value) < self.deadzone:
-                return 0.0
-            
-            return value
-        except (IndexError, KeyError):
+        # Aplicar zona morta
+        if abs(value) < self.deadzone:
             return 0.0
+        return value
     
-    def get_movement_input(self, controller_index: int = 0) -> Tuple[str, bool]:
-        """
-        Retorna o input de movimento do controle
-        Retorna: (direção, se há input)
-        """
+    def get_analog_input(self, axis: str, controller_index: int = 0) -> float:
+        """Retorna o valor do analógico (entre -1.0 e 1.0)"""
         if not self.is_controller_connected(controller_index):
-            return "", False
+            return 0.0
+        return self._axis_value(self.controllers[controller_index], axis)
+    
+    def _update_direction(self, state: ControllerState):
+        """Resolve a direção de movimento a partir do hat e do analógico esquerdo"""
+        mapping = self.button_mappings[state.type]
         
         # Verificar D-pad primeiro
-        if self.get_button_pressed(ControllerButton.DPAD_UP, controller_index):
-            return "up", True
-        elif self.get_button_pressed(ControllerButton.DPAD_DOWN, controller_index):
-            return "down", True
-        elif self.get_button_pressed(ControllerButton.DPAD_LEFT, controller_index):
-            return "left", True
-        elif self.get_button_pressed(ControllerButton.DPAD_RIGHT, controller_index):
-            return "right", True
+        for direction in ("up", "down", "left", "right"):
+            if state.hat == mapping[f'dpad_{direction}']:
+                state.direction = direction
+                return
         
         # Verificar analógico esquerdo
-        left_x = self.get_analog_input('left_stick_x', controller_index)
-        left_y = self.get_analog_input('left_stick_y', controller_index)
+        left_x = self._axis_value(state, 'left_stick_x')
+        left_y = self._axis_value(state, 'left_stick_y')
         
         # Determinar direção baseada no analógico
+        state.direction = ""
         if abs(left_x) > abs(left_y):
             if left_x > 0.5:
-                return "right", True
+                state.direction = "right"
             elif left_x < -0.5:
-                return "left", True
+                state.direction = "left"
         else:
             if left_y > 0.5:
-                return "down", True
+                state.direction = "down"
             elif left_y < -0.5:
-                return "up", True
-        
-        return "", False
+                state.direction = "up"
+    
+    def get_movement_input(self, controller_index: int = 0) -> Tuple[str, bool]:
+        """
+        Retorna o input de movimento do controle
+        Retorna: (direção, se há input)
+        """
+        if not self.is_controller_connected(controller_index):
+            return "", False
+        direction = self.controllers[controller_index].direction
+        return direction, direction != ""
     
     def get_special_buttons(self, controller_index: int = 0) -> Dict[str, bool]:
         """Retorna o estado dos botões especiais"""
@@ -264,20 +351,12 @@ class ControllerManager:
             'action': self.get_button_pressed(ControllerButton.A, controller_index)
         }
     
-    def update(self):
-        """Atualiza o estado dos controles (chamar a cada frame)"""
-        # Verificar se novos controles foram conectados
-        current_count = pg.joystick.get_count()
-        if current_count != len(self.controllers):
-            self._detect_controllers()
-    
     def cleanup(self):
         """Limpa recursos dos controles"""
-        for controller in self.controllers:
+        for state in self.controllers:
             try:
-                controller.quit()
-            except:
+                state.joystick.quit()
+            except pg.error:
                 pass
         self.controllers.clear()
-        self.controller_types.clear()
         pg.joystick.quit()
@@ -0,0 +1,121 @@
+"""
+Alvo de renderização do Pac-Man
+Desenho direto na janela ou numa superfície de baixa resolução ampliada uma
+vez por frame
+"""
+
+import math
+import pygame as pg
+from .constants import BLACK
+
+
+class RenderTarget:
+    """Superfície onde o jogo desenha e sua apresentação na janela
+
+    Sem tamanho lógico, a superfície de desenho é a própria janela e
+    present() apenas atualiza o display. Com tamanho lógico, o jogo desenha
+    numa superfície fora da tela nessa resolução fixa; present() a amplia uma
+    única vez para a janela (redimensionável), mantendo a proporção com
+    faixas pretas nas bordas. O custo de desenho passa a depender da escala
+    lógica, não da resolução da janela. Com retângulos sujos e fator de
+    ampliação inteiro, apenas as regiões alteradas são ampliadas.
+    """
+
+    RESIZE_EVENTS = (pg.VIDEORESIZE, pg.WINDOWSIZECHANGED)
+
+    def __init__(self, window_size, logical_size=None, smooth=False):
+        """Cria a janela e, se houver tamanho lógico, a superfície fora da tela"""
+        self.offscreen = logical_size is not None
+        self.smooth = smooth
+        if self.offscreen:
+            self.display = pg.display.set_mode(window_size, pg.RESIZABLE)
+            self.surface = pg.Surface(logical_size, 0, self.display)
+        else:
+            self.display = pg.display.set_mode(window_size)
+            self.surface = self.display
+        self._layout()
+
+    def _layout(self):
+        """Calcula a área da janela ocupada pela imagem ampliada (proporção mantida)"""
+        self._full_present = True
+        if not self.offscreen:
+            return
+        display_width, display_height = self.display.get_size()
+        logical_width, logical_height = self.surface.get_size()
+        factor = min(display_width / logical_width, display_height / logical_height)
+        width = max(1, round(logical_width * factor))
+        height = max(1, round(logical_height * factor))
+        self.viewport = pg.Rect((display_width - width) // 2, (display_height - height) // 2, width, height)
+        self._target = self.display.subsurface(self.viewport)
+        self._factor_x = width / logical_width
+        self._factor_y = height / logical_height
+        
+        # Fator inteiro: cada pixel lógico vira um bloco exato na janela, então
+        # regiões podem ser ampliadas isoladamente com o mesmo resultado
+        self._integer_factor = None
+        if width % logical_width == 0 and height % logical_height == 0:
+            if width // logical_width == height // logical_height:
+                self._integer_factor = width // logical_width
+
+    def handle_event(self, event):
+        """Reage a redimensionamentos da janela; retorna True se o evento foi um deles"""
+        if event.type not in self.RESIZE_EVENTS:
+            return False
+        if self.offscreen:
+            self.display = pg.display.get_surface()
+            self._layout()
+        return True
+
+    def invalidate(self):
+        """Força a próxima apresentação a atualizar a janela inteira"""
+        self._full_present = True
+
+    def _to_display(self, rect):
+        """Converte um retângulo lógico na área da janela que ele afeta após a ampliação"""
+        # Margem de um pixel lógico cobre o arredondamento e a interpolação do smoothscale
+        margin_x = math.ceil(self._factor_x) + 1
+        margin_y = math.ceil(self._factor_y) + 1
+        left = self.viewport.x + math.floor(rect.left * self._factor_x) - margin_x
+        top = self.viewport.y + math.floor(rect.top * self._factor_y) - margin_y
+        right = self.viewport.x + math.ceil(rect.right * self._factor_x) + margin_x
+        bottom = self.viewport.y + math.ceil(rect.bottom * self._factor_y) + margin_y
+        return pg.Rect(left, top, right - left, bottom - top).clip(self.viewport)
+
+    def present(self, rects=None):
+        """Mostra o frame desenhado; rects (lógicos) limita a área enviada ao display"""
+        if not self.offscreen:
+            if rects is None:
+                pg.display.update()
+            else:
+                pg.display.update(rects)
+            return
+
+        if self._full_present:
+            self.display.fill(BLACK)
+            rects = None
+            self._full_present = False
+
+        if rects is not None and self._integer_factor and not self.smooth:
+            # Ampliar só as regiões alteradas (exato com fator inteiro e vizinho mais próximo)
+            factor = self._integer_factor
+            bounds = self.surface.get_rect()
+            display_rects = []
+            for rect in rects:
+                rect = rect.clip(bounds)
+                if rect.width and rect.height:
+                    target = pg.Rect(rect.x * factor, rect.y * factor, rect.width * factor, rect.height * factor)
+                    pg.transform.scale(self.surface.subsurface(rect), target.size, self._target.subsurface(target))
+                    display_rects.append(target.move(self.viewport.topleft))
+            pg.display.update(display_rects)
+            return
+
+        # Ampliação única do frame inteiro direto na área visível da janela
+        if self.smooth:
+            pg.transform.smoothscale(self.surface, self.viewport.size, self._target)
+        else:
+            pg.transform.scale(self.surface, self.viewport.size, self._target)
+
+        if rects is None:
+            pg.display.update()
+        else:
+            pg.display.update([self._to_display(rect) for rect in rects])
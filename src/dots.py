@@ -0,0 +1,36 @@
+"""
+Índice de pontos do Pac-Man
+Mantém os pontos e power pellets restantes sem varrer o mapa a cada frame
+"""
+
+from .constants import DOT, POWER_PELLET
+
+
+class DotIndex:
+    """Conjuntos de tiles com pontos restantes e contador de itens a coletar"""
+
+    def __init__(self, game_map):
+        """Constrói o índice a partir do mapa carregado"""
+        self.dots = set()
+        self.power_pellets = set()
+        for y, row in enumerate(game_map):
+            for x, cell in enumerate(row):
+                if cell == DOT:
+                    self.dots.add((x, y))
+                elif cell == POWER_PELLET:
+                    self.power_pellets.add((x, y))
+        self.remaining = len(self.dots) + len(self.power_pellets)
+
+    def remove_dot(self, tile):
+        """Remove um ponto coletado"""
+        self.dots.discard(tile)
+        self.remaining -= 1
+
+    def remove_power_pellet(self, tile):
+        """Remove um power pellet coletado"""
+        self.power_pellets.discard(tile)
+        self.remaining -= 1
+
+    def is_empty(self):
+        """Verifica se todos os pontos e power pellets foram coletados"""
+        return self.remaining == 0
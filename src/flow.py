@@ -0,0 +1,56 @@
+"""
+Fluxo da partida do Pac-Man
+Contagem regressiva, morte e fim de nível como estados do loop principal
+"""
+
+import math
+from .constants import STARTING, PLAYING, FAILED, WON, COUNTDOWN_GO_TIME
+
+
+class GameFlow:
+    """Máquina de estados das transições da partida
+
+    STARTING: contagem regressiva, com a lógica parada; PLAYING: jogo
+    normal; FAILED: animação de morte ou fim de jogo, com a lógica rodando
+    como sempre; WON: pausa depois de limpar o nível. Os estados
+    temporizados descontam o tempo real recebido em update() a cada volta do
+    loop, sem bloqueá-lo, então eventos e controles continuam sendo
+    processados durante as transições.
+    """
+
+    def __init__(self):
+        """Começa em jogo normal (run() entra na contagem ao iniciar)"""
+        self.state = PLAYING
+        self.remaining = 0.0
+
+    def enter(self, state, duration=0.0):
+        """Muda para o estado, que dura duration segundos se for temporizado"""
+        self.state = state
+        self.remaining = duration
+
+    @property
+    def simulating(self):
+        """Indica se a lógica do jogo avança no estado atual"""
+        return self.state in (PLAYING, FAILED)
+
+    def update(self, elapsed):
+        """Desconta o tempo decorrido e encerra os estados temporizados"""
+        if self.state not in (STARTING, WON):
+            return
+        self.remaining -= elapsed
+        if self.remaining > 0:
+            return
+        if self.state == WON:
+            self.enter(STARTING, COUNTDOWN_GO_TIME)  # Novo nível: "GO" antes de continuar
+        else:
+            self.enter(PLAYING)
+
+    def label(self):
+        """Texto sobreposto ao tabuleiro no estado atual (None quando não há)"""
+        if self.state == STARTING:
+            if self.remaining > COUNTDOWN_GO_TIME:
+                return str(math.ceil(self.remaining - COUNTDOWN_GO_TIME))
+            return "GO"
+        if self.state == WON:
+            return "LEVEL UP"
+        return None
@@ -4,371 +4,120 @@ Baseada na lógica do arquivo Pac_Man.py
 """
 
 import pygame as pg
-import random
 import os
-import math
-from collections import deque
+import time
 from .constants import *
-from .controller import ControllerManager, ControllerType
+from .controller import ControllerManager, ControllerButton
 from .menu import MenuSelector
-
-
-class ImprovedGhostAI:
-    """Classe com melhorias para a AI dos fantasmas"""
-    
-    def __init__(self, game_instance):
-        self.game = game_instance
-        self.ghost_states = {
-            'blue': {'mode': 'scatter', 'mode_timer': 0, 'target': None},
-            'orange': {'mode': 'chase', 'mode_timer': 60, 'target': None},
-            'pink': {'mode': 'ambush', 'mode_timer': 120, 'target': None},
-            'red': {'mode': 'aggressive', 'mode_timer': 180, 'target': None}
-        }
-        # Contadores para mudança de comportamento
-        self.behavior_cycle_timer = 0
-        
-        # Pontos de scatter (cantos do mapa) para cada fantasma
-        self.scatter_targets = {
-            'blue': [self.game.scale * 2, self.game.scale * 2],           # Canto superior esquerdo
-            'orange': [self.game.scale * 25, self.game.scale * 30],       # Canto inferior direito
-            'pink': [self.game.scale * 2, self.game.scale * 30],          # Canto inferior esquerdo
-            'red': [self.game.scale * 25, self.game.scale * 2]            # Canto superior direito
-        }
-
-    def get_manhattan_distance(self, pos1, pos2):
-        """Calcula distância Manhattan entre duas posições"""
-        return abs(pos1[0] - pos2[0]) + abs(pos1[1] - pos2[1])
-
-    def get_euclidean_distance(self, pos1, pos2):
-        """Calcula distância euclidiana entre duas posições"""
-        dx = pos1[0] - pos2[0]
-        dy = pos1[1] - pos2[1]
-        return math.sqrt(dx * dx + dy * dy)
-
-    def find_path_bfs(self, start_pos, target_pos):
-        """Encontra caminho usando BFS (Breadth-First Search)"""
-        # Converter posições para coordenadas do grid
-        start_grid = [int(start_pos[0] / self.game.scale), int(start_pos[1] / self.game.scale)]
-        target_grid = [int(target_pos[0] / self.game.scale), int(target_pos[1] / self.game.scale)]
-        
-        # Verificar limites
-        map_height = len(self.game.map)
-        map_width = len(self.game.map[0]) if map_height > 0 else 0
-        
-        if (start_grid[0] < 0 or start_grid[0] >= map_width or 
-            start_grid[1] < 0 or start_grid[1] >= map_height or
-            target_grid[0] < 0 or target_grid[0] >= map_width or 
-            target_grid[1] < 0 or target_grid[1] >= map_height):
-            return None
-
-        queue = deque([(start_grid, [start_grid])])
-        visited = set()
-        visited.add(tuple(start_grid))
-
-        directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]  # baixo, direita, cima, esquerda
-        
-        max_iterations = 100  # Limitar iterações para evitar lag
-        iterations = 0
-
-        while queue and iterations < max_iterations:
-            iterations += 1
-            current_pos, path = queue.popleft()
-            
-            if current_pos == target_grid:
-                if len(path) > 1:
-                    next_pos = path[1]
-                    # Converter de volta para coordenadas do jogo
-                    direction = [
-                        (next_pos[0] - start_grid[0]) * self.game.scale/16,
-                        (next_pos[1] - start_grid[1]) * self.game.scale/16
-                    ]
-                    return direction
-                return None
-
-            for dx, dy in directions:
-                new_x, new_y = current_pos[0] + dx, current_pos[1] + dy
-                new_pos = [new_x, new_y]
-                
-                if (0 <= new_x < map_width and 0 <= new_y < map_height and 
-                    tuple(new_pos) not in visited):
-                    
-                    # Verificar se não é parede
-                    if (self.game.map[new_y][new_x] != '#'):  # '#' = parede
-                        visited.add(tuple(new_pos))
-                        queue.append((new_pos, path + [new_pos]))
-
-        return None
-
-    def get_predicted_pacman_position(self, steps_ahead=4):
-        """Prediz posição futura do Pacman baseada na direção atual"""
-        predicted_pos = [
-            self.game.pac_man_pos[0] + (self.game.pac_man_direction[0] * steps_ahead),
-            self.game.pac_man_pos[1] + (self.game.pac_man_direction[1] * steps_ahead)
-        ]
-        return predicted_pos
-
-    def get_ambush_target(self, ghost_color):
-        """Calcula posição para emboscada (4 tiles à frente do Pacman)"""
-        if ghost_color == 'pink':
-            # Rosa tenta interceptar o Pacman
-            return self.get_predicted_pacman_position(4)
-        elif ghost_color == 'orange':
-            # Laranja mantém distância - se muito perto, vai para scatter
-            distance = self.get_euclidean_distance(
-                getattr(self.game, f'ghost_{ghost_color}_pos'),
-                self.game.pac_man_pos
-            )
-            if distance < self.game.scale * 8:
-                return self.scatter_targets[ghost_color]
-            else:
-                return self.game.pac_man_pos
-        return self.game.pac_man_pos
-
-    def get_best_direction_a_star(self, ghost_pos, target_pos, current_direction):
-        """Usa A* simplificado para encontrar melhor direção"""
-        possible_directions = [
-            [self.game.scale/16, 0],   # direita
-            [-self.game.scale/16, 0],  # esquerda
-            [0, self.game.scale/16],   # baixo
-            [0, -self.game.scale/16]   # cima
-        ]
-        
-        best_direction = current_direction
-        best_score = float('inf')
-        
-        for direction in possible_directions:
-            # Evitar reversão (não voltar na direção oposta)
-            if (direction[0] == -current_direction[0] and direction[1] == -current_direction[1] and
-                current_direction != [0, 0]):
-                continue
-            
-            # Testar nova posição
-            test_pos = [ghost_pos[0] + direction[0] * 16, ghost_pos[1] + direction[1] * 16]
-            
-            # Verificar colisão com paredes
-            collision = self.would_collide_with_wall(test_pos, direction)
-            if collision:
-                continue
-            
-            # Calcular score: distância ao target + heurística
-            distance = self.get_manhattan_distance(test_pos, target_pos)
-            
-            # Adicionar penalidade por mudança de direção
-            direction_change_penalty = 0
-            if direction != current_direction:
-                direction_change_penalty = 10
-            
-            total_score = distance + direction_change_penalty
-            
-            if total_score < best_score:
-                best_score = total_score
-                best_direction = direction
-        
-        return best_direction
-
-    def would_collide_with_wall(self, position, direction):
-        """Verifica se uma posição causaria colisão com parede"""
-        test_pos = [position[0], position[1]]
-        test_pos[0] += direction[0]
-        test_pos[1] += direction[1]
-        
-        for y in range(len(self.game.map)):
-            for x in range(len(self.game.map[0])):
-                if self.game.map[y][x] == '#':  # '#' = parede
-                    x_wall = (x * self.game.scale) - (self.game.scale * 0.65)
-                    y_wall = (y * self.game.scale) - (self.game.scale * 0.65)
-                    wall_size = self.game.scale * 1.85
-                    x_agent = test_pos[0] + (self.game.scale * 0.65)
-                    y_agent = test_pos[1] + (self.game.scale * 0.65)
-                    
-                    if (x_agent >= x_wall and x_agent <= x_wall + wall_size and 
-                        y_agent >= y_wall and y_agent <= y_wall + wall_size):
-                        return True
-        return False
-
-    def update_ghost_behavior(self, ghost_color):
-        """Atualiza o comportamento do fantasma baseado em ciclos"""
-        state = self.ghost_states[ghost_color]
-        state['mode_timer'] += 1
-        
-        # Ciclo de comportamentos: scatter -> chase -> scatter -> chase...
-        cycle_time = 480  # 8 segundos a 60 FPS
-        
-        if state['mode_timer'] % cycle_time < cycle_time // 4:
-            state['mode'] = 'scatter'
-        elif state['mode_timer'] % cycle_time < cycle_time // 2:
-            state['mode'] = 'chase'
-        elif state['mode_timer'] % cycle_time < 3 * cycle_time // 4:
-            state['mode'] = 'scatter'
-        else:
-            state['mode'] = 'chase'
-
-    def get_ghost_target(self, ghost_color):
-        """Determina o target do fantasma baseado no comportamento atual"""
-        state = self.ghost_states[ghost_color]
-        
-        if self.game.harmless_mode and getattr(self.game, f'harmless_mode_ghost_{ghost_color}'):
-            # Modo inofensivo - fugir do Pacman
-            return self.scatter_targets[ghost_color]
-        
-        if state['mode'] == 'scatter':
-            return self.scatter_targets[ghost_color]
-        elif state['mode'] == 'chase':
-            return self.game.pac_man_pos
-        elif state['mode'] == 'ambush':
-            return self.get_ambush_target(ghost_color)
-        elif state['mode'] == 'aggressive':
-            # Comportamento mais agressivo - perseguição direta
-            return self.game.pac_man_pos
-        
-        return self.game.pac_man_pos
-
-    def improved_ghost_intelligence(self, ghost_color, ghost_pos, ghost_direction, ghost_next_direction, distance_to_pacman):
-        """IA melhorada para fantasmas individuais"""
-        # Atualizar comportamento
-        self.update_ghost_behavior(ghost_color)
-        
-        # Determinar target
-        target = self.get_ghost_target(ghost_color)
-        
-        # Usar A* simplificado para encontrar melhor direção
-        new_direction = self.get_best_direction_a_star(ghost_pos, target, ghost_direction)
-        
-        # Aplicar lógica de turning corner melhorada
-        if new_direction != ghost_direction:
-            # Verificar se pode virar
-            can_turn = not self.would_collide_with_wall(ghost_pos, new_direction)
-            if can_turn:
-                ghost_direction = new_direction
-                ghost_next_direction = new_direction
-        
-        # Movimento e colisão
-        ghost_pos = self.game.collider(ghost_pos, ghost_direction)
-        ghost_pos = self.game.pacman_tunnel(ghost_pos)
-        
-        # Recalcular distância
-        distance_to_pacman = self.game.distance_ghost_to_pac_man(ghost_pos)
-        
-        # Detecção de fantasma preso (mesmo que o original)
-        if not hasattr(self, 'previous_positions'):
-            self.previous_positions = {}
-        
-        if ghost_color not in self.previous_positions:
-            self.previous_positions[ghost_color] = []
-        
-        self.previous_positions[ghost_color].append(ghost_pos[:])
-        
-        # Manter apenas últimas 30 posições
-        if len(self.previous_positions[ghost_color]) > 30:
-            self.previous_positions[ghost_color].pop(0)
-        
-        # Verificar se está preso (mesma posição por muito tempo)
-        if len(self.previous_positions[ghost_color]) >= 20:
-            recent_positions = self.previous_positions[ghost_color][-20:]
-            unique_positions = len(set(tuple(pos) for pos in recent_positions))
-            
-            if unique_positions < 3:  # Poucas posições únicas = preso
-                # Forçar nova direção aleatória
-                ghost_direction = self.game.random_direction_for_ghost()
-                ghost_next_direction = ghost_direction
-        
-        return ghost_pos, ghost_direction, ghost_next_direction, distance_to_pacman
-
-    def get_cooperative_behavior(self, ghost_color, all_ghost_positions):
-        """Implementa comportamento cooperativo entre fantasmas"""
-        # Evitar que fantasmas se agrupem demais
-        min_distance = self.game.scale * 3
-        
-        current_pos = getattr(self.game, f'ghost_{ghost_color}_pos')
-        
-        for other_color, other_pos in all_ghost_positions.items():
-            if other_color != ghost_color:
-                distance = self.get_euclidean_distance(current_pos, other_pos)
-                if distance < min_distance:
-                    # Muito próximo de outro fantasma, tentar se afastar
-                    return self.scatter_targets[ghost_color]
+from .simulation import GameSimulation
+from .board import BoardRenderer
+from .sprite_cache import SpriteCache
+from .animation import AnimationClip
+from .text_cache import TextCache
+from .display import RenderTarget
+from .assets import prepare_surface
+from .timing import FixedTimestep, FramePacer
+from .flow import GameFlow
+from .profiler import FrameProfiler
+
+_numpy = None  # Importado na primeira coloração (ver load_numpy)
+
+
+def load_numpy():
+    """Retorna o módulo numpy, importado só quando um sprite precisa ser colorido
+
+    Com o cache de sprites em dia nenhum sprite é colorido, e a
+    inicialização não paga o import do numpy. Sem numpy retorna None e os
+    sprites são coloridos pixel a pixel.
+    """
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+        except ImportError:
+            numpy = False
+        _numpy = numpy
+    return _numpy or None
+
+
+class PacMan(GameSimulation):
+    """Classe principal do jogo Pac-Man: janela, sprites e entrada sobre a simulação"""
+    
+    # Atributos com as posições dos agentes desenhados (interpolados entre passos)
+    AGENT_POSITIONS = ('pac_man_pos', 'pac_man_2_pos', 'pac_man_3_pos',
+                       'ghost_blue_pos', 'ghost_orange_pos', 'ghost_pink_pos', 'ghost_red_pos')
+    
+    def __init__(self, scale, render_scale=RENDER_SCALE):
+        """Inicializa o jogo com o fator de escala especificado
+        
+        scale define o tamanho da janela. Com render_scale, o jogo é desenhado
+        nessa escala lógica numa superfície fora da tela e ampliado para a
+        janela (redimensionável) uma vez por frame.
+        """
+        super().__init__()
         
-        return None  # Comportamento normal
-
-
-class PacMan:
-    """Classe principal do jogo Pac-Man baseada no arquivo de referência"""
-    
-    def __init__(self, scale):
-        """Inicializa o jogo com o fator de escala especificado"""
         self.white = WHITE
         self.black = BLACK
         self.blue = BLUE
         
+        # Escala da janela e escala usada na renderização
+        self.window_scale = scale
+        self.scale = render_scale if render_scale else scale
+        
         # Calcular dimensões da janela baseado no parâmetro scale
         window_width = scale * 27.5
         window_height = scale * 35
         
-        # Configurar janela
-        self.window = pg.display.set_mode((window_width, window_height))
+        # Configurar janela (self.window é sempre a superfície onde o jogo desenha)
+        logical_size = None
+        if self.scale != scale:
+            logical_size = (self.scale * 27.5, self.scale * 35)
+        self.render_target = RenderTarget((window_width, window_height), logical_size, RENDER_SMOOTH)
+        self.window = self.render_target.surface
         pg.display.set_caption("Pac-Man")
         
         # Configurar fonte
         pg.font.init()
-        self.font = pg.font.SysFont("Courier New", scale * 2, bold=True)
+        self.font = pg.font.SysFont("Courier New", self.scale * 2, bold=True)
+        self.text_cache = TextCache(self.font, TEXT_CACHE_SIZE)  # Textos do placar já renderizados
         
-        # Configurar clock
+        # Fonte maior para a contagem regressiva e avisos de transição
+        self.countdown_font = pg.font.SysFont("Courier New", self.scale * 4, bold=True)
+        self.countdown_text_cache = TextCache(self.countdown_font, 8)
+        
+        # Configurar clock e passo fixo da lógica
         self.clock = pg.time.Clock()
+        self.timestep = FixedTimestep(LOGIC_RATE, MAX_CATCH_UP_STEPS)
+        
+        # Transições da partida (contagem, morte, fim de nível) dentro do loop
+        self.flow = GameFlow()
+        
+        # Ritmo adaptativo: nível de degradação do desenho sob carga (0 = completo)
+        budget = max(1 / LOGIC_RATE, 1 / MAX_RENDER_FPS if MAX_RENDER_FPS else 0)
+        self.pacing = FramePacer(budget, PACING_WINDOW, PACING_RECOVERY, PACING_SKIP_FRAMES)
+        self.frame_count = 0
+        self.animation_hold = None  # Quadro de animação congelado (None: segue sprite_frame)
+        
+        # Profiler de frames (desligado: nenhum método é cronometrado)
+        self.profiler = None
+        self.profile_path = None
         
-        # Variáveis do jogo
-        self.scale = scale
-        self.sprite_frame = 0
-        self.sprite_speed = SPRITE_SPEED
-        
-        # Estado do jogo
-        self.score = 0
-        self.lives = 2 # 3 vidas
-        self.end_game = False
-        self.harmless_mode = False
-        self.harmless_mode_timer = 0
-        self.harmless_mode_ghost_blue = False
-        self.harmless_mode_ghost_orange = False
-        self.harmless_mode_ghost_pink = False
-        self.harmless_mode_ghost_red = False
-        
-        # Modo de jogo selecionado
-        self.game_mode = "Player 1"
-        
-        # Posições e direções do Pacman (calculadas dinamicamente)
-        self.pac_man_pos = [scale * 13.1, scale * 22.6]
-        self.pac_man_direction = [scale/16, 0]
-        self.pac_man_next_direction = [scale/16, 0]
-        
-        # Posições e direções para múltiplos jogadores
-        self.pac_man_2_pos = [scale * 12.1, scale * 22.6]  # Player 2 - à esquerda
-        self.pac_man_2_direction = [0, 0]
-        self.pac_man_2_next_direction = [0, 0]
-        
-        self.pac_man_3_pos = [scale * 14.1, scale * 22.6]  # Player 3 - à direita
-        self.pac_man_3_direction = [0, 0]
-        self.pac_man_3_next_direction = [0, 0]
-        
-        # Posições e direções dos fantasmas (calculadas dinamicamente)
-        self.ghost_blue_pos = [scale * 12, scale * 13]
-        self.ghost_orange_pos = [scale * 12, scale * 14.5]
-        self.ghost_pink_pos = [scale * 14, scale * 13]
-        self.ghost_red_pos = [scale * 14, scale * 14.5]
-        
-        self.ghost_blue_direction = [0, 0]
-        self.ghost_orange_direction = [0, 0]
-        self.ghost_pink_direction = [0, 0]
-        self.ghost_red_direction = [0, 0]
-        
-        self.ghost_blue_next_direction = [0, 0]
-        self.ghost_orange_next_direction = [0, 0]
-        self.ghost_pink_next_direction = [0, 0]
-        self.ghost_red_next_direction = [0, 0]
-        
-        # Distâncias dos fantasmas ao Pacman
-        self.distance_ghost_blue_to_pac_man = self.distance_ghost_to_pac_man(self.ghost_blue_pos)
-        self.distance_ghost_orange_to_pac_man = self.distance_ghost_to_pac_man(self.ghost_orange_pos)
-        self.distance_ghost_pink_to_pac_man = self.distance_ghost_to_pac_man(self.ghost_pink_pos)
-        self.distance_ghost_red_to_pac_man = self.distance_ghost_to_pac_man(self.ghost_red_pos)
+        # Interpolação das posições desenhadas (fração do passo seguinte já decorrida)
+        self.interpolation = 0.0
+        self._previous_positions = {}
+        
+        # Fundo do labirinto e camada de pontos pré-renderizados
+        self.board_renderer = BoardRenderer(self.scale, self.window)
+        
+        # Renderização por retângulos sujos (áreas desenhadas no último frame)
+        self.dirty_rendering = DIRTY_RECT_RENDERING
+        self._sprite_rects = None  # None força um frame completo
+        self._hud_rects = []
+        self._hud_state = None
+        self._hud_blits = []  # Textos do último placar: (superfície, posição)
+        
+        # Carregar sprites (do cache em disco quando os PNGs não mudaram)
+        self.sprite_cache = SpriteCache(self.scale, enabled=SPRITE_CACHE)
         
         # Carregar sprites do Pacman
         self._load_pacman_sprites()
@@ -378,114 +127,26 @@ class PacMan:
 
         # Carregar sprites das frutas
         self._load_fruit_sprites()
-
-        # Mapa do jogo
-        self.map = [row[:] for row in GAME_MAP]  # Cópia do mapa
-
-        # Inicializar frutas no mapa
-        self._initialize_fruits()
+        
+        self.sprite_cache.save()
+        
+        # Tabelas de animação (sprite_frame -> quadro)
+        self._build_animations()
+        
+        # Converter todos os sprites para o formato do display (a janela já existe)
+        self._convert_assets()
 
         # Sistema de controles
         self.controller_manager = ControllerManager()
         self.controller_connected = self.controller_manager.get_controller_count() > 0
         self.controller_index = 0  # Usar o primeiro controle conectado
-
-    def _initialize_fruits(self):
-        """Inicializa as frutas no mapa"""
-        self.active_fruits = {}  # Dicionário para frutas ativas: posição -> tipo
-        self.fruit_timer = 0
-        self.fruit_spawn_delay = 600  # Frames entre spawns de frutas (10 segundos a 60 FPS)
-        self.fruit_duration = 600  # Frames que fruta fica ativa (10 segundos)
-        # Sistema de raridade baseado em probabilidades
-        # Frutas mais valiosas são mais raras
-        self.fruit_rarity = {
-            FRUIT_CHERRY: 30,      # 30% - Comum
-            FRUIT_STRAWBERRY: 25,  # 25% - Comum
-            FRUIT_ORANGE: 20,      # 20% - Incomum
-            FRUIT_APPLE: 15,       # 15% - Incomum
-            FRUIT_BELL: 5,         # 5% - Raro
-            FRUIT_KEY: 3,          # 3% - Raro
-            FRUIT_COCONUT: 1.5,    # 1.5% - Muito Raro
-            FRUIT_FLOWER: 0.5      # 0.5% - Lendário
-        }
-        self.last_fruit_spawn_time = 0
-        self.fruit_frame_counter = 0  # Contador separado para frutas
-
-    def _spawn_fruit(self):
-        """Spawna uma fruta em uma posição aleatória"""
-        if not FRUIT_POSITIONS:
-            return
-
-        # Escolher uma posição aleatória disponível que não seja parede
-        available_positions = []
-        for pos in FRUIT_POSITIONS:
-            if pos not in self.active_fruits:
-                x, y = pos
-                # Verificar se a posição existe no mapa e não é parede
-                if (0 <= y < len(self.map) and 0 <= x < len(self.map[0]) and
-                    self.map[y][x] != WALL):
-                    # Verificar se a posição não está no spawn dos fantasmas
-                    if not self._is_ghost_spawn_position(x, y):
-                        available_positions.append(pos)
-
-        if available_positions:
-            pos = random.choice(available_positions)
-            fruit_type = self._select_fruit_by_rarity()
-            self.active_fruits[pos] = {
-                'type': fruit_type,
-                'spawn_time': self.fruit_frame_counter,
-                'duration': self.fruit_duration
-            }
-
-    def _select_fruit_by_rarity(self):
-        """Seleciona uma fruta baseada no sistema de raridade"""
-        # Criar lista de frutas com suas probabilidades
-        fruits = list(self.fruit_rarity.keys())
-        probabilities = list(self.fruit_rarity.values())
         
-        # Selecionar fruta baseada na probabilidade
-        selected_fruit = random.choices(fruits, weights=probabilities, k=1)[0]
-        
-        return selected_fruit
-
-    def _is_ghost_spawn_position(self, x, y):
-        """Verifica se uma posição está no spawn dos fantasmas"""
-        # Posições dos fantasmas em coordenadas de grid
-        ghost_spawn_positions = [
-            (12, 13),    # Ghost Blue
-            (12, 14),    # Ghost Orange (arredondado de 14.5)
-            (14, 13),    # Ghost Pink
-            (14, 14),    # Ghost Red (arredondado de 14.5)
-            (13, 10),    # Posição central de spawn (quando fantasmas voltam)
-            (13, 11),    # Área próxima ao spawn
-            (13, 12),    # Área próxima ao spawn
-            (13, 13),    # Área próxima ao spawn
-            (13, 14),    # Área próxima ao spawn
-            (13, 15),    # Área próxima ao spawn
-        ]
-        
-        return (x, y) in ghost_spawn_positions
-
-    def _update_fruits(self):
-        """Atualiza o estado das frutas (spawn e expiração)"""
-        # Incrementar contador de frames das frutas
-        self.fruit_frame_counter += 1
-        current_time = self.fruit_frame_counter
-
-        # Spawn de nova fruta se necessário
-        if current_time - self.last_fruit_spawn_time >= self.fruit_spawn_delay:
-            if len(self.active_fruits) < 2:  # Máximo 2 frutas ativas
-                self._spawn_fruit()
-                self.last_fruit_spawn_time = current_time
-
-        # Remover frutas expiradas
-        expired_fruits = []
-        for pos, fruit_data in self.active_fruits.items():
-            if current_time - fruit_data['spawn_time'] >= fruit_data['duration']:
-                expired_fruits.append(pos)
-
-        for pos in expired_fruits:
-            del self.active_fruits[pos]
+        # Mapeamento de controles para jogadores
+        self.player_controllers = {
+            1: 0,  # Player 1 usa controle 0
+            2: 1,  # Player 2 usa controle 1 (se disponível)
+            3: 2   # Player 3 usa controle 2 (se disponível)
+        }
 
     def _get_fruit_sprite(self, fruit_type):
         """Retorna o sprite correspondente ao tipo de fruta"""
@@ -501,27 +162,6 @@ class PacMan:
         }
         return fruit_sprites.get(fruit_type)
 
-    def _get_fruit_points(self, fruit_type):
-        """Retorna os pontos correspondentes ao tipo de fruta"""
-        fruit_points = {
-            FRUIT_CHERRY: CHERRY_POINTS,
-            FRUIT_STRAWBERRY: STRAWBERRY_POINTS,
-            FRUIT_ORANGE: ORANGE_POINTS,
-            FRUIT_APPLE: APPLE_POINTS,
-            FRUIT_BELL: BELL_POINTS,
-            FRUIT_KEY: KEY_POINTS,
-            FRUIT_COCONUT: COCONUT_POINTS,
-            FRUIT_FLOWER: FLOWER_POINTS
-        }
-        return fruit_points.get(fruit_type, 0)
-        
-        # Mapeamento de controles para jogadores
-        self.player_controllers = {
-            1: 0,  # Player 1 usa controle 0
-            2: 1,  # Player 2 usa controle 1 (se disponível)
-            3: 2   # Player 3 usa controle 2 (se disponível)
-        }
-    
     def _load_pacman_sprites(self):
         """Carrega os sprites do Pacman para todos os players"""
         base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -534,30 +174,130 @@ class PacMan:
             3: PLAYER_3_COLOR   # Rosa
         }
         
-        # Carregar sprites para cada player
-        for player_num in range(1, 4):
-            pacman_sprites = []
-            for i in range(1, 18):
-                sprite_path = os.path.join(img_dir, f"Pac_Man_{i}.png")
+        # Carregar sprites para cada player (cada PNG é decodificado uma vez
+        # e colorido para os três players)
+        sprite_size = (self.scale * 1.3, self.scale * 1.3)
+        pacman_sprites = {player_num: [] for player_num in player_colors}
+        for i in range(1, 18):
+            sprite_path = os.path.join(img_dir, f"Pac_Man_{i}.png")
+            for player_num, color in player_colors.items():
                 if os.path.exists(sprite_path):
-                    sprite = pg.image.load(sprite_path)
-                    scaled_sprite = pg.transform.scale(sprite, (self.scale * 1.3, self.scale * 1.3))
-                    
                     # Aplicar cor do player ao sprite
-                    colored_sprite = self._colorize_sprite(scaled_sprite, player_colors[player_num])
-                    pacman_sprites.append(colored_sprite)
+                    colored_sprite = self.sprite_cache.get(sprite_path, sprite_size, color, self._colorize_sprite,
+                                                           SPRITE_PROCESS_VERSION)
+                    pacman_sprites[player_num].append(colored_sprite)
                 else:
                     # Criar sprite placeholder com cor do player
-                    placeholder = pg.Surface((self.scale * 1.3, self.scale * 1.3))
-                    placeholder.fill(player_colors[player_num])
-                    pacman_sprites.append(placeholder)
-            
-            # Atribuir sprites às variáveis específicas do player
-            for i, sprite in enumerate(pacman_sprites):
+                    placeholder = pg.Surface(sprite_size)
+                    placeholder.fill(color)
+                    pacman_sprites[player_num].append(placeholder)
+        
+        # Atribuir sprites às variáveis específicas do player
+        for player_num, sprites in pacman_sprites.items():
+            for i, sprite in enumerate(sprites):
                 setattr(self, f"pac_man_{player_num}_{i+1}", sprite)
+        
+        self._build_pacman_atlas()
+    
+    def _build_pacman_atlas(self):
+        """Pré-calcula cada sprite do Pacman já rotacionado para as quatro direções
+        
+        pacman_atlas[player][n][rotação] é o sprite pac_man_{player}_{n} na
+        rotação de SPRITE_DIRECTION_INDEX, evitando transformações por frame.
+        """
+        rotations = ([1, 0], [0, 1], [-1, 0], [0, -1])
+        self.pacman_atlas = {}
+        for player_num in range(1, 4):
+            frames = [None]  # Sprites numerados a partir de 1
+            for i in range(1, 18):
+                sprite = getattr(self, f"pac_man_{player_num}_{i}")
+                frames.append(tuple(self.player_rotation(sprite, direction) for direction in rotations))
+            self.pacman_atlas[player_num] = frames
+    
+    def _build_animations(self):
+        """Monta as tabelas de animação a partir dos clipes definidos em constants
+        
+        pacman_animations[player] e pacman_death_animations[player] devolvem
+        as quatro rotações do quadro; ghost_animations[cor] devolve os quatro
+        olhares (direita, baixo, esquerda, cima) na ordem de SPRITE_DIRECTION_INDEX.
+        """
+        self.pacman_animations = {}
+        self.pacman_death_animations = {}
+        for player_num, frames in self.pacman_atlas.items():
+            self.pacman_animations[player_num] = AnimationClip(PACMAN_ALIVE_ANIMATION, frames)
+            self.pacman_death_animations[player_num] = AnimationClip(PACMAN_DEATH_ANIMATION, frames)
+        
+        self.ghost_animations = {}
+        for color in ['blue', 'orange', 'pink', 'red']:
+            frames = []
+            for frame in range(2):
+                right = getattr(self, f"ghost_{color}_down_right_{frame}")
+                frames.append((right,
+                               getattr(self, f"ghost_{color}_down_{frame}"),
+                               pg.transform.flip(right, True, False),
+                               getattr(self, f"ghost_{color}_up_{frame}")))
+            self.ghost_animations[color] = AnimationClip(GHOST_ANIMATION, frames)
+        
+        # Fantasma inofensivo não tem variantes direcionais
+        harmless = [(sprite,) * 4 for sprite in (self.ghost_harmless_0, self.ghost_harmless_1)]
+        self.ghost_animations['harmless'] = AnimationClip(GHOST_ANIMATION, harmless)
+    
+    def _convert_assets(self):
+        """Troca os sprites carregados (atributos, atlas e animações) pelas versões no formato do display
+        
+        Cada superfície é convertida uma única vez; referências repetidas
+        (o mesmo quadro em várias posições de um clipe) continuam compartilhadas.
+        """
+        converted = {}
+        for name, value in list(vars(self).items()):
+            if isinstance(value, pg.Surface) and value is not self.window:
+                setattr(self, name, self._converted_asset(value, converted))
+        
+        for frames in self.pacman_atlas.values():
+            frames[1:] = [self._converted_asset(rotations, converted) for rotations in frames[1:]]
+        
+        clips = (list(self.pacman_animations.values()) + list(self.pacman_death_animations.values()) +
+                 list(self.ghost_animations.values()))
+        for clip in clips:
+            clip.table = [self._converted_asset(frame, converted) for frame in clip.table]
+    
+    def _converted_asset(self, asset, converted):
+        """Versão convertida de uma superfície ou tupla de superfícies (memorizada em converted)"""
+        if asset not in converted:
+            if isinstance(asset, tuple):
+                converted[asset] = tuple(self._converted_asset(surface, converted) for surface in asset)
+            else:
+                converted[asset] = prepare_surface(asset)
+        return converted[asset]
     
     def _colorize_sprite(self, sprite, color):
-        """Aplica uma cor a um sprite mantendo a transparência"""
+        """Aplica uma cor a um sprite mantendo a transparência
+        
+        Cada canal de cor dos pixels não transparentes vira
+        int(canal * cor / 255); o alpha é mantido. Com numpy a conta é feita
+        de uma vez sobre o array de pixels, com o mesmo resultado do caminho
+        pixel a pixel.
+        """
+        np = load_numpy()
+        if np is None:
+            return self._colorize_sprite_pixels(sprite, color)
+        
+        colored_sprite = sprite.copy()
+        if not colored_sprite.get_flags() & pg.SRCALPHA:
+            colored_sprite = colored_sprite.convert_alpha()
+        
+        # Views diretas sobre os pixels (travam a superfície até o del)
+        rgb = pg.surfarray.pixels3d(colored_sprite)
+        alpha = pg.surfarray.pixels_alpha(colored_sprite)
+        visible = alpha > 0
+        tinted = rgb.astype(np.uint16) * np.array(color[:3], dtype=np.uint16) // 255
+        rgb[visible] = tinted[visible]
+        del rgb, alpha
+        
+        return colored_sprite
+    
+    def _colorize_sprite_pixels(self, sprite, color):
+        """Aplica uma cor a um sprite pixel a pixel (caminho sem numpy)"""
         # Criar uma cópia do sprite
         colored_sprite = sprite.copy()
         
@@ -593,14 +333,16 @@ class PacMan:
         # Cores dos fantasmas
         ghost_colors = ['Blue', 'Orange', 'Pink', 'Red']
 
+        # Olhares disponíveis em img/ (esquerda é o Down_Right espelhado)
+        ghost_looks = ['Down_Right', 'Down', 'Up']
+
         for color in ghost_colors:
             # Carregar sprites de movimento normal
-            for frame in range(2):
-                sprite_path = os.path.join(img_dir, f"{color}_Ghost_Down_Right_{frame}.png")
+            for look, frame in [(look, frame) for look in ghost_looks for frame in range(2)]:
+                sprite_path = os.path.join(img_dir, f"{color}_Ghost_{look}_{frame}.png")
                 if os.path.exists(sprite_path):
-                    sprite = pg.image.load(sprite_path)
-                    scaled_sprite = pg.transform.scale(sprite, (self.scale * 1.3, self.scale * 1.3))
-                    setattr(self, f"ghost_{color.lower()}_down_right_{frame}", scaled_sprite)
+                    scaled_sprite = self.sprite_cache.get(sprite_path, (self.scale * 1.3, self.scale * 1.3))
+                    setattr(self, f"ghost_{color.lower()}_{look.lower()}_{frame}", scaled_sprite)
                 else:
                     # Criar placeholder
                     placeholder = pg.Surface((self.scale * 1.3, self.scale * 1.3))
@@ -612,14 +354,13 @@ class PacMan:
                         placeholder.fill((255, 192, 203))
                     else:  # Red
                         placeholder.fill((255, 0, 0))
-                    setattr(self, f"ghost_{color.lower()}_down_right_{frame}", placeholder)
+                    setattr(self, f"ghost_{color.lower()}_{look.lower()}_{frame}", placeholder)
 
         # Carregar sprites de fantasma inofensivo
         for frame in range(2):
             sprite_path = os.path.join(img_dir, f"Harmless_Ghost_{frame}.png")
             if os.path.exists(sprite_path):
-                sprite = pg.image.load(sprite_path)
-                scaled_sprite = pg.transform.scale(sprite, (self.scale * 1.3, self.scale * 1.3))
+                scaled_sprite = self.sprite_cache.get(sprite_path, (self.scale * 1.3, self.scale * 1.3))
                 setattr(self, f"ghost_harmless_{frame}", scaled_sprite)
             else:
                 # Criar placeholder azul
@@ -647,10 +388,9 @@ class PacMan:
         for fruit_name, filename in fruit_sprites.items():
             sprite_path = os.path.join(img_dir, filename)
             if os.path.exists(sprite_path):
-                sprite = pg.image.load(sprite_path)
                 # Aumentar o tamanho das frutas para 1.2x o tamanho normal
                 fruit_size = int(self.scale * 1.2)
-                scaled_sprite = pg.transform.scale(sprite, (fruit_size, fruit_size))
+                scaled_sprite = self.sprite_cache.get(sprite_path, (fruit_size, fruit_size))
                 setattr(self, f"fruit_{fruit_name}", scaled_sprite)
             else:
                 # Criar sprite placeholder simples se o arquivo não existir
@@ -659,137 +399,18 @@ class PacMan:
                 placeholder.fill((255, 255, 255))  # Branco simples
                 setattr(self, f"fruit_{fruit_name}", placeholder)
     
-    def clear_window(self):
-        """Limpa a janela com a cor de fundo"""
-        pg.draw.rect(self.window, self.black, (0, 0, self.window.get_width(), self.window.get_height()))
-    
-    def move(self, key):
-        """Processa entrada do teclado para movimento dos Pacmans"""
-        if key == 'r':
-            self.restart()
-        # Player 1 (WASD)
-        elif key == 'w':
-            self._set_direction('up', 1)
-        elif key == 'a':
-            self._set_direction('left', 1)
-        elif key == 's':
-            self._set_direction('down', 1)
-        elif key == 'd':
-            self._set_direction('right', 1)
-        # Player 2 (Arrow Keys)
-        elif key == 'up':
-            self._set_direction('up', 2)
-        elif key == 'left':
-            self._set_direction('left', 2)
-        elif key == 'down':
-            self._set_direction('down', 2)
-        elif key == 'right':
-            self._set_direction('right', 2)
-        # Player 3 (IJKL)
-        elif key == 'i':
-            self._set_direction('up', 3)
-        elif key == 'j':
-            self._set_direction('left', 3)
-        elif key == 'k':
-            self._set_direction('down', 3)
-        elif key == 'l':
-            self._set_direction('right', 3)
-    
-    def _set_direction(self, direction, player_num=1):
-        """Define a direção do Pacman baseada no input"""
-        # Selecionar variáveis baseadas no jogador
-        if player_num == 1:
-            current_dir = self.pac_man_direction
-            next_dir = self.pac_man_next_direction
-        elif player_num == 2:
-            current_dir = self.pac_man_2_direction
-            next_dir = self.pac_man_2_next_direction
-        elif player_num == 3:
-            current_dir = self.pac_man_3_direction
-            next_dir = self.pac_man_3_next_direction
-        else:
-            return
-        
-        if direction == 'up':
-            if current_dir[0] == 0 and current_dir[1] > 0:
-                current_dir[0] = 0
-                current_dir[1] = -self.scale/16
-                next_dir[0] = 0
-                next_dir[1] = -self.scale/16
-            elif current_dir[0] != 0 and current_dir[1] == 0:
-                next_dir[0] = 0
-                next_dir[1] = -self.scale/16
-            elif current_dir[0] == 0 and current_dir[1] == 0:  # Se parado, pode começar a se mover
-                current_dir[0] = 0
-                current_dir[1] = -self.scale/16
-                next_dir[0] = 0
-                next_dir[1] = -self.scale/16
-        elif direction == 'left':
-            if current_dir[0] > 0 and current_dir[1] == 0:
-                current_dir[0] = -self.scale/16
-                current_dir[1] = 0
-                next_dir[0] = -self.scale/16
-                next_dir[1] = 0
-            elif current_dir[0] == 0 and current_dir[1] != 0:
-                next_dir[0] = -self.scale/16
-                next_dir[1] = 0
-            elif current_dir[0] == 0 and current_dir[1] == 0:  # Se parado, pode começar a se mover
-                current_dir[0] = -self.scale/16
-                current_dir[1] = 0
-                next_dir[0] = -self.scale/16
-                next_dir[1] = 0
-        elif direction == 'down':
-            if current_dir[0] == 0 and current_dir[1] < 0:
-                current_dir[0] = 0
-                current_dir[1] = self.scale/16
-                next_dir[0] = 0
-                next_dir[1] = self.scale/16
-            elif current_dir[0] != 0 and current_dir[1] == 0:
-                next_dir[0] = 0
-                next_dir[1] = self.scale/16
-            elif current_dir[0] == 0 and current_dir[1] == 0:  # Se parado, pode começar a se mover
-                current_dir[0] = 0
-                current_dir[1] = self.scale/16
-                next_dir[0] = 0
-                next_dir[1] = self.scale/16
-        elif direction == 'right':
-            if current_dir[0] < 0 and current_dir[1] == 0:
-                current_dir[0] = self.scale/16
-                current_dir[1] = 0
-                next_dir[0] = self.scale/16
-                next_dir[1] = 0
-            elif current_dir[0] == 0 and current_dir[1] != 0:
-                next_dir[0] = self.scale/16
-                next_dir[1] = 0
-            elif current_dir[0] == 0 and current_dir[1] == 0:  # Se parado, pode começar a se mover
-                current_dir[0] = self.scale/16
-                current_dir[1] = 0
-                next_dir[0] = self.scale/16
-                next_dir[1] = 0
-    
     def handle_controller_input(self):
         """Processa entrada dos controles para todos os jogadores ativos"""
+        # O estado dos controles é atualizado por eventos (handle_events); aqui só é lido
         if not self.controller_connected:
             return
         
-        # Atualizar estado dos controles
-        self.controller_manager.update()
-        
-        # Verificar se ainda há controles conectados
-        if self.controller_manager.get_controller_count() == 0:
-            self.controller_connected = False
-            return
-        
         # Player 1 (sempre ativo)
         controller_1 = self.player_controllers[1]
         if self.controller_manager.is_controller_connected(controller_1):
             direction, has_input = self.controller_manager.get_movement_input(controller_1)
             if has_input:
                 self._set_direction(direction, 1)
-            
-            special_buttons = self.controller_manager.get_special_buttons(controller_1)
-            if special_buttons.get('restart', False):
-                self.restart()
         
         # Player 2 (se modo Player 2 ou Player 3)
         if self.game_mode in ["Player 2", "Player 3"]:
@@ -809,24 +430,13 @@ class PacMan:
     
     def board(self):
         """Desenha o tabuleiro do jogo"""
-        for y in range(len(self.map)):
-            for x in range(len(self.map[0])):
-                if self.map[y][x] == WALL:
-                    pg.draw.rect(self.window, self.blue, (x * self.scale, y * self.scale, self.scale, self.scale))
-                #if self.map[y][x] == TUNNEL:
-                #    pg.draw.rect(self.window, self.white, (x * self.scale, y * self.scale, self.scale, self.scale))
-                if self.map[y][x] == EMPTY or self.map[y][x] == DOT or self.map[y][x] == POWER_PELLET:
-                    pg.draw.rect(self.window, self.black, ((x * self.scale) - (self.scale / 2), (y * self.scale) - (self.scale / 2), self.scale * 1.5, self.scale * 1.5))
+        # Fundo do labirinto com os pontos restantes (cobre a janela inteira)
+        self.window.blit(self.board_renderer.update(self.map, self.dot_index), (0, 0))
+        self.draw_fruits()
 
-        # Desenhar pontos e power pellets
-        for y in range(len(self.map)):
-            for x in range(len(self.map[0])):
-                if self.map[y][x] == DOT:
-                    pg.draw.circle(self.window, self.white, ((x * self.scale) + (self.scale / 4), (y * self.scale) + (self.scale / 4)), self.scale / 5)
-                if self.map[y][x] == POWER_PELLET:
-                    pg.draw.circle(self.window, self.white, ((x * self.scale) + (self.scale / 4), (y * self.scale) + (self.scale / 4)), self.scale / 2)
-
-        # Desenhar frutas ativas
+    def draw_fruits(self):
+        """Desenha as frutas ativas e retorna os retângulos desenhados"""
+        rects = []
         for pos, fruit_data in self.active_fruits.items():
             x, y = pos
             fruit_sprite = self._get_fruit_sprite(fruit_data['type'])
@@ -835,14 +445,8 @@ class PacMan:
                 fruit_size = int(self.scale * 1.2)
                 offset_x = (self.scale - fruit_size) // 2
                 offset_y = (self.scale - fruit_size) // 2
-                self.window.blit(fruit_sprite, (x * self.scale + offset_x, y * self.scale + offset_y))
-    
-    def animation_step(self):
-        """Atualiza o frame de animação"""
-        if self.sprite_frame == 60:
-            self.sprite_frame = 0
-        else:
-            self.sprite_frame += self.sprite_speed
+                rects.append(self.window.blit(fruit_sprite, (x * self.scale + offset_x, y * self.scale + offset_y)))
+        return rects
     
     def player_rotation(self, image, direction=None):
         """Rotaciona a imagem do Pacman baseada na direção"""
@@ -861,714 +465,92 @@ class PacMan:
             return pg.transform.rotate(image, 90)
         return image
     
-    def collider(self, position, direction):
-        """Verifica colisões com paredes"""
-        if self.end_game == False:
-            position[0] += direction[0]
-            position[1] += direction[1]
-            for y in range(len(self.map)):
-                for x in range(len(self.map[0])):
-                    if self.map[y][x] == WALL or self.map[y][x] == TUNNEL:
-                        x_wall = (x * self.scale) - (self.scale * 0.65)
-                        y_wall = (y * self.scale) - (self.scale * 0.65)
-                        wall_size = self.scale * 1.85
-                        x_agent = position[0] + (self.scale * 0.65)
-                        y_agent = position[1] + (self.scale * 0.65)
-                        
-                        if x_agent >= x_wall and x_agent <= x_wall + wall_size and y_agent >= y_wall and y_agent <= y_wall + wall_size:
-                            position[0] -= direction[0]
-                            position[1] -= direction[1]
-        return position
-    
-    def turning_corner(self, position, direction, next_direction):
-        """Sistema de curvas para mudança de direção"""
-        turned_corner = True
-        position[0] += next_direction[0] * 16
-        position[1] += next_direction[1] * 16
-        for y in range(len(self.map)):
-            for x in range(len(self.map[0])):
-                if self.map[y][x] == WALL or self.map[y][x] == TUNNEL:
-                    x_wall = (x * self.scale) - (self.scale * 0.65)
-                    y_wall = (y * self.scale) - (self.scale * 0.65)
-                    wall_size = self.scale * 1.85
-                    x_agent = position[0] + (self.scale * 0.65)
-                    y_agent = position[1] + (self.scale * 0.65)
-                    if x_agent >= x_wall and x_agent <= x_wall + wall_size and y_agent >= y_wall and y_agent <= y_wall + wall_size:
-                        turned_corner = False
-        position[0] -= next_direction[0] * 16
-        position[1] -= next_direction[1] * 16
-        if turned_corner:
-            direction[0] = next_direction[0]
-            direction[1] = next_direction[1]
-        return direction, next_direction
-    
-    def collect_dots(self):
-        """Coleta pontos e power pellets para todos os jogadores ativos"""
-        # Lista de posições dos jogadores ativos
-        active_players = [self.pac_man_pos]  # Player 1 sempre ativo
-        
-        # Adicionar Player 2 se estiver ativo
-        if self.game_mode in ["Player 2", "Player 3"]:
-            active_players.append(self.pac_man_2_pos)
-        
-        # Adicionar Player 3 se estiver ativo
-        if self.game_mode == "Player 3":
-            active_players.append(self.pac_man_3_pos)
-        
-        for y in range(len(self.map)):
-            for x in range(len(self.map[0])):
-                if self.map[y][x] == DOT:
-                    x_dot = (x * self.scale) + (self.scale / 4)
-                    y_dot = (y * self.scale) + (self.scale / 4)
-                    radius = self.scale / 5
-                    
-                    # Verificar colisão com todos os jogadores ativos
-                    for player_pos in active_players:
-                        x_pac_man = player_pos[0] + (self.scale * 0.65)
-                        y_pac_man = player_pos[1] + (self.scale * 0.65)
-                        if x_pac_man >= x_dot - radius and x_pac_man <= x_dot + radius and y_pac_man >= y_dot - radius and y_pac_man <= y_dot + radius:
-                            self.map[y][x] = EMPTY
-                            self.score += DOT_POINTS
-                            break  # Sair do loop de jogadores se coletou o ponto
-                
-                if self.map[y][x] == POWER_PELLET:
-                    x_dot = (x * self.scale) + (self.scale / 4)
-                    y_dot = (y * self.scale) + (self.scale / 4)
-                    radius = self.scale / 2
-                    
-                    # Verificar colisão com todos os jogadores ativos
-                    for player_pos in active_players:
-                        x_pac_man = player_pos[0] + (self.scale * 0.65)
-                        y_pac_man = player_pos[1] + (self.scale * 0.65)
-                        if x_pac_man >= x_dot - radius and x_pac_man <= x_dot + radius and y_pac_man >= y_dot - radius and y_pac_man <= y_dot + radius:
-                            self.map[y][x] = EMPTY
-                            self.score += POWER_PELLET_POINTS
-                            self.harmless_mode = True
-                            self.harmless_mode_ghost_blue = True
-                            self.harmless_mode_ghost_orange = True
-                            self.harmless_mode_ghost_pink = True
-                            self.harmless_mode_ghost_red = True
-                            break  # Sair do loop de jogadores se coletou o power pellet
-
-    def collect_fruits(self):
-        """Coleta frutas para todos os jogadores ativos"""
-        # Lista de posições dos jogadores ativos
-        active_players = [self.pac_man_pos]  # Player 1 sempre ativo
-
-        # Adicionar Player 2 se estiver ativo
-        if self.game_mode in ["Player 2", "Player 3"]:
-            active_players.append(self.pac_man_2_pos)
+    def to_pixels(self, position):
+        """Converte a posição em ponto fixo (centro do agente) no canto do sprite em pixels"""
+        return ((position[0] - AGENT_CENTER_OFFSET) * self.scale / SUBSTEPS,
+                (position[1] - AGENT_CENTER_OFFSET) * self.scale / SUBSTEPS)
+
+    def _snapshot_positions(self):
+        """Guarda as posições dos agentes antes de um passo da lógica (base da interpolação)"""
+        self._previous_positions = {name: tuple(getattr(self, name)) for name in self.AGENT_POSITIONS}
+    
+    def _draw_position(self, name):
+        """Posição do agente para desenho, interpolada entre os dois últimos passos da lógica"""
+        current = getattr(self, name)
+        previous = self._previous_positions.get(name)
+        alpha = self.interpolation
+        if not alpha or previous is None:
+            return current
+        dx = current[0] - previous[0]
+        dy = current[1] - previous[1]
+        if abs(dx) > SUBSTEPS or abs(dy) > SUBSTEPS:
+            return current  # Túnel ou reinício: saltar, não deslizar pelo tabuleiro
+        return (previous[0] + dx * alpha, previous[1] + dy * alpha)
+
+    def _animation_frame(self):
+        """Quadro de animação desenhado (congelado entre trocas sob carga)"""
+        return self.sprite_frame if self.animation_hold is None else self.animation_hold
 
-        # Adicionar Player 3 se estiver ativo
-        if self.game_mode == "Player 3":
-            active_players.append(self.pac_man_3_pos)
-
-        # Verificar colisão com frutas ativas
-        collected_fruits = []
-        for pos, fruit_data in self.active_fruits.items():
-            x, y = pos
-            fruit_center_x = (x * self.scale) + (self.scale / 2)
-            fruit_center_y = (y * self.scale) + (self.scale / 2)
-            radius = self.scale / 2
-
-            # Verificar colisão com todos os jogadores ativos
-            for player_pos in active_players:
-                x_pac_man = player_pos[0] + (self.scale * 0.65)
-                y_pac_man = player_pos[1] + (self.scale * 0.65)
-
-                if (x_pac_man >= fruit_center_x - radius and x_pac_man <= fruit_center_x + radius and
-                    y_pac_man >= fruit_center_y - radius and y_pac_man <= fruit_center_y + radius):
-                    # Fruta coletada!
-                    fruit_points = self._get_fruit_points(fruit_data['type'])
-                    self.score += fruit_points
-                    collected_fruits.append(pos)
-                    break  # Sair do loop de jogadores se coletou a fruta
-
-        # Remover frutas coletadas
-        for pos in collected_fruits:
-            if pos in self.active_fruits:
-                del self.active_fruits[pos]
-    
-    def pacman_tunnel(self, position):
-        """Implementa túneis laterais"""
-        x_pos = position[0]
-        y_pos = position[1]
-        if position[0] >= self.scale * 27.5:
-            x_pos = 0 - (self.scale * 1.3)
-        elif position[0] <= -(self.scale * 1.3):
-            x_pos = self.scale * 27.5
-        return [x_pos, y_pos]
-    
     def _render_pacman(self, pos, direction, is_dead=False, player_num=1):
-        """Renderiza um Pacman individual com cor específica do player"""
-        x = pos[0]
-        y = pos[1]
-        
+        """Renderiza um Pacman individual com cor específica do player e retorna o retângulo desenhado"""
         if is_dead:
-            # Animação de morte
-            if self.sprite_frame <= 5:
-                self.window.blit(self.player_rotation(getattr(self, f"pac_man_{player_num}_6"), direction), (x, y))
-            elif self.sprite_frame <= 10:
-                self.window.blit(self.player_rotation(getattr(self, f"pac_man_{player_num}_7"), direction), (x, y))
-            elif self.sprite_frame <= 15:
-                self.window.blit(self.player_rotation(getattr(self, f"pac_man_{player_num}_8"), direction), (x, y))
-            elif self.sprite_frame <= 20:
-                self.window.blit(self.player_rotation(getattr(self, f"pac_man_{player_num}_9"), direction), (x, y))
-            elif self.sprite_frame <= 25:
-                self.window.blit(self.player_rotation(getattr(self, f"pac_man_{player_num}_10"), direction), (x, y))
-            elif self.sprite_frame <= 30:
-                self.window.blit(self.player_rotation(getattr(self, f"pac_man_{player_num}_11"), direction), (x, y))
-            elif self.sprite_frame <= 35:
-                self.window.blit(self.player_rotation(getattr(self, f"pac_man_{player_num}_12"), direction), (x, y))
-            elif self.sprite_frame <= 40:
-                self.window.blit(self.player_rotation(getattr(self, f"pac_man_{player_num}_13"), direction), (x, y))
-            elif self.sprite_frame <= 45:
-                self.window.blit(self.player_rotation(getattr(self, f"pac_man_{player_num}_14"), direction), (x, y))
-            elif self.sprite_frame <= 50:
-                self.window.blit(self.player_rotation(getattr(self, f"pac_man_{player_num}_15"), direction), (x, y))
-            elif self.sprite_frame <= 55:
-                self.window.blit(self.player_rotation(getattr(self, f"pac_man_{player_num}_16"), direction), (x, y))
-            elif self.sprite_frame <= 60:
-                self.window.blit(self.player_rotation(getattr(self, f"pac_man_{player_num}_17"), direction), (x, y))
+            animation = self.pacman_death_animations[player_num]  # Animação de morte
         else:
-            # Animação normal
-            if self.sprite_frame <= 6:
-                self.window.blit(self.player_rotation(getattr(self, f"pac_man_{player_num}_1"), direction), (x, y))
-            elif self.sprite_frame <= 12:
-                self.window.blit(self.player_rotation(getattr(self, f"pac_man_{player_num}_1"), direction), (x, y))
-            elif self.sprite_frame <= 18:
-                self.window.blit(self.player_rotation(getattr(self, f"pac_man_{player_num}_2"), direction), (x, y))
-            elif self.sprite_frame <= 24:
-                self.window.blit(self.player_rotation(getattr(self, f"pac_man_{player_num}_3"), direction), (x, y))
-            elif self.sprite_frame <= 30:
-                self.window.blit(self.player_rotation(getattr(self, f"pac_man_{player_num}_4"), direction), (x, y))
-            elif self.sprite_frame <= 36:
-                self.window.blit(self.player_rotation(getattr(self, f"pac_man_{player_num}_5"), direction), (x, y))
-            elif self.sprite_frame <= 42:
-                self.window.blit(self.player_rotation(getattr(self, f"pac_man_{player_num}_4"), direction), (x, y))
-            elif self.sprite_frame <= 48:
-                self.window.blit(self.player_rotation(getattr(self, f"pac_man_{player_num}_3"), direction), (x, y))
-            elif self.sprite_frame <= 54:
-                self.window.blit(self.player_rotation(getattr(self, f"pac_man_{player_num}_2"), direction), (x, y))
-            elif self.sprite_frame <= 60:
-                self.window.blit(self.player_rotation(getattr(self, f"pac_man_{player_num}_1"), direction), (x, y))
+            animation = self.pacman_animations[player_num]
+        sprites = animation.frame(self._animation_frame())
+        if sprites is None:
+            return None
+        rotation = SPRITE_DIRECTION_INDEX[direction[0] + 1][direction[1] + 1]
+        return self.window.blit(sprites[rotation], self.to_pixels(pos))
 
-    def player(self):
-        """Desenha e atualiza os Pacmans baseado no modo de jogo"""
-        # Player 1 (sempre ativo)
-        self.pac_man_direction, self.pac_man_next_direction = self.turning_corner(self.pac_man_pos, self.pac_man_direction, self.pac_man_next_direction)
-        self.pac_man_pos = self.collider(self.pac_man_pos, self.pac_man_direction)
-        self.pac_man_pos = self.pacman_tunnel(self.pac_man_pos)
-        self._render_pacman(self.pac_man_pos, self.pac_man_direction, self.end_game, 1)
-        
-        # Player 2 (se modo Player 2 ou Player 3)
+    def draw_players(self):
+        """Desenha os Pacmans ativos no modo de jogo atual e retorna os retângulos desenhados"""
+        rects = [self._render_pacman(self._draw_position('pac_man_pos'), self.pac_man_direction, self.end_game, 1)]
         if self.game_mode in ["Player 2", "Player 3"]:
-            self.pac_man_2_direction, self.pac_man_2_next_direction = self.turning_corner(self.pac_man_2_pos, self.pac_man_2_direction, self.pac_man_2_next_direction)
-            self.pac_man_2_pos = self.collider(self.pac_man_2_pos, self.pac_man_2_direction)
-            self.pac_man_2_pos = self.pacman_tunnel(self.pac_man_2_pos)
-            self._render_pacman(self.pac_man_2_pos, self.pac_man_2_direction, False, 2)
-        
-        # Player 3 (se modo Player 3)
+            rects.append(self._render_pacman(self._draw_position('pac_man_2_pos'), self.pac_man_2_direction, False, 2))
         if self.game_mode == "Player 3":
-            self.pac_man_3_direction, self.pac_man_3_next_direction = self.turning_corner(self.pac_man_3_pos, self.pac_man_3_direction, self.pac_man_3_next_direction)
-            self.pac_man_3_pos = self.collider(self.pac_man_3_pos, self.pac_man_3_direction)
-            self.pac_man_3_pos = self.pacman_tunnel(self.pac_man_3_pos)
-            self._render_pacman(self.pac_man_3_pos, self.pac_man_3_direction, False, 3)
-    
-    def distance_ghost_to_pac_man(self, ghost_pos):
-        """Calcula distância entre fantasma e Pacman"""
-        ghost_x = ghost_pos[0] + (self.scale * 0.65)
-        ghost_y = ghost_pos[1] + (self.scale * 0.65)
-        pac_man_x = self.pac_man_pos[0] + (self.scale * 0.65)
-        pac_man_y = self.pac_man_pos[1] + (self.scale * 0.65)
-        delta_x = (ghost_x - pac_man_x) ** 2
-        delta_y = (ghost_y - pac_man_y) ** 2
-        distance = (delta_x + delta_y) ** (1 / 2)
-        return distance
-    
-    def ghost_render(self, color, position):
-        """Desenha um fantasma baseado na cor e posição"""
-        x = position[0]
-        y = position[1]
-        if color == 'blue':
-            if self.sprite_frame <= 15:
-                self.window.blit(self.ghost_blue_down_right_0, (x, y))
-            elif self.sprite_frame <= 30:
-                self.window.blit(self.ghost_blue_down_right_1, (x, y))
-            elif self.sprite_frame <= 45:
-                self.window.blit(self.ghost_blue_down_right_0, (x, y))
-            elif self.sprite_frame <= 60:
-                self.window.blit(self.ghost_blue_down_right_1, (x, y))
-        elif color == 'orange':
-            if self.sprite_frame <= 15:
-                self.window.blit(self.ghost_orange_down_right_0, (x, y))
-            elif self.sprite_frame <= 30:
-                self.window.blit(self.ghost_orange_down_right_1, (x, y))
-            elif self.sprite_frame <= 45:
-                self.window.blit(self.ghost_orange_down_right_0, (x, y))
-            elif self.sprite_frame <= 60:
-                self.window.blit(self.ghost_orange_down_right_1, (x, y))
-        elif color == 'pink':
-            if self.sprite_frame <= 15:
-                self.window.blit(self.ghost_pink_down_right_0, (x, y))
-            elif self.sprite_frame <= 30:
-                self.window.blit(self.ghost_pink_down_right_1, (x, y))
-            elif self.sprite_frame <= 45:
-                self.window.blit(self.ghost_pink_down_right_0, (x, y))
-            elif self.sprite_frame <= 60:
-                self.window.blit(self.ghost_pink_down_right_1, (x, y))
-        elif color == 'red':
-            if self.sprite_frame <= 15:
-                self.window.blit(self.ghost_red_down_right_0, (x, y))
-            elif self.sprite_frame <= 30:
-                self.window.blit(self.ghost_red_down_right_1, (x, y))
-            elif self.sprite_frame <= 45:
-                self.window.blit(self.ghost_red_down_right_0, (x, y))
-            elif self.sprite_frame <= 60:
-                self.window.blit(self.ghost_red_down_right_1, (x, y))
-        elif color == 'harmless':
-            if self.sprite_frame <= 15:
-                self.window.blit(self.ghost_harmless_0, (x, y))
-            elif self.sprite_frame <= 30:
-                self.window.blit(self.ghost_harmless_1, (x, y))
-            elif self.sprite_frame <= 45:
-                self.window.blit(self.ghost_harmless_0, (x, y))
-            elif self.sprite_frame <= 60:
-                self.window.blit(self.ghost_harmless_1, (x, y))
-    
-    def random_direction_for_ghost(self):
-        """Gera direção aleatória para fantasma"""
-        move_up_or_sideways = random.randint(0, 1)
-        x_direction = random.randint(0, 1)
-        y_direction = random.randint(0, 1)
-        direction = []
-        if move_up_or_sideways == 0:
-            if x_direction == 0:
-                direction = [-self.scale/16, 0]
-            else:
-                direction = [self.scale/16, 0]
-        else:
-            if y_direction == 0:
-                direction = [0, -self.scale/16]
-            else:
-                direction = [0, self.scale/16]
-        return direction
-    
-    def random_next_direction_for_ghost(self, direction):
-        """Gera próxima direção aleatória para fantasma"""
-        new_direction = [0, 0]
-        if direction[0] != 0:
-            if random.randint(0, 1) == 0:
-                new_direction[1] = -self.scale/16
-            else:
-                new_direction[1] = self.scale/16
-        elif direction[1] != 0:
-            if random.randint(0, 1) == 0:
-                new_direction[0] = -self.scale/16
-            else:
-                new_direction[0] = self.scale/16
-        return new_direction
-    
-    def direction_ghost_to_pac_man(self, position, direction):
-        """Calcula direção para fantasma perseguir Pacman"""
-        new_direction = [0, 0]
-        ghost_x = position[0]
-        ghost_y = position[1]
-        pac_man_x = self.pac_man_pos[0]
-        pac_man_y = self.pac_man_pos[1]
-        delta_x = ghost_x - pac_man_x
-        delta_y = ghost_y - pac_man_y
-        if direction[1] != 0:
-            if delta_x <= 0:
-                new_direction[0] = self.scale/16
-            else:
-                new_direction[0] = -self.scale/16
-        if direction[0] != 0:
-            if delta_y <= 0:
-                new_direction[1] = self.scale/16
-            else:
-                new_direction[1] = -self.scale/16
-        return new_direction
-    
-    def direction_harmless_ghost_to_pac_man(self, position, direction):
-        """Calcula direção para fantasma fugir do Pacman"""
-        new_direction = [0, 0]
-        ghost_x = position[0]
-        ghost_y = position[1]
-        pac_man_x = self.pac_man_pos[0]
-        pac_man_y = self.pac_man_pos[1]
-        delta_x = ghost_x - pac_man_x
-        delta_y = ghost_y - pac_man_y
-        if direction[1] != 0:
-            if delta_x <= 0:
-                new_direction[0] = -self.scale/16
-            else:
-                new_direction[0] = self.scale/16
-        if direction[0] != 0:
-            if delta_y <= 0:
-                new_direction[1] = -self.scale/16
-            else:
-                new_direction[1] = self.scale/16
-        return new_direction
-    
-    def new_random_direction_for_ghost(self, position, direction):
-        """Gera nova direção aleatória para fantasma quando está preso"""
-        new_direction = [0, 0]
-        pos = [0, 0]
-        pos[0] = position[0]
-        pos[1] = position[1]
-        
-        if direction[0] != 0:
-            if random.randint(0, 1) == 0:
-                new_direction[1] = -self.scale/8
-            else:
-                new_direction[1] = self.scale/8
-        elif direction[1] != 0:
-            if random.randint(0, 1) == 0:
-                new_direction[0] = -self.scale/8
-            else:
-                new_direction[0] = self.scale/8
-        
-        new_position = self.collider(pos, new_direction)
-        
-        if position == new_position:
-            new_direction[0] *= -1
-            new_direction[1] *= -1
-            new_position = self.collider(pos, new_direction)
-        
-        new_direction[0] /= 2
-        new_direction[1] /= 2
-        
-        return new_position, new_direction
-    
-    def enhanced_ghost_intelligence(self, ghost_pos, ghost_direction, ghost_next_direction, distance_ghost_to_pac_man, harmless_ghost_mode, ghost_color='blue'):
-        """
-        Versão melhorada da ghost_intelligence que usa a IA aprimorada
-        """
-        if not hasattr(self, 'ghost_ai'):
-            self.ghost_ai = ImprovedGhostAI(self)
-        
-        # Usar a IA melhorada
-        return self.ghost_ai.improved_ghost_intelligence(
-            ghost_color, ghost_pos, ghost_direction, ghost_next_direction, distance_ghost_to_pac_man
-        )
-
-    def ghost_intelligence(self, ghost_pos, ghost_direction, ghost_next_direction, distance_ghost_to_pac_man, harmless_ghost_mode):
-        """IA do fantasma - decide movimento baseado na distância e modo"""
-        ghost_blue_pos = [0, 0]
-        ghost_blue_pos[0] = ghost_pos[0]
-        ghost_blue_pos[1] = ghost_pos[1]
-        distance_ghost_to_pac_man = self.distance_ghost_to_pac_man(ghost_pos)
-        if distance_ghost_to_pac_man <= self.scale * 10:
-            if harmless_ghost_mode:
-                ghost_next_direction = self.direction_harmless_ghost_to_pac_man(ghost_pos, ghost_direction)
-            else:
-                ghost_next_direction = self.direction_ghost_to_pac_man(ghost_pos, ghost_direction)
-            ghost_direction, ghost_next_direction = self.turning_corner(ghost_pos, ghost_direction, ghost_next_direction)
-        if ghost_direction == ghost_next_direction:
-            if harmless_ghost_mode:
-                ghost_next_direction = self.direction_harmless_ghost_to_pac_man(ghost_pos, ghost_direction)
-            else:
-                ghost_next_direction = self.direction_ghost_to_pac_man(ghost_pos, ghost_direction)
-            ghost_pos = self.collider(ghost_pos, ghost_direction)
-        ghost_pos = self.pacman_tunnel(ghost_pos)
-        ghost_pos = self.collider(ghost_pos, ghost_direction)
-        if ghost_blue_pos == ghost_pos:
-            ghost_pos, ghost_direction = self.new_random_direction_for_ghost(ghost_pos, ghost_direction)
-        return ghost_pos, ghost_direction, ghost_next_direction, distance_ghost_to_pac_man
-    
-    def ghost(self):
-        """Atualiza e move todos os fantasmas com IA melhorada"""
-        # Coletar posições de todos os fantasmas para comportamento cooperativo
-        all_ghost_positions = {
-            'blue': self.ghost_blue_pos,
-            'orange': self.ghost_orange_pos,
-            'pink': self.ghost_pink_pos,
-            'red': self.ghost_red_pos
-        }
-        
-        # Fantasma azul
-        if self.ghost_blue_pos != [self.scale * 12, self.scale * 13]:
-            output_1, output_2, output_3, output_4 = self.enhanced_ghost_intelligence(
-                self.ghost_blue_pos, self.ghost_blue_direction, 
-                self.ghost_blue_next_direction, self.distance_ghost_blue_to_pac_man, 
-                self.harmless_mode_ghost_blue, 'blue'
-            )
-            self.ghost_blue_pos = output_1
-            self.ghost_blue_direction = output_2
-            self.ghost_blue_next_direction = output_3
-            self.distance_ghost_blue_to_pac_man = output_4
-        
-        # Fantasma laranja
-        if self.ghost_orange_pos != [self.scale * 12, self.scale * 14.5]:
-            output_1, output_2, output_3, output_4 = self.enhanced_ghost_intelligence(
-                self.ghost_orange_pos, self.ghost_orange_direction, 
-                self.ghost_orange_next_direction, self.distance_ghost_orange_to_pac_man, 
-                self.harmless_mode_ghost_orange, 'orange'
-            )
-            self.ghost_orange_pos = output_1
-            self.ghost_orange_direction = output_2
-            self.ghost_orange_next_direction = output_3
-            self.distance_ghost_orange_to_pac_man = output_4
-        
-        # Fantasma rosa
-        if self.ghost_pink_pos != [self.scale * 14, self.scale * 13]:
-            output_1, output_2, output_3, output_4 = self.enhanced_ghost_intelligence(
-                self.ghost_pink_pos, self.ghost_pink_direction, 
-                self.ghost_pink_next_direction, self.distance_ghost_pink_to_pac_man, 
-                self.harmless_mode_ghost_pink, 'pink'
-            )
-            self.ghost_pink_pos = output_1
-            self.ghost_pink_direction = output_2
-            self.ghost_pink_next_direction = output_3
-            self.distance_ghost_pink_to_pac_man = output_4
-        
-        # Fantasma vermelho
-        if self.ghost_red_pos != [self.scale * 14, self.scale * 14.5]:
-            output_1, output_2, output_3, output_4 = self.enhanced_ghost_intelligence(
-                self.ghost_red_pos, self.ghost_red_direction, 
-                self.ghost_red_next_direction, self.distance_ghost_red_to_pac_man, 
-                self.harmless_mode_ghost_red, 'red'
-            )
-            self.ghost_red_pos = output_1
-            self.ghost_red_direction = output_2
-            self.ghost_red_next_direction = output_3
-            self.distance_ghost_red_to_pac_man = output_4
+            rects.append(self._render_pacman(self._draw_position('pac_man_3_pos'), self.pac_man_3_direction, False, 3))
+        return [rect for rect in rects if rect]
     
-    def moving_ghost_into_the_game(self, color):
-        """Move fantasma para o jogo quando sai da posição inicial"""
-        if color == 'blue':
-            self.ghost_blue_pos = [self.scale * 13.1, self.scale * 10.6]
-            self.ghost_blue_direction = self.random_direction_for_ghost()
-            self.ghost_blue_next_direction = self.random_next_direction_for_ghost(self.ghost_blue_direction)
-        elif color == 'orange':
-            self.ghost_orange_pos = [self.scale * 13.1, self.scale * 10.6]
-            self.ghost_orange_direction = self.random_direction_for_ghost()
-            self.ghost_orange_next_direction = self.random_next_direction_for_ghost(self.ghost_orange_direction)
-        elif color == 'pink':
-            self.ghost_pink_pos = [self.scale * 13.1, self.scale * 10.6]
-            self.ghost_pink_direction = self.random_direction_for_ghost()
-            self.ghost_pink_next_direction = self.random_next_direction_for_ghost(self.ghost_pink_direction)
-        elif color == 'red':
-            self.ghost_red_pos = [self.scale * 13.1, self.scale * 10.6]
-            self.ghost_red_direction = self.random_direction_for_ghost()
-            self.ghost_red_next_direction = self.random_next_direction_for_ghost(self.ghost_red_direction)
-    
-    def ghost_manager(self):
-        """Gerencia o estado dos fantasmas e modo inofensivo"""
-        if self.harmless_mode:
-            if self.sprite_frame == 60:
-                self.harmless_mode_timer += 1
-            if self.harmless_mode_timer == HARMLESS_MODE_DURATION:
-                self.harmless_mode = False
-                self.harmless_mode_ghost_blue = False
-                self.harmless_mode_ghost_orange = False
-                self.harmless_mode_ghost_pink = False
-                self.harmless_mode_ghost_red = False
-                self.harmless_mode_timer = 0
-        
-        # Renderizar fantasmas
+    def draw_ghosts(self):
+        """Desenha os fantasmas (com o sprite inofensivo quando vulneráveis) e retorna os retângulos desenhados"""
+        rects = []
         if self.harmless_mode_ghost_blue:
-            self.ghost_render('harmless', self.ghost_blue_pos)
+            rects.append(self.ghost_render('harmless', self._draw_position('ghost_blue_pos'), self.ghost_blue_direction))
         else:
-            self.ghost_render('blue', self.ghost_blue_pos)
+            rects.append(self.ghost_render('blue', self._draw_position('ghost_blue_pos'), self.ghost_blue_direction))
         
         if self.harmless_mode_ghost_orange:
-            self.ghost_render('harmless', self.ghost_orange_pos)
+            rects.append(self.ghost_render('harmless', self._draw_position('ghost_orange_pos'), self.ghost_orange_direction))
         else:
-            self.ghost_render('orange', self.ghost_orange_pos)
+            rects.append(self.ghost_render('orange', self._draw_position('ghost_orange_pos'), self.ghost_orange_direction))
         
         if self.harmless_mode_ghost_pink:
-            self.ghost_render('harmless', self.ghost_pink_pos)
+            rects.append(self.ghost_render('harmless', self._draw_position('ghost_pink_pos'), self.ghost_pink_direction))
         else:
-            self.ghost_render('pink', self.ghost_pink_pos)
+            rects.append(self.ghost_render('pink', self._draw_position('ghost_pink_pos'), self.ghost_pink_direction))
         
         if self.harmless_mode_ghost_red:
-            self.ghost_render('harmless', self.ghost_red_pos)
+            rects.append(self.ghost_render('harmless', self._draw_position('ghost_red_pos'), self.ghost_red_direction))
         else:
-            self.ghost_render('red', self.ghost_red_pos)
-        
-        # Mover fantasmas para o jogo quando necessário
-        if self.sprite_frame == 60:
-            if self.ghost_blue_pos == [self.scale * 12, self.scale * 13]:
-                self.moving_ghost_into_the_game('blue')
-            elif self.ghost_orange_pos == [self.scale * 12, self.scale * 14.5]:
-                self.moving_ghost_into_the_game('orange')
-            elif self.ghost_pink_pos == [self.scale * 14, self.scale * 13]:
-                self.moving_ghost_into_the_game('pink')
-            elif self.ghost_red_pos == [self.scale * 14, self.scale * 14.5]:
-                self.moving_ghost_into_the_game('red')
+            rects.append(self.ghost_render('red', self._draw_position('ghost_red_pos'), self.ghost_red_direction))
+        return [rect for rect in rects if rect]
     
-    def check_rectangular_collision(self, pacman_pos, ghost_pos):
-        """Verifica colisão retangular mais precisa entre Pacman e fantasma"""
-        # Área de colisão reduzida para maior precisão
-        collision_margin = self.scale * 0.4  # Margem menor para colisão mais precisa
-        
-        # Posições centrais dos sprites
-        pacman_center_x = pacman_pos[0] + (self.scale * 0.65)
-        pacman_center_y = pacman_pos[1] + (self.scale * 0.65)
-        ghost_center_x = ghost_pos[0] + (self.scale * 0.65)
-        ghost_center_y = ghost_pos[1] + (self.scale * 0.65)
-        
-        # Verificar se as áreas de colisão se sobrepõem
-        pacman_left = pacman_center_x - collision_margin
-        pacman_right = pacman_center_x + collision_margin
-        pacman_top = pacman_center_y - collision_margin
-        pacman_bottom = pacman_center_y + collision_margin
-        
-        ghost_left = ghost_center_x - collision_margin
-        ghost_right = ghost_center_x + collision_margin
-        ghost_top = ghost_center_y - collision_margin
-        ghost_bottom = ghost_center_y + collision_margin
-        
-        # Verificar sobreposição retangular
-        return (pacman_left < ghost_right and 
-                pacman_right > ghost_left and 
-                pacman_top < ghost_bottom and 
-                pacman_bottom > ghost_top)
-
-    def _check_pacman_ghost_collision(self, pacman_pos):
-        """Verifica colisão entre um Pacman específico e todos os fantasmas"""
-        # Colisão com fantasma azul
-        if self.check_rectangular_collision(pacman_pos, self.ghost_blue_pos):
-            if self.harmless_mode_ghost_blue:
-                self.ghost_blue_pos = [self.scale * 12, self.scale * 13]
-                self.harmless_mode_ghost_blue = False
-                self.distance_ghost_blue_to_pac_man = self.distance_ghost_to_pac_man(self.ghost_blue_pos)
-                self.score += GHOST_POINTS
-            else:
-                if self.end_game == False:
-                    self.sprite_frame = 0
-                    self.sprite_speed = 1
-                    self.lives -= 1
-                self.end_game = True
-            return True
-        
-        # Colisão com fantasma laranja
-        elif self.check_rectangular_collision(pacman_pos, self.ghost_orange_pos):
-            if self.harmless_mode_ghost_orange:
-                self.ghost_orange_pos = [self.scale * 12, self.scale * 14.5]
-                self.harmless_mode_ghost_orange = False
-                self.distance_ghost_orange_to_pac_man = self.distance_ghost_to_pac_man(self.ghost_orange_pos)
-                self.score += GHOST_POINTS
-            else:
-                if self.end_game == False:
-                    self.sprite_frame = 0
-                    self.sprite_speed = 1
-                    self.lives -= 1
-                self.end_game = True
-            return True
-        
-        # Colisão com fantasma rosa
-        elif self.check_rectangular_collision(pacman_pos, self.ghost_pink_pos):
-            if self.harmless_mode_ghost_pink:
-                self.ghost_pink_pos = [self.scale * 14, self.scale * 13]
-                self.harmless_mode_ghost_pink = False
-                self.distance_ghost_pink_to_pac_man = self.distance_ghost_to_pac_man(self.ghost_pink_pos)
-                self.score += GHOST_POINTS
-            else:
-                if self.end_game == False:
-                    self.sprite_frame = 0
-                    self.sprite_speed = 1
-                    self.lives -= 1
-                self.end_game = True
-            return True
-        
-        # Colisão com fantasma vermelho
-        elif self.check_rectangular_collision(pacman_pos, self.ghost_red_pos):
-            if self.harmless_mode_ghost_red:
-                self.ghost_red_pos = [self.scale * 14, self.scale * 14.5]
-                self.harmless_mode_ghost_red = False
-                self.distance_ghost_red_to_pac_man = self.distance_ghost_to_pac_man(self.ghost_red_pos)
-                self.score += GHOST_POINTS
-            else:
-                if self.end_game == False:
-                    self.sprite_frame = 0
-                    self.sprite_speed = 1
-                    self.lives -= 1
-                self.end_game = True
-            return True
-        
-        return False
-
-    def ghost_and_pacman_collider(self):
-        """Verifica colisões entre todos os Pacmans ativos e fantasmas"""
-        # Player 1 (sempre ativo)
-        if self._check_pacman_ghost_collision(self.pac_man_pos):
-            return
-        
-        # Player 2 (se modo Player 2 ou Player 3)
-        if self.game_mode in ["Player 2", "Player 3"]:
-            if self._check_pacman_ghost_collision(self.pac_man_2_pos):
-                return
-        
-        # Player 3 (se modo Player 3)
-        if self.game_mode == "Player 3":
-            if self._check_pacman_ghost_collision(self.pac_man_3_pos):
-                return
-    
-    def restart_ghost_collision(self):
-        """Reinicia após colisão com fantasma"""
-        if self.sprite_frame == 60 and self.end_game == True and self.lives > -1:
-            self.end_game = False
-            self.harmless_mode = False
-            self.harmless_mode_timer = 0
-            self.harmless_mode_ghost_blue = False
-            self.harmless_mode_ghost_orange = False
-            self.harmless_mode_ghost_pink = False
-            self.harmless_mode_ghost_red = False
-            self.pac_man_pos = [self.scale * 13.1, self.scale * 22.6]
-            self.pac_man_direction = [self.scale/16, 0]
-            self.pac_man_next_direction = [self.scale/16, 0]
-            self.ghost_blue_pos = [self.scale * 12, self.scale * 13]
-            self.ghost_orange_pos = [self.scale * 12, self.scale * 14.5]
-            self.ghost_pink_pos = [self.scale * 14, self.scale * 13]
-            self.ghost_red_pos = [self.scale * 14, self.scale * 14.5]
-            self.distance_ghost_blue_to_pac_man = self.distance_ghost_to_pac_man(self.ghost_blue_pos)
-            self.distance_ghost_orange_to_pac_man = self.distance_ghost_to_pac_man(self.ghost_orange_pos)
-            self.distance_ghost_pink_to_pac_man = self.distance_ghost_to_pac_man(self.ghost_pink_pos)
-            self.distance_ghost_red_to_pac_man = self.distance_ghost_to_pac_man(self.ghost_red_pos)
-            self.sprite_speed = SPRITE_SPEED
-            self.end_game = False
-    
-    def collect_all_dots(self):
-        """Verifica se todos os pontos foram coletados"""
-        count = 0
-        for y in range(len(self.map)):
-            for x in range(len(self.map[0])):
-                if self.map[y][x] == DOT or self.map[y][x] == POWER_PELLET:
-                    count += 1
-        if count == 0:
-            self.end_game = False
-            self.harmless_mode = False
-            self.harmless_mode_timer = 0
-            self.harmless_mode_ghost_blue = False
-            self.harmless_mode_ghost_orange = False
-            self.harmless_mode_ghost_pink = False
-            self.harmless_mode_ghost_red = False
-            self.pac_man_pos = [self.scale * 13.1, self.scale * 22.6]
-            self.pac_man_direction = [self.scale/16, 0]
-            self.pac_man_next_direction = [self.scale/16, 0]
-            self.ghost_blue_pos = [self.scale * 12, self.scale * 13]
-            self.ghost_orange_pos = [self.scale * 12, self.scale * 14.5]
-            self.ghost_pink_pos = [self.scale * 14, self.scale * 13]
-            self.ghost_red_pos = [self.scale * 14, self.scale * 14.5]
-            self.distance_ghost_blue_to_pac_man = self.distance_ghost_to_pac_man(self.ghost_blue_pos)
-            self.distance_ghost_orange_to_pac_man = self.distance_ghost_to_pac_man(self.ghost_orange_pos)
-            self.distance_ghost_pink_to_pac_man = self.distance_ghost_to_pac_man(self.ghost_pink_pos)
-            self.distance_ghost_red_to_pac_man = self.distance_ghost_to_pac_man(self.ghost_red_pos)
-            self.sprite_speed = SPRITE_SPEED
-            self.end_game = False
-            self.map = [row[:] for row in GAME_MAP]
-
-            # Reinicializar frutas
-            self._initialize_fruits()
+    def ghost_render(self, color, position, direction=(0, 0)):
+        """Desenha um fantasma baseado na cor, posição e direção e retorna o retângulo desenhado"""
+        sprites = self.ghost_animations[color].frame(self._animation_frame())
+        if sprites is None:
+            return None
+        look = SPRITE_DIRECTION_INDEX[direction[0] + 1][direction[1] + 1]
+        return self.window.blit(sprites[look], self.to_pixels(position))
     
     def scoreboard(self):
-        """Desenha a pontuação, vidas e modo de jogo"""
-        score_text = self.font.render(f'Score: {str(self.score)}', 1, self.white)
-        lives_text = self.font.render(f'Lives: {str(max(self.lives, 0))}X', 1, self.white)
-        mode_text = self.font.render(f'Mode: {self.game_mode}', 1, self.white)
+        """Desenha a pontuação, vidas e modo de jogo e retorna os retângulos desenhados"""
+        self._hud_blits = []
+        rects = []
+        score_text = self.text_cache.render(f'Score: {str(self.score)}', self.white)
+        lives_text = self.text_cache.render(f'Lives: {str(max(self.lives, 0))}X', self.white)
+        mode_text = self.text_cache.render(f'Mode: {self.game_mode}', self.white)
         
         x_score_pos = (self.window.get_width() / 2) - (score_text.get_width() / 2)
         y_score_pos = self.scale * 30.75
@@ -1577,25 +559,28 @@ class PacMan:
         x_mode_pos = (self.window.get_width() / 2) - (mode_text.get_width() / 2)
         y_mode_pos = self.scale * 35.25
         
-        self.window.blit(score_text, (x_score_pos, y_score_pos))
-        self.window.blit(lives_text, (x_lives_pos, y_lives_pos))
-        self.window.blit(mode_text, (x_mode_pos, y_mode_pos))
+        rects.append(self._blit_hud(score_text, (x_score_pos, y_score_pos)))
+        rects.append(self._blit_hud(lives_text, (x_lives_pos, y_lives_pos)))
+        rects.append(self._blit_hud(mode_text, (x_mode_pos, y_mode_pos)))
         
-        # Mostrar status dos controles
-        self._draw_controller_status()
+        # Mostrar status dos controles (oculto sob carga)
+        if self.pacing.level < PACING_SKIP_CONTROLLER_PANEL:
+            rects.extend(self._draw_controller_status())
         
         if self.lives == -1:
-            end_text = self.font.render('game', 1, self.white)
-            game_text = self.font.render('over', 1, self.white)
+            end_text = self.text_cache.render('game', self.white)
+            game_text = self.text_cache.render('over', self.white)
             x_end_pos = (self.window.get_width() / 2) - (end_text.get_width() / 2)
             y_end_pos = self.scale * 12.25
             x_game_pos = (self.window.get_width() / 2) - (game_text.get_width() / 2)
             y_game_pos = self.scale * 13.75
-            self.window.blit(end_text, (x_end_pos, y_end_pos))
-            self.window.blit(game_text, (x_game_pos, y_game_pos))
+            rects.append(self._blit_hud(end_text, (x_end_pos, y_end_pos)))
+            rects.append(self._blit_hud(game_text, (x_game_pos, y_game_pos)))
+        return rects
     
     def _draw_controller_status(self):
-        """Desenha o status dos controles e teclas para jogadores ativos"""
+        """Desenha o status dos controles e teclas para jogadores ativos e retorna os retângulos desenhados"""
+        rects = []
         controller_count = self.controller_manager.get_controller_count()
         
         # Mostrar instruções de teclado para jogadores ativos
@@ -1603,35 +588,35 @@ class PacMan:
         
         # Player 1 (sempre ativo)
         player1_text = "P1: WASD"
-        player1_display = self.font.render(player1_text, 1, self.white)
+        player1_display = self.text_cache.render(player1_text, self.white)
         player1_x = (self.window.get_width() / 2) - (player1_display.get_width() / 2)
-        self.window.blit(player1_display, (player1_x, y_offset))
+        rects.append(self._blit_hud(player1_display, (player1_x, y_offset)))
         y_offset += self.scale * 0.8
         
         # Player 2 (se modo Player 2 ou Player 3)
         if self.game_mode in ["Player 2", "Player 3"]:
             player2_text = "P2: Arrow Keys"
-            player2_display = self.font.render(player2_text, 1, self.white)
+            player2_display = self.text_cache.render(player2_text, self.white)
             player2_x = (self.window.get_width() / 2) - (player2_display.get_width() / 2)
-            self.window.blit(player2_display, (player2_x, y_offset))
+            rects.append(self._blit_hud(player2_display, (player2_x, y_offset)))
             y_offset += self.scale * 0.8
         
         # Player 3 (se modo Player 3)
         if self.game_mode == "Player 3":
             player3_text = "P3: IJKL"
-            player3_display = self.font.render(player3_text, 1, self.white)
+            player3_display = self.text_cache.render(player3_text, self.white)
             player3_x = (self.window.get_width() / 2) - (player3_display.get_width() / 2)
-            self.window.blit(player3_display, (player3_x, y_offset))
+            rects.append(self._blit_hud(player3_display, (player3_x, y_offset)))
             y_offset += self.scale * 0.8
         
         # Mostrar controles USB se conectados
         if controller_count > 0:
             controllers_text = f"Controllers: {controller_count}"
-            controller_display = self.font.render(controllers_text, 1, (0, 255, 255))  # Cor ciano para destacar
+            controller_display = self.text_cache.render(controllers_text, (0, 255, 255))  # Cor ciano para destacar
             controller_x = (self.window.get_width() / 2) - (controller_display.get_width() / 2)
             y_offset += self.scale * 0.4  # Espaço extra antes dos controles
             
-            self.window.blit(controller_display, (controller_x, y_offset))
+            rects.append(self._blit_hud(controller_display, (controller_x, y_offset)))
             y_offset += self.scale * 0.8
             
             # Mostrar mapeamento de controles para jogadores ativos
@@ -1654,17 +639,116 @@ class PacMan:
                             controller_name = controller_name[:12] + "..."
                         
                         player_text = f"P{player_num} Controller: {controller_name}"
-                        player_display = self.font.render(player_text, 1, (0, 255, 255))
+                        player_display = self.text_cache.render(player_text, (0, 255, 255))
                         player_x = (self.window.get_width() / 2) - (player_display.get_width() / 2)
                         player_y = y_offset
                         
-                        self.window.blit(player_display, (player_x, player_y))
+                        rects.append(self._blit_hud(player_display, (player_x, player_y)))
                         y_offset += self.scale * 0.8
+        return rects
+    
+    def _blit_hud(self, surface, pos):
+        """Desenha um texto do placar e o guarda para _redraw_hud"""
+        self._hud_blits.append((surface, pos))
+        return self.window.blit(surface, pos)
+    
+    def _redraw_hud(self):
+        """Repete os textos do último scoreboard sem recalculá-los e retorna os retângulos"""
+        return [self.window.blit(surface, pos) for surface, pos in self._hud_blits]
+    
+    def _hud_due(self, hud_key):
+        """Indica se o placar mudou e pode ser atualizado (sob carga, só a cada PACING_HUD_INTERVAL frames)"""
+        if hud_key == self._hud_state:
+            return False
+        return self.pacing.level < PACING_SKIP_HUD or self.frame_count % PACING_HUD_INTERVAL == 0
+    
+    def draw_frame(self):
+        """Desenha o frame completo (o tabuleiro cobre a janela inteira)
+        
+        Sob carga (PACING_SKIP_HUD) o placar é repetido do último frame e só
+        é refeito a cada PACING_HUD_INTERVAL frames, como em draw_dirty_frame.
+        """
+        self.board()
+        self.draw_players()
+        self.draw_ghosts()
+        hud_key = self._hud_key()
+        if self.pacing.level >= PACING_SKIP_HUD and self._hud_blits and not self._hud_due(hud_key):
+            self._redraw_hud()
+        else:
+            self.scoreboard()
+            self._hud_state = hud_key
+    
+    def invalidate_frame(self):
+        """Força um frame completo no próximo draw_dirty_frame (a janela foi usada por outra tela)"""
+        self._sprite_rects = None
+        self.render_target.invalidate()
+    
+    def _hud_key(self):
+        """Estado que define os textos do placar"""
+        return (self.score, max(self.lives, 0), self.lives == -1, self.game_mode,
+                self.controller_manager.get_controller_count(),
+                self.pacing.level >= PACING_SKIP_CONTROLLER_PANEL)
+    
+    def _restore(self, layer, rects):
+        """Restaura áreas da janela a partir da camada do tabuleiro"""
+        for rect in rects:
+            self.window.blit(layer, rect, rect)
+    
+    def _draw_sprites(self):
+        """Desenha frutas, Pacmans e fantasmas e retorna os retângulos desenhados"""
+        return self.draw_fruits() + self.draw_players() + self.draw_ghosts()
+    
+    def draw_dirty_frame(self):
+        """Redesenha apenas o que mudou e retorna os retângulos para pg.display.update
+        
+        As áreas dos sprites e frutas do frame anterior e os pontos coletados
+        são restaurados a partir da camada do tabuleiro; em seguida todos os
+        sprites são desenhados de novo na mesma ordem do frame completo. O
+        placar só é redesenhado quando seu texto muda ou algum sprite passa
+        por cima dele. O resultado na janela é idêntico ao de draw_frame.
+        """
+        layer = self.board_renderer.update(self.map, self.dot_index)
+        hud_key = self._hud_key()
+        
+        if self._sprite_rects is None or self.board_renderer.rebuilt:
+            # Primeiro frame ou nível novo: desenhar tudo
+            self.window.blit(layer, (0, 0))
+            self._sprite_rects = self._draw_sprites()
+            self._hud_rects = self.scoreboard()
+            self._hud_state = hud_key
+            return [self.window.get_rect()]
+        
+        restore = self._sprite_rects + self.board_renderer.changed_rects
+        hud_dirty = self._hud_due(hud_key) or self._overlaps_hud(restore)
+        if hud_dirty:
+            restore += self._hud_rects
+        self._restore(layer, restore)
+        sprite_rects = self._draw_sprites()
+        
+        if not hud_dirty and self._overlaps_hud(sprite_rects):
+            # Sprite entrou na área do placar: refazer a área com o placar por cima
+            hud_dirty = True
+            restore += self._hud_rects + sprite_rects
+            self._restore(layer, self._hud_rects + sprite_rects)
+            sprite_rects = self._draw_sprites()
+        
+        dirty = restore + sprite_rects
+        if hud_dirty:
+            self._hud_rects = self.scoreboard()
+            self._hud_state = hud_key
+            dirty += self._hud_rects
+        self._sprite_rects = sprite_rects
+        return dirty
+    
+    def _overlaps_hud(self, rects):
+        """Indica se algum dos retângulos cruza um texto do placar"""
+        return any(rect.collidelist(self._hud_rects) != -1 for rect in rects)
     
     def show_mode_selection(self):
         """Mostra o menu de seleção de modo"""
-        menu = MenuSelector(self.scale)
-        selected_mode = menu.run_menu_loop(self.window)
+        # O menu desenha direto na janela, na escala dela
+        menu = MenuSelector(self.window_scale)
+        selected_mode = menu.run_menu_loop(self.render_target.display)
         
         if selected_mode == 'quit':
             return False
@@ -1672,86 +756,98 @@ class PacMan:
             self.game_mode = selected_mode
             return True
     
-    def _show_start_countdown(self):
-        """Mostra contagem regressiva de 2 segundos antes de iniciar o jogo"""
-        import time
-        
-        # Criar fonte maior para a contagem regressiva
-        countdown_font = pg.font.SysFont("Courier New", self.scale * 4, bold=True)
+    def enable_profiler(self, path, capacity=PROFILER_FRAMES):
+        """Liga o profiler de frames; os tempos são salvos em path (CSV ou .json)
         
-        for i in range(3, 0, -1):
-            # Limpar a tela
-            self.clear_window()
-            
-            # Desenhar o tabuleiro
-            self.board()
-            
-            # Desenhar texto da contagem regressiva
-            countdown_text = countdown_font.render(str(i), 1, self.white)
-            x_pos = (self.window.get_width() / 2) - (countdown_text.get_width() / 2)
-            y_pos = (self.window.get_height() / 2) - (countdown_text.get_height() / 2)
-            self.window.blit(countdown_text, (x_pos, y_pos))
-            
-            # Atualizar a tela
-            pg.display.update()
-            
-            # Pausar por 1 segundo
-            time.sleep(1)
+        Cada etapa soma o tempo dos métodos que a compõem, da lógica e do
+        desenho: 'player' é o movimento e o desenho dos Pacmans, 'fruits' o
+        surgimento, a coleta e o desenho das frutas, e assim por diante.
+        """
+        self.profiler = FrameProfiler(PROFILER_STAGES, capacity)
+        self.profile_path = path
+        stages = {
+            'input': [(self, 'handle_events'), (self, 'handle_controller_input')],
+            'board': [(self, 'board'), (self.board_renderer, 'update'), (self, '_restore')],
+            'fruits': [(self, '_update_fruits'), (self, 'collect_fruits'), (self, 'draw_fruits')],
+            'player': [(self, 'player'), (self, 'draw_players')],
+            'ghost': [(self, 'ghost'), (self, 'draw_ghosts')],
+            'collection': [(self, 'collect_dots'), (self, 'collect_all_dots')],
+            'ghost_manager': [(self, 'ghost_manager')],
+            'collision': [(self, 'ghost_and_pacman_collider'), (self, 'restart_ghost_collision')],
+            'hud': [(self, 'scoreboard'), (self, 'draw_transition_frame')],
+            'present': [(self.render_target, 'present')],
+        }
+        for stage, methods in stages.items():
+            for owner, name in methods:
+                self.profiler.instrument(owner, name, stage)
+    
+    def save_profile(self):
+        """Salva os tempos do profiler no arquivo configurado e retorna quantos frames foram salvos"""
+        self.profiler.export(self.profile_path)
+        return min(self.profiler.frames, self.profiler.capacity)
+    
+    def handle_controller_event(self, event):
+        """Atualiza o estado dos controles com um evento de joystick (botões e conexões)"""
+        pressed = self.controller_manager.handle_event(event)
+        self.controller_connected = self.controller_manager.get_controller_count() > 0
+        if pressed == (self.player_controllers[1], ControllerButton.START):
+            self.restart()
+    
+    def handle_events(self):
+        """Processa a fila de eventos da janela e do teclado; retorna False para sair"""
+        running = True
+        for event in pg.event.get():
+            if event.type == pg.QUIT:
+                running = False
+            self.render_target.handle_event(event)
+            if event.type in ControllerManager.EVENT_TYPES:
+                self.handle_controller_event(event)
+            elif event.type == pg.KEYDOWN:
+                key = pg.key.name(event.key)
+                self.move(key)
+                if key == 'escape':
+                    running = False
+                elif key == PROFILER_DUMP_KEY and self.profiler:
+                    self.save_profile()
+        return running
+    
+    def advance(self, elapsed):
+        """Avança as transições e a lógica pelo tempo real decorrido (em segundos)
         
-        # Mostrar "GO!" por 0.5 segundos
-        go_text = countdown_font.render("GO", 1, self.white)
-        x_pos = (self.window.get_width() / 2) - (go_text.get_width() / 2)
-        y_pos = (self.window.get_height() / 2) - (go_text.get_height() / 2)
+        Fora da contagem e da pausa de fim de nível, a lógica roda em passos
+        fixos; os passos que mudam o estado da partida (morte, renascimento,
+        nível limpo) disparam a transição correspondente.
+        """
+        self.flow.update(elapsed)
+        if not self.flow.simulating:
+            self.timestep.reset()
+            self.interpolation = 0.0
+            return
         
-        self.clear_window()
-        self.board()
-        self.window.blit(go_text, (x_pos, y_pos))
-        pg.display.update()
-        time.sleep(0.5)
-    
-    def restart(self):
-        """Reinicia o jogo"""
-        self.sprite_frame = 0
-        self.sprite_speed = SPRITE_SPEED
-        self.score = 0
-        self.lives = 5
-        self.end_game = False
-        self.harmless_mode = False
-        self.harmless_mode_timer = 0
-        self.harmless_mode_ghost_blue = False
-        self.harmless_mode_ghost_orange = False
-        self.harmless_mode_ghost_pink = False
-        self.harmless_mode_ghost_red = False
-        self.pac_man_pos = [self.scale * 13.1, self.scale * 22.6]
-        self.pac_man_direction = [self.scale/16, 0]
-        self.pac_man_next_direction = [self.scale/16, 0]
-        self.pac_man_2_pos = [self.scale * 12.1, self.scale * 22.6]
-        self.pac_man_2_direction = [0, 0]
-        self.pac_man_2_next_direction = [0, 0]
-        self.pac_man_3_pos = [self.scale * 14.1, self.scale * 22.6]
-        self.pac_man_3_direction = [0, 0]
-        self.pac_man_3_next_direction = [0, 0]
-        self.ghost_blue_pos = [self.scale * 12, self.scale * 13]
-        self.ghost_orange_pos = [self.scale * 12, self.scale * 14.5]
-        self.ghost_pink_pos = [self.scale * 14, self.scale * 13]
-        self.ghost_red_pos = [self.scale * 14, self.scale * 14.5]
-        self.ghost_blue_direction = [0, 0]
-        self.ghost_orange_direction = [0, 0]
-        self.ghost_pink_direction = [0, 0]
-        self.ghost_red_direction = [0, 0]
-        self.ghost_blue_next_direction = [0, 0]
-        self.ghost_orange_next_direction = [0, 0]
-        self.ghost_pink_next_direction = [0, 0]
-        self.ghost_red_next_direction = [0, 0]
-        self.distance_ghost_blue_to_pac_man = self.distance_ghost_to_pac_man(self.ghost_blue_pos)
-        self.distance_ghost_orange_to_pac_man = self.distance_ghost_to_pac_man(self.ghost_orange_pos)
-        self.distance_ghost_pink_to_pac_man = self.distance_ghost_to_pac_man(self.ghost_pink_pos)
-        self.distance_ghost_red_to_pac_man = self.distance_ghost_to_pac_man(self.ghost_red_pos)
-        self.map = [row[:] for row in GAME_MAP]
-        self.game_mode = "Player 1"  # Reset para modo padrão
-
-        # Reinicializar frutas
-        self._initialize_fruits()
+        dot_index = self.dot_index
+        for _ in range(self.timestep.advance(elapsed)):
+            self._snapshot_positions()
+            self.step()
+            if self.dot_index is not dot_index:
+                # Nível limpo (o próximo já foi carregado): pausar antes de continuar
+                self.flow.enter(WON, LEVEL_CLEAR_TIME)
+                break
+            if self.end_game and self.flow.state == PLAYING:
+                self.flow.enter(FAILED)
+            elif not self.end_game and self.flow.state == FAILED:
+                # Renasceu após a animação de morte
+                self.flow.enter(STARTING, COUNTDOWN_GO_TIME)
+                break
+        self.interpolation = self.timestep.alpha if INTERPOLATE_POSITIONS and self.flow.simulating else 0.0
+    
+    def draw_transition_frame(self, label):
+        """Desenha o frame completo com o texto da transição centralizado por cima"""
+        self.draw_frame()
+        text = self.countdown_text_cache.render(label, self.white)
+        x_pos = (self.window.get_width() / 2) - (text.get_width() / 2)
+        y_pos = (self.window.get_height() / 2) - (text.get_height() / 2)
+        self.window.blit(text, (x_pos, y_pos))
+        self._sprite_rects = None  # O texto sai no próximo frame completo
     
     def run(self):
         """Loop principal do jogo"""
@@ -1759,42 +855,64 @@ class PacMan:
         if not self.show_mode_selection():
             return
         
-        # Pausa inicial de 2 segundos com contagem regressiva
-        self._show_start_countdown()
+        # O menu consumiu a fila de eventos: reler os controles uma vez
+        self.controller_manager.sync()
+        self.controller_connected = self.controller_manager.get_controller_count() > 0
+        
+        # Contagem regressiva dentro do loop (a janela continua respondendo)
+        self.flow.enter(STARTING, START_COUNTDOWN + COUNTDOWN_GO_TIME)
+        self.invalidate_frame()
         
+        # A lógica avança em passos fixos pelo tempo real decorrido; o desenho
+        # acontece uma vez por volta, na taxa que o display permitir
+        self.timestep.reset()
+        last_time = time.perf_counter()
+        profiler = self.profiler
         running = True
         while running:
-            for event in pg.event.get():
-                if event.type == pg.QUIT:
-                    running = False
-                if event.type == pg.KEYDOWN:
-                    self.move(pg.key.name(event.key))
-                    if pg.key.name(event.key) == 'escape':
-                        running = False
+            if profiler:
+                profiler.begin_frame()
+            running = self.handle_events()
             
-            # Atualizar jogo
-            self.clock.tick(FPS)
-            self.clear_window()
-            self.board()
-            self.animation_step()
-
-            # Atualizar frutas (spawn e expiração)
-            self._update_fruits()
-
-            self.player()
-            self.ghost()
-            self.collect_dots()
-            self.collect_fruits()  # Coletar frutas
-            self.ghost_manager()
-            self.ghost_and_pacman_collider()
-            self.scoreboard()
-            self.restart_ghost_collision()
-            self.collect_all_dots()
+            # Atualizar jogo (zero, um ou vários passos conforme o tempo real)
+            self.clock.tick(MAX_RENDER_FPS)
+            now = time.perf_counter()
+            self.advance(now - last_time)
+            wall_time = now - last_time
+            last_time = now
+            self.frame_count += 1
+            
+            # Trabalho opcional conforme a carga (a lógica acima nunca é pulada)
+            level = self.pacing.level
+            render = level < PACING_SKIP_FRAMES or self.frame_count % PACING_FRAME_SKIP == 0
+            if level < PACING_REDUCE_ANIMATION:
+                self.animation_hold = None
+            elif self.animation_hold is None or self.frame_count % PACING_ANIMATION_INTERVAL == 0:
+                self.animation_hold = self.sprite_frame
+            
+            # Desenhar o estado resultante
+            if render:
+                label = self.flow.label()
+                dirty_rects = None
+                if label is not None:
+                    self.draw_transition_frame(label)
+                elif self.dirty_rendering:
+                    dirty_rects = self.draw_dirty_frame()
+                else:
+                    self.draw_frame()
             
             # Processar entrada dos controles
             self.handle_controller_input()
             
-            pg.display.update()
+            if render:
+                self.render_target.present(dirty_rects)
+            if ADAPTIVE_PACING:
+                self.pacing.record(wall_time, time.perf_counter() - now)
+            if profiler:
+                profiler.end_frame()
+        
+        if profiler:
+            self.save_profile()
         
         # Limpar recursos dos controles
         self.controller_manager.cleanup()
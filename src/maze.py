@@ -0,0 +1,258 @@
+"""
+Estruturas pré-calculadas do labirinto do Pac-Man
+Distâncias de caminho mínimo entre tiles transitáveis
+"""
+
+from array import array
+from collections import deque
+from .constants import WALL
+from .table_cache import load_tables, save_tables
+
+
+# Direções em tiles (direita, baixo, esquerda, cima)
+TILE_DIRECTIONS = [(1, 0), (0, 1), (-1, 0), (0, -1)]
+
+# Cache por layout de paredes: o labirinto não muda entre níveis
+_distance_cache = {}
+_junction_cache = {}
+
+
+def wall_layout(game_map):
+    """Chave do layout de paredes do mapa (ignora pontos, frutas e demais células)"""
+    return tuple(''.join('#' if cell == WALL else ' ' for cell in row) for row in game_map)
+
+
+class MazeDistances:
+    """Distâncias reais (em tiles) entre todos os pares de tiles transitáveis
+
+    As distâncias são calculadas com uma BFS a partir de cada tile quando o
+    mapa é carregado e guardadas numa matriz uint16 (array 'H'), junto com a
+    direção do primeiro passo de cada caminho mínimo. As consultas
+    distance() e best_step() são O(1). O túnel lateral é tratado como
+    ligação entre a primeira e a última coluna de uma mesma linha.
+    """
+
+    UNREACHABLE = 0xFFFF
+    NO_STEP = -1
+    TABLE_VERSION = 1  # Incrementar ao mudar o cálculo (invalida o cache em disco)
+
+    def __init__(self, game_map, tables=None):
+        """Calcula as tabelas de distância e de próximo passo (ou usa tables já calculadas)"""
+        self.height = len(game_map)
+        self.width = len(game_map[0]) if self.height > 0 else 0
+
+        # Tiles transitáveis e seus índices compactos
+        self.tiles = []
+        self.tile_index = {}
+        for y in range(self.height):
+            for x in range(self.width):
+                if game_map[y][x] != WALL:
+                    self.tile_index[(x, y)] = len(self.tiles)
+                    self.tiles.append((x, y))
+
+        self.neighbors = [self._tile_neighbors(tile) for tile in self.tiles]
+
+        count = len(self.tiles)
+        if tables is not None and all(len(table) == count * count for table in tables):
+            self.distances, self.next_steps = tables
+        else:
+            self.distances = array('H', [self.UNREACHABLE]) * (count * count)
+            self.next_steps = array('b', [self.NO_STEP]) * (count * count)
+            for source in range(count):
+                self._breadth_first_search(source)
+
+        self.nearest = self._build_nearest_walkable()
+
+    @classmethod
+    def for_map(cls, game_map):
+        """Retorna as tabelas do mapa, reaproveitando o cálculo se as paredes não mudaram
+
+        Fora do cache da execução, as tabelas são lidas do cache em disco
+        (chave: sha1 do layout); só na primeira execução com um layout novo
+        as buscas são feitas e gravadas.
+        """
+        key = wall_layout(game_map)
+        if key not in _distance_cache:
+            disk_key = (*key, cls.TABLE_VERSION)
+            tables = load_tables("maze", disk_key, "Hb")
+            maze = cls(game_map, tables)
+            if tables is None or maze.distances is not tables[0]:  # Calculadas agora
+                save_tables("maze", disk_key, [maze.distances, maze.next_steps])
+            _distance_cache[key] = maze
+        return _distance_cache[key]
+
+    def _tile_neighbors(self, tile):
+        """Lista (índice do vizinho, índice da direção) de um tile, com wrap do túnel"""
+        x, y = tile
+        result = []
+        for direction, (dx, dy) in enumerate(TILE_DIRECTIONS):
+            nx, ny = x + dx, y + dy
+            if dy == 0:
+                nx %= self.width  # Túnel lateral
+            neighbor = self.tile_index.get((nx, ny))
+            if neighbor is not None:
+                result.append((neighbor, direction))
+        return result
+
+    def _breadth_first_search(self, source):
+        """Preenche a linha da matriz correspondente a um tile de origem"""
+        count = len(self.tiles)
+        row = source * count
+        distances = self.distances
+        next_steps = self.next_steps
+        neighbors = self.neighbors
+
+        distances[row + source] = 0
+        queue = deque()
+        for neighbor, direction in neighbors[source]:
+            if distances[row + neighbor] == self.UNREACHABLE:
+                distances[row + neighbor] = 1
+                next_steps[row + neighbor] = direction
+                queue.append(neighbor)
+
+        while queue:
+            current = queue.popleft()
+            next_distance = distances[row + current] + 1
+            first_step = next_steps[row + current]
+            for neighbor, _ in neighbors[current]:
+                if distances[row + neighbor] == self.UNREACHABLE:
+                    distances[row + neighbor] = next_distance
+                    next_steps[row + neighbor] = first_step
+                    queue.append(neighbor)
+
+    def _build_nearest_walkable(self):
+        """Associa cada tile do mapa (inclusive paredes) ao tile transitável mais próximo"""
+        nearest = {}
+        queue = deque()
+        for tile, index in self.tile_index.items():
+            nearest[tile] = index
+            queue.append(tile)
+        while queue:
+            x, y = queue.popleft()
+            for dx, dy in TILE_DIRECTIONS:
+                neighbor = (x + dx, y + dy)
+                if (0 <= neighbor[0] < self.width and 0 <= neighbor[1] < self.height and
+                        neighbor not in nearest):
+                    nearest[neighbor] = nearest[(x, y)]
+                    queue.append(neighbor)
+        return nearest
+
+    def walkable_index(self, tile):
+        """Índice do tile transitável mais próximo (None se fora do mapa)
+
+        Colunas fora do mapa (agente dentro do túnel) dão a volta no eixo x.
+        """
+        return self.nearest.get((tile[0] % self.width, tile[1]))
+
+    def distance(self, tile_a, tile_b):
+        """Distância em tiles entre dois tiles (None se não houver caminho)"""
+        a = self.walkable_index(tile_a)
+        b = self.walkable_index(tile_b)
+        if a is None or b is None:
+            return None
+        distance = self.distances[a * len(self.tiles) + b]
+        if distance == self.UNREACHABLE:
+            return None
+        return distance
+
+    def best_step(self, tile_a, tile_b):
+        """Direção (dx, dy) do primeiro passo de um caminho mínimo de tile_a até tile_b
+
+        Retorna None se os tiles coincidem ou se não há caminho.
+        """
+        a = self.walkable_index(tile_a)
+        b = self.walkable_index(tile_b)
+        if a is None or b is None:
+            return None
+        step = self.next_steps[a * len(self.tiles) + b]
+        if step == self.NO_STEP:
+            return None
+        return TILE_DIRECTIONS[step]
+
+
+class JunctionGraph:
+    """Grafo comprimido do labirinto
+
+    Os nós ficam nos cruzamentos (3 ou 4 saídas) e becos sem saída (1 saída);
+    os tiles de corredor (2 saídas) viram arestas com o comprimento em tiles.
+    O túnel lateral liga a primeira e a última coluna da mesma linha. Só
+    faz sentido tomar decisões de rota ao chegar num nó; nos corredores o
+    agente apenas segue a única saída à frente.
+    """
+
+    def __init__(self, game_map):
+        """Constrói os nós e as arestas a partir do mapa"""
+        self.height = len(game_map)
+        self.width = len(game_map[0]) if self.height > 0 else 0
+
+        # Saídas (índices de TILE_DIRECTIONS) de cada tile transitável
+        self.exits = {}
+        for y in range(self.height):
+            for x in range(self.width):
+                if game_map[y][x] == WALL:
+                    continue
+                self.exits[(x, y)] = [
+                    direction for direction, (dx, dy) in enumerate(TILE_DIRECTIONS)
+                    if self._neighbor_is_walkable(game_map, x + dx, y + dy)
+                ]
+
+        self.nodes = {tile for tile, exits in self.exits.items() if len(exits) != 2}
+        self.edges = {
+            node: [self._follow_corridor(node, direction) for direction in self.exits[node]]
+            for node in self.nodes
+        }
+
+    @classmethod
+    def for_map(cls, game_map):
+        """Retorna o grafo do mapa, reaproveitando o cálculo se as paredes não mudaram"""
+        key = wall_layout(game_map)
+        if key not in _junction_cache:
+            _junction_cache[key] = cls(game_map)
+        return _junction_cache[key]
+
+    def _neighbor_is_walkable(self, game_map, x, y):
+        """Verifica se o vizinho (com wrap horizontal do túnel) é transitável"""
+        if not 0 <= y < self.height:
+            return False
+        return game_map[y][x % self.width] != WALL
+
+    def _step(self, tile, direction):
+        """Tile vizinho na direção dada, com wrap horizontal"""
+        dx, dy = TILE_DIRECTIONS[direction]
+        return ((tile[0] + dx) % self.width, tile[1] + dy)
+
+    def _follow_corridor(self, node, direction):
+        """Percorre o corredor a partir de um nó até o próximo nó
+
+        Retorna (direção de saída, nó de chegada, comprimento em tiles).
+        """
+        tile = node
+        heading = direction
+        length = 0
+        while True:
+            tile = self._step(tile, heading)
+            length += 1
+            if tile in self.nodes or length > len(self.exits):
+                return TILE_DIRECTIONS[direction], tile, length
+            back = (heading + 2) % 4
+            heading = next(exit for exit in self.exits[tile] if exit != back)
+
+    def _wrap(self, tile):
+        """Normaliza tiles fora do mapa (dentro do túnel)"""
+        return (tile[0] % self.width, tile[1])
+
+    def is_walkable(self, tile):
+        """Verifica se o tile faz parte do labirinto transitável"""
+        return self._wrap(tile) in self.exits
+
+    def is_junction(self, tile):
+        """Verifica se o tile é um nó (cruzamento ou beco sem saída)"""
+        return self._wrap(tile) in self.nodes
+
+    def tile_exits(self, tile):
+        """Lista as direções (dx, dy) que saem do tile"""
+        return [TILE_DIRECTIONS[direction] for direction in self.exits.get(self._wrap(tile), [])]
+
+    def edges_from(self, node):
+        """Arestas (direção, nó de chegada, comprimento) que saem de um nó"""
+        return self.edges.get(self._wrap(node), [])
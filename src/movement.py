@@ -0,0 +1,124 @@
+"""
+Motor de movimento vetorizado do Pac-Man
+Move todos os agentes de uma vez com NumPy (opcional)
+"""
+
+from .constants import (SUBSTEPS, WALL_BOX_START, WALL_BOX_END,
+                        TUNNEL_RIGHT_EDGE, TUNNEL_LEFT_EDGE,
+                        TUNNEL_RIGHT_ENTRY, TUNNEL_LEFT_ENTRY)
+
+try:
+    import numpy as np
+except ImportError:  # numpy é opcional: sem ele o jogo usa o collider por agente
+    np = None
+
+
+class MovementEngine:
+    """Curvas, colisão com paredes e túnel para vários agentes num único passo
+
+    Na criação, a grade de colisão é expandida numa matriz booleana com uma
+    entrada por posição inteira do centro do agente (passos de 1/16 de tile),
+    marcando se ela está dentro de alguma caixa de parede ou túnel. Cada
+    passo de movimento vira então poucas indexações vetorizadas sobre as
+    posições de todos os agentes, com o mesmo resultado de turning_corner,
+    collider e pacman_tunnel aplicados a cada agente.
+    """
+
+    # Margem (em passos) ao redor do mapa: túneis e sondagem um tile à frente
+    MARGIN = 4 * SUBSTEPS
+
+    def __init__(self, grid):
+        """Pré-calcula a matriz de posições bloqueadas a partir da grade de colisão"""
+        if np is None:
+            raise ImportError("MovementEngine requer numpy")
+        self.grid = grid
+
+        # Tiles sólidos com uma borda vazia larga o bastante para a margem
+        border = self.MARGIN // SUBSTEPS + 2
+        solid = np.zeros((grid.height + 2 * border, grid.width + 2 * border), dtype=bool)
+        solid[border:border + grid.height, border:border + grid.width] = grid.solid
+
+        # Para cada coordenada, o primeiro e o último tile cujas caixas a contêm
+        columns = np.arange(-self.MARGIN, grid.width * SUBSTEPS + self.MARGIN)
+        rows = np.arange(-self.MARGIN, grid.height * SUBSTEPS + self.MARGIN)
+        first_columns, last_columns = grid.covering_range(columns)
+        first_rows, last_rows = grid.covering_range(rows)
+
+        blocked = np.zeros((len(rows), len(columns)), dtype=bool)
+        for row_tiles in (first_rows, last_rows):
+            for column_tiles in (first_columns, last_columns):
+                blocked |= solid[np.ix_(row_tiles + border, column_tiles + border)]
+        self.blocked = blocked
+
+        # Estado dos agentes (preenchido por load ou move_agents)
+        self.positions = np.zeros((0, 2), dtype=np.int64)
+        self.directions = np.zeros((0, 2), dtype=np.int64)
+        self.next_directions = np.zeros((0, 2), dtype=np.int64)
+
+    @staticmethod
+    def available():
+        """Indica se o numpy está instalado"""
+        return np is not None
+
+    def blocked_at(self, points):
+        """Retorna, para cada ponto (N, 2), se o centro do agente colide ali"""
+        height, width = self.blocked.shape
+        x = np.clip(points[:, 0] + self.MARGIN, 0, width - 1)
+        y = np.clip(points[:, 1] + self.MARGIN, 0, height - 1)
+        return self.blocked[y, x]
+
+    def load(self, positions, directions, next_directions=None):
+        """Copia posições e direções (listas [x, y]) para os arrays do motor"""
+        self.positions = np.array(positions, dtype=np.int64).reshape(-1, 2)
+        self.directions = np.array(directions, dtype=np.int64).reshape(-1, 2)
+        if next_directions is None:
+            self.next_directions = None
+        else:
+            self.next_directions = np.array(next_directions, dtype=np.int64).reshape(-1, 2)
+
+    def step(self, frozen=False):
+        """Avança todos os agentes carregados em um frame
+
+        Aplica a próxima direção quando a curva é possível (teste um tile à
+        frente, como no turning_corner), move recusando passos que entram em
+        paredes e aplica o túnel lateral. Com frozen=True (fim de jogo) os
+        agentes não se movem, como no collider.
+        """
+        positions = self.positions
+        directions = self.directions
+
+        if self.next_directions is not None:
+            can_turn = ~self.blocked_at(positions + self.next_directions * SUBSTEPS)
+            directions[can_turn] = self.next_directions[can_turn]
+
+        if not frozen:
+            moved = positions + directions
+            rejected = self.blocked_at(moved)
+            # A partir de uma posição livre, desfazer o passo sempre volta para
+            # ela; agentes que já começam dentro de uma caixa usam a varredura
+            # exata do collider
+            stuck = np.flatnonzero(rejected & self.blocked_at(positions))
+            np.copyto(positions, moved, where=~rejected[:, None])
+            for index in stuck:
+                position = positions[index].tolist()
+                self.grid.move(position, directions[index].tolist())
+                positions[index] = position
+
+        x = positions[:, 0]
+        to_left = x >= TUNNEL_RIGHT_EDGE
+        to_right = x <= TUNNEL_LEFT_EDGE
+        x[to_left] = TUNNEL_LEFT_ENTRY
+        x[to_right] = TUNNEL_RIGHT_ENTRY
+
+    def move_agents(self, positions, directions, next_directions=None, frozen=False):
+        """Move uma lista de agentes e devolve as novas posições
+
+        As listas de direção são atualizadas no lugar (como no turning_corner)
+        e as posições são devolvidas como novas listas [x, y].
+        """
+        self.load(positions, directions, next_directions)
+        self.step(frozen)
+        for direction, new_direction in zip(directions, self.directions.tolist()):
+            direction[0] = new_direction[0]
+            direction[1] = new_direction[1]
+        return self.positions.tolist()
@@ -0,0 +1,124 @@
+"""
+Profiler de frames do Pac-Man
+Tempo de cada etapa do loop principal num buffer circular, exportável em CSV ou JSON
+"""
+
+import csv
+import json
+import functools
+from array import array
+from time import perf_counter_ns
+
+
+class FrameProfiler:
+    """Tempos por etapa dos últimos frames, em nanossegundos
+
+    Os tempos ficam num único array de inteiros com uma linha por frame
+    (uma coluna por etapa mais o total do frame), usado como buffer
+    circular: nada é alocado por frame e só os capacity frames mais
+    recentes são mantidos. As etapas são medidas substituindo métodos por
+    versões cronometradas (instrument); o tempo é exclusivo, então uma
+    etapa chamada dentro de outra não é contada duas vezes. Sem profiler,
+    nenhum método é substituído e o loop não tem custo extra.
+    """
+
+    def __init__(self, stages, capacity):
+        """Cria o buffer para capacity frames das etapas informadas"""
+        self.stages = list(stages)
+        self.capacity = capacity
+        self.width = len(self.stages) + 1  # Última coluna: duração total do frame
+        self.samples = array('q', bytes(8 * capacity * self.width))
+        self.frames = 0
+        self._row = 0
+        self._frame_start = perf_counter_ns()
+        self._since = self._frame_start
+        self._stack = []
+
+    def instrument(self, owner, name, stage):
+        """Substitui owner.name por uma versão que soma seu tempo na etapa"""
+        method = getattr(owner, name)
+        column = self.stages.index(stage)
+
+        @functools.wraps(method)
+        def timed(*args, **kwargs):
+            self._enter(column)
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self._leave()
+
+        setattr(owner, name, timed)
+
+    def _enter(self, column):
+        """Começa a cronometrar a etapa, pausando a que estava ativa"""
+        now = perf_counter_ns()
+        if self._stack:
+            self.samples[self._row + self._stack[-1]] += now - self._since
+        self._stack.append(column)
+        self._since = now
+
+    def _leave(self):
+        """Encerra a etapa ativa e retoma a anterior"""
+        now = perf_counter_ns()
+        self.samples[self._row + self._stack.pop()] += now - self._since
+        self._since = now
+
+    def begin_frame(self):
+        """Zera a linha do frame atual no buffer e marca seu início"""
+        row = self._row
+        for column in range(self.width):
+            self.samples[row + column] = 0
+        self._frame_start = perf_counter_ns()
+
+    def end_frame(self):
+        """Registra a duração total do frame e avança o buffer circular"""
+        self.samples[self._row + self.width - 1] = perf_counter_ns() - self._frame_start
+        self.frames += 1
+        self._row = (self.frames % self.capacity) * self.width
+
+    def rows(self):
+        """Frames guardados, do mais antigo ao mais recente: (número do frame, tempos)"""
+        count = min(self.frames, self.capacity)
+        first = self.frames - count
+        for frame in range(first, self.frames):
+            start = (frame % self.capacity) * self.width
+            yield frame, self.samples[start:start + self.width].tolist()
+
+    def summary(self):
+        """Média, p99 e máximo (ns) de cada etapa nos frames guardados"""
+        columns = self.stages + ['frame']
+        values = [[] for _ in columns]
+        for _, times in self.rows():
+            for column, value in enumerate(times):
+                values[column].append(value)
+        result = {}
+        for name, samples in zip(columns, values):
+            if not samples:
+                continue
+            samples.sort()
+            result[name] = {
+                "mean_ns": sum(samples) // len(samples),
+                "p99_ns": samples[min(len(samples) - 1, int(len(samples) * 0.99))],
+                "max_ns": samples[-1],
+            }
+        return result
+
+    def export(self, path):
+        """Salva os frames guardados em CSV ou, se o arquivo terminar em .json, em JSON"""
+        columns = self.stages + ['frame']
+        if path.endswith('.json'):
+            data = {
+                "unit": "ns",
+                "stages": columns,
+                "frames": [[frame] + times for frame, times in self.rows()],
+                "summary": self.summary(),
+            }
+            with open(path, 'w', encoding='utf-8') as output:
+                json.dump(data, output, indent=2)
+            return
+
+        with open(path, 'w', newline='', encoding='utf-8') as output:
+            writer = csv.writer(output)
+            writer.writerow(['frame_number'] + [f'{name}_ns' for name in columns])
+            for frame, times in self.rows():
+                writer.writerow([frame] + times)
@@ -0,0 +1,1293 @@
+"""
+Núcleo de simulação do Pac-Man
+Estado e regras do jogo, sem janela nem sprites do pygame
+"""
+
+import random
+import math
+from .constants import *
+from .collision import CollisionGrid, TurnTable
+from .maze import MazeDistances, JunctionGraph
+from .dots import DotIndex
+
+
+class ImprovedGhostAI:
+    """Classe com melhorias para a AI dos fantasmas"""
+    
+    def __init__(self, game_instance):
+        self.game = game_instance
+        self.ghost_states = {
+            'blue': {'mode': 'scatter', 'mode_timer': 0, 'target': None, 'tile': None, 'desired_direction': None},
+            'orange': {'mode': 'chase', 'mode_timer': 60, 'target': None, 'tile': None, 'desired_direction': None},
+            'pink': {'mode': 'ambush', 'mode_timer': 120, 'target': None, 'tile': None, 'desired_direction': None},
+            'red': {'mode': 'aggressive', 'mode_timer': 180, 'target': None, 'tile': None, 'desired_direction': None}
+        }
+        # Contadores para mudança de comportamento
+        self.behavior_cycle_timer = 0
+        
+        # Pontos de scatter (cantos do mapa) para cada fantasma
+        self.scatter_targets = {
+            'blue': [SUBSTEPS * 2, SUBSTEPS * 2],           # Canto superior esquerdo
+            'orange': [SUBSTEPS * 25, SUBSTEPS * 30],       # Canto inferior direito
+            'pink': [SUBSTEPS * 2, SUBSTEPS * 30],          # Canto inferior esquerdo
+            'red': [SUBSTEPS * 25, SUBSTEPS * 2]            # Canto superior direito
+        }
+
+    def get_manhattan_distance(self, pos1, pos2):
+        """Calcula distância Manhattan entre duas posições"""
+        return abs(pos1[0] - pos2[0]) + abs(pos1[1] - pos2[1])
+
+    def get_euclidean_distance(self, pos1, pos2):
+        """Calcula distância euclidiana entre duas posições"""
+        dx = pos1[0] - pos2[0]
+        dy = pos1[1] - pos2[1]
+        return math.sqrt(dx * dx + dy * dy)
+
+    def get_maze_distance(self, pos1, pos2):
+        """Calcula a distância pelo labirinto entre duas posições (em passos de 1/16 de tile)
+
+        Usa a tabela de distâncias pré-calculada; se não houver caminho
+        (ex.: dentro da casa dos fantasmas) cai para a distância Manhattan.
+        """
+        distance = self.game.maze.distance(self.game.position_to_tile(pos1), self.game.position_to_tile(pos2))
+        if distance is None:
+            return self.get_manhattan_distance(pos1, pos2)
+        return distance * SUBSTEPS
+
+    def find_path_bfs(self, start_pos, target_pos):
+        """Retorna o primeiro passo do caminho mínimo (tabela pré-calculada por BFS)"""
+        # Converter posições para coordenadas do grid
+        start_grid = self.game.position_to_tile(start_pos)
+        target_grid = self.game.position_to_tile(target_pos)
+        
+        # Verificar limites
+        map_height = len(self.game.map)
+        map_width = len(self.game.map[0]) if map_height > 0 else 0
+        
+        if (start_grid[0] < 0 or start_grid[0] >= map_width or 
+            start_grid[1] < 0 or start_grid[1] >= map_height or
+            target_grid[0] < 0 or target_grid[0] >= map_width or 
+            target_grid[1] < 0 or target_grid[1] >= map_height):
+            return None
+
+        step = self.game.maze.best_step(start_grid, target_grid)
+        if step is None:
+            return None
+
+        # Um passo por frame na direção encontrada
+        return [step[0], step[1]]
+
+    def get_predicted_pacman_position(self, steps_ahead=4):
+        """Prediz posição futura do Pacman baseada na direção atual"""
+        predicted_pos = [
+            self.game.pac_man_pos[0] + (self.game.pac_man_direction[0] * steps_ahead),
+            self.game.pac_man_pos[1] + (self.game.pac_man_direction[1] * steps_ahead)
+        ]
+        return predicted_pos
+
+    def get_ambush_target(self, ghost_color):
+        """Calcula posição para emboscada (4 tiles à frente do Pacman)"""
+        if ghost_color == 'pink':
+            # Rosa tenta interceptar o Pacman
+            return self.get_predicted_pacman_position(4)
+        elif ghost_color == 'orange':
+            # Laranja mantém distância - se muito perto, vai para scatter
+            distance = self.get_euclidean_distance(
+                getattr(self.game, f'ghost_{ghost_color}_pos'),
+                self.game.pac_man_pos
+            )
+            if distance < SUBSTEPS * 8:
+                return self.scatter_targets[ghost_color]
+            else:
+                return self.game.pac_man_pos
+        return self.game.pac_man_pos
+
+    def get_best_direction_a_star(self, ghost_pos, target_pos, current_direction):
+        """Usa A* simplificado para encontrar melhor direção"""
+        possible_directions = [
+            [1, 0],   # direita
+            [-1, 0],  # esquerda
+            [0, 1],   # baixo
+            [0, -1]   # cima
+        ]
+        
+        best_direction = current_direction
+        best_score = float('inf')
+        
+        for direction in possible_directions:
+            # Evitar reversão (não voltar na direção oposta)
+            if (direction[0] == -current_direction[0] and direction[1] == -current_direction[1] and
+                current_direction != [0, 0]):
+                continue
+            
+            # Testar nova posição
+            test_pos = [ghost_pos[0] + direction[0] * SUBSTEPS, ghost_pos[1] + direction[1] * SUBSTEPS]
+            
+            # Verificar colisão com paredes
+            collision = self.would_collide_with_wall(test_pos, direction)
+            if collision:
+                continue
+            
+            # Calcular score: distância real pelo labirinto até o target + heurística
+            distance = self.get_maze_distance(test_pos, target_pos)
+            
+            # Adicionar penalidade por mudança de direção
+            direction_change_penalty = 0
+            if direction != current_direction:
+                direction_change_penalty = 10
+            
+            total_score = distance + direction_change_penalty
+            
+            if total_score < best_score:
+                best_score = total_score
+                best_direction = direction
+        
+        return best_direction
+
+    def get_junction_direction(self, ghost_pos, target_pos, current_direction):
+        """Escolhe a saída do tile atual usando o grafo de junções
+
+        Em corredores segue a única saída à frente; em cruzamentos pontua cada
+        saída (exceto a reversão) pela distância real até o target.
+        """
+        graph = self.game.junction_graph
+        tile = self.game.position_to_tile(ghost_pos)
+        exits = graph.tile_exits(tile)
+        if not exits:
+            # Fora do labirinto transitável (ex.: casa dos fantasmas)
+            return self.get_best_direction_a_star(ghost_pos, target_pos, current_direction)
+
+        candidates = []
+        for dx, dy in exits:
+            direction = [dx, dy]
+            # Evitar reversão, a menos que seja a única saída (beco sem saída)
+            if (direction[0] == -current_direction[0] and direction[1] == -current_direction[1] and
+                current_direction != [0, 0] and len(exits) > 1):
+                continue
+            candidates.append((dx, dy, direction))
+
+        if not graph.is_junction(tile):
+            return candidates[0][2]
+
+        target_tile = self.game.position_to_tile(target_pos)
+        best_direction = current_direction
+        best_score = float('inf')
+        for dx, dy, direction in candidates:
+            distance = self.game.maze.distance((tile[0] + dx, tile[1] + dy), target_tile)
+            if distance is None:
+                distance = self.get_manhattan_distance(ghost_pos, target_pos)
+            else:
+                distance *= SUBSTEPS
+
+            # Adicionar penalidade por mudança de direção
+            direction_change_penalty = 0
+            if direction != current_direction:
+                direction_change_penalty = 10
+
+            total_score = distance + direction_change_penalty
+            if total_score < best_score:
+                best_score = total_score
+                best_direction = direction
+
+        return best_direction
+
+    def reset_decision(self, ghost_color):
+        """Força uma nova decisão de rota (ex.: fantasma reposicionado)"""
+        self.ghost_states[ghost_color]['tile'] = None
+        self.ghost_states[ghost_color]['desired_direction'] = None
+
+    def would_collide_with_wall(self, position, direction):
+        """Verifica se uma posição causaria colisão com parede"""
+        # Apenas paredes ('#') bloqueiam a IA; túneis são ignorados
+        return self.game.collision_grid.agent_collides(position, direction, include_tunnel=False)
+
+    def update_ghost_behavior(self, ghost_color):
+        """Atualiza o comportamento do fantasma baseado em ciclos"""
+        state = self.ghost_states[ghost_color]
+        state['mode_timer'] += 1
+        
+        # Ciclo de comportamentos: scatter -> chase -> scatter -> chase...
+        cycle_time = 480  # 8 segundos a 60 FPS
+        
+        if state['mode_timer'] % cycle_time < cycle_time // 4:
+            state['mode'] = 'scatter'
+        elif state['mode_timer'] % cycle_time < cycle_time // 2:
+            state['mode'] = 'chase'
+        elif state['mode_timer'] % cycle_time < 3 * cycle_time // 4:
+            state['mode'] = 'scatter'
+        else:
+            state['mode'] = 'chase'
+
+    def get_ghost_target(self, ghost_color):
+        """Determina o target do fantasma baseado no comportamento atual"""
+        state = self.ghost_states[ghost_color]
+        
+        if self.game.harmless_mode and getattr(self.game, f'harmless_mode_ghost_{ghost_color}'):
+            # Modo inofensivo - fugir do Pacman
+            return self.scatter_targets[ghost_color]
+        
+        if state['mode'] == 'scatter':
+            return self.scatter_targets[ghost_color]
+        elif state['mode'] == 'chase':
+            return self.game.pac_man_pos
+        elif state['mode'] == 'ambush':
+            return self.get_ambush_target(ghost_color)
+        elif state['mode'] == 'aggressive':
+            # Comportamento mais agressivo - perseguição direta
+            return self.game.pac_man_pos
+        
+        return self.game.pac_man_pos
+
+    def improved_ghost_intelligence(self, ghost_color, ghost_pos, ghost_direction, ghost_next_direction, distance_to_pacman):
+        """IA melhorada para fantasmas individuais"""
+        ghost_direction, ghost_next_direction = self.choose_direction(
+            ghost_color, ghost_pos, ghost_direction, ghost_next_direction
+        )
+        
+        # Movimento e colisão
+        ghost_pos = self.game.collider(ghost_pos, ghost_direction)
+        ghost_pos = self.game.pacman_tunnel(ghost_pos)
+        
+        # Recalcular distância
+        distance_to_pacman = self.game.distance_ghost_to_pac_man(ghost_pos)
+        
+        ghost_direction, ghost_next_direction = self.check_stuck(
+            ghost_color, ghost_pos, ghost_direction, ghost_next_direction
+        )
+        
+        return ghost_pos, ghost_direction, ghost_next_direction, distance_to_pacman
+
+    def choose_direction(self, ghost_color, ghost_pos, ghost_direction, ghost_next_direction):
+        """Decide a direção do fantasma antes do movimento"""
+        # Atualizar comportamento
+        self.update_ghost_behavior(ghost_color)
+        
+        # Decidir a rota apenas ao entrar em um novo tile: nos corredores a
+        # saída é única e nas junções a escolha usa as distâncias do labirinto
+        state = self.ghost_states[ghost_color]
+        tile = self.game.position_to_tile(ghost_pos)
+        if tile != state['tile'] or state['desired_direction'] is None:
+            state['tile'] = tile
+            target = self.get_ghost_target(ghost_color)
+            state['desired_direction'] = self.get_junction_direction(ghost_pos, target, ghost_direction)
+        new_direction = state['desired_direction']
+        
+        # Aplicar lógica de turning corner melhorada
+        if new_direction != ghost_direction:
+            # Verificar se pode virar (um tile à frente, como no turning_corner,
+            # já que a direção desejada é decidida ao entrar no tile)
+            can_turn = (self.game.turn_table.can_turn(ghost_pos, new_direction) and
+                        not self.would_collide_with_wall(ghost_pos, new_direction))
+            if can_turn:
+                ghost_direction = new_direction
+                ghost_next_direction = new_direction
+        
+        return ghost_direction, ghost_next_direction
+
+    def check_stuck(self, ghost_color, ghost_pos, ghost_direction, ghost_next_direction):
+        """Detecta fantasma preso após o movimento e sorteia uma nova direção"""
+        # Detecção de fantasma preso (mesmo que o original)
+        if not hasattr(self, 'previous_positions'):
+            self.previous_positions = {}
+        
+        if ghost_color not in self.previous_positions:
+            self.previous_positions[ghost_color] = []
+        
+        self.previous_positions[ghost_color].append(ghost_pos[:])
+        
+        # Manter apenas últimas 30 posições
+        if len(self.previous_positions[ghost_color]) > 30:
+            self.previous_positions[ghost_color].pop(0)
+        
+        # Verificar se está preso (mesma posição por muito tempo)
+        if len(self.previous_positions[ghost_color]) >= 20:
+            recent_positions = self.previous_positions[ghost_color][-20:]
+            unique_positions = len(set(tuple(pos) for pos in recent_positions))
+            
+            if unique_positions < 3:  # Poucas posições únicas = preso
+                # Forçar nova direção aleatória
+                ghost_direction = self.game.random_direction_for_ghost()
+                ghost_next_direction = ghost_direction
+                self.reset_decision(ghost_color)
+        
+        return ghost_direction, ghost_next_direction
+
+    def get_cooperative_behavior(self, ghost_color, all_ghost_positions):
+        """Implementa comportamento cooperativo entre fantasmas"""
+        # Evitar que fantasmas se agrupem demais
+        min_distance = SUBSTEPS * 3
+        
+        current_pos = getattr(self.game, f'ghost_{ghost_color}_pos')
+        
+        for other_color, other_pos in all_ghost_positions.items():
+            if other_color != ghost_color:
+                distance = self.get_euclidean_distance(current_pos, other_pos)
+                if distance < min_distance:
+                    # Muito próximo de outro fantasma, tentar se afastar
+                    return self.scatter_targets[ghost_color]
+        
+        return None  # Comportamento normal
+
+
+class GameSimulation:
+    """Estado e regras do jogo Pac-Man, sem dependência de janela ou sprites
+
+    Todas as posições ficam em coordenadas de ponto fixo e cada chamada de
+    step() avança o jogo em um frame. Pode rodar sem display (ex.: partidas
+    automáticas para ajustar a IA); a classe PacMan desenha e lê a entrada
+    do jogador por cima desta simulação.
+    """
+    
+    def __init__(self, game_mode="Player 1"):
+        """Inicializa o estado do jogo no modo especificado"""
+        # Variáveis do jogo
+        self.sprite_frame = 0
+        self.sprite_speed = SPRITE_SPEED
+        
+        # Estado do jogo
+        self.score = 0
+        self.lives = 2 # 3 vidas
+        self.end_game = False
+        self.harmless_mode = False
+        self.harmless_mode_timer = 0
+        self.harmless_mode_ghost_blue = False
+        self.harmless_mode_ghost_orange = False
+        self.harmless_mode_ghost_pink = False
+        self.harmless_mode_ghost_red = False
+        
+        # Modo de jogo selecionado
+        self.game_mode = game_mode
+        
+        # Posições e direções do Pacman (calculadas dinamicamente)
+        self.pac_man_pos = list(PACMAN_START_POS)
+        self.pac_man_direction = list(PACMAN_START_DIR)
+        self.pac_man_next_direction = list(PACMAN_START_DIR)
+        
+        # Posições e direções para múltiplos jogadores
+        self.pac_man_2_pos = list(PACMAN_2_START_POS)  # Player 2 - à esquerda
+        self.pac_man_2_direction = [0, 0]
+        self.pac_man_2_next_direction = [0, 0]
+        
+        self.pac_man_3_pos = list(PACMAN_3_START_POS)  # Player 3 - à direita
+        self.pac_man_3_direction = [0, 0]
+        self.pac_man_3_next_direction = [0, 0]
+        
+        # Posições e direções dos fantasmas (calculadas dinamicamente)
+        self.ghost_blue_pos = list(GHOST_BLUE_POS)
+        self.ghost_orange_pos = list(GHOST_ORANGE_POS)
+        self.ghost_pink_pos = list(GHOST_PINK_POS)
+        self.ghost_red_pos = list(GHOST_RED_POS)
+        
+        self.ghost_blue_direction = [0, 0]
+        self.ghost_orange_direction = [0, 0]
+        self.ghost_pink_direction = [0, 0]
+        self.ghost_red_direction = [0, 0]
+        
+        self.ghost_blue_next_direction = [0, 0]
+        self.ghost_orange_next_direction = [0, 0]
+        self.ghost_pink_next_direction = [0, 0]
+        self.ghost_red_next_direction = [0, 0]
+        
+        # Distâncias dos fantasmas ao Pacman
+        self.distance_ghost_blue_to_pac_man = self.distance_ghost_to_pac_man(self.ghost_blue_pos)
+        self.distance_ghost_orange_to_pac_man = self.distance_ghost_to_pac_man(self.ghost_orange_pos)
+        self.distance_ghost_pink_to_pac_man = self.distance_ghost_to_pac_man(self.ghost_pink_pos)
+        self.distance_ghost_red_to_pac_man = self.distance_ghost_to_pac_man(self.ghost_red_pos)
+        
+        # Mapa do jogo
+        self.batched_movement = BATCHED_MOVEMENT
+        self.movement_engine = None
+        self._load_map()
+
+        # Inicializar frutas no mapa
+        self._initialize_fruits()
+
+    def _load_map(self):
+        """Carrega o mapa do jogo e reconstrói os índices de colisão, distâncias e pontos"""
+        self.map = [row[:] for row in GAME_MAP]  # Cópia do mapa
+        self.collision_grid = CollisionGrid.for_map(self.map)
+        self.turn_table = TurnTable.for_grid(self.collision_grid)
+        self.maze = MazeDistances.for_map(self.map)
+        self.junction_graph = JunctionGraph.for_map(self.map)
+        self.dot_index = DotIndex(self.map)
+        if not self.batched_movement:
+            self.movement_engine = None
+            return
+        from .movement import MovementEngine  # Só com o motor ligado: o numpy pesa na inicialização
+        if not MovementEngine.available():
+            self.movement_engine = None
+        elif self.movement_engine is None or self.movement_engine.grid is not self.collision_grid:
+            # A matriz de bloqueio depende só da grade, reaproveitada entre níveis
+            self.movement_engine = MovementEngine(self.collision_grid)
+
+    def _initialize_fruits(self):
+        """Inicializa as frutas no mapa"""
+        self.active_fruits = {}  # Dicionário para frutas ativas: posição -> tipo
+        self.fruit_timer = 0
+        self.fruit_spawn_delay = 600  # Frames entre spawns de frutas (10 segundos a 60 FPS)
+        self.fruit_duration = 600  # Frames que fruta fica ativa (10 segundos)
+        # Sistema de raridade baseado em probabilidades
+        # Frutas mais valiosas são mais raras
+        self.fruit_rarity = {
+            FRUIT_CHERRY: 30,      # 30% - Comum
+            FRUIT_STRAWBERRY: 25,  # 25% - Comum
+            FRUIT_ORANGE: 20,      # 20% - Incomum
+            FRUIT_APPLE: 15,       # 15% - Incomum
+            FRUIT_BELL: 5,         # 5% - Raro
+            FRUIT_KEY: 3,          # 3% - Raro
+            FRUIT_COCONUT: 1.5,    # 1.5% - Muito Raro
+            FRUIT_FLOWER: 0.5      # 0.5% - Lendário
+        }
+        self.last_fruit_spawn_time = 0
+        self.fruit_frame_counter = 0  # Contador separado para frutas
+
+    def _spawn_fruit(self):
+        """Spawna uma fruta em uma posição aleatória"""
+        if not FRUIT_POSITIONS:
+            return
+
+        # Escolher uma posição aleatória disponível que não seja parede
+        available_positions = []
+        for pos in FRUIT_POSITIONS:
+            if pos not in self.active_fruits:
+                x, y = pos
+                # Verificar se a posição existe no mapa e não é parede
+                if (0 <= y < len(self.map) and 0 <= x < len(self.map[0]) and
+                    self.map[y][x] != WALL):
+                    # Verificar se a posição não está no spawn dos fantasmas
+                    if not self._is_ghost_spawn_position(x, y):
+                        available_positions.append(pos)
+
+        if available_positions:
+            pos = random.choice(available_positions)
+            fruit_type = self._select_fruit_by_rarity()
+            self.active_fruits[pos] = {
+                'type': fruit_type,
+                'spawn_time': self.fruit_frame_counter,
+                'duration': self.fruit_duration
+            }
+
+    def _select_fruit_by_rarity(self):
+        """Seleciona uma fruta baseada no sistema de raridade"""
+        # Criar lista de frutas com suas probabilidades
+        fruits = list(self.fruit_rarity.keys())
+        probabilities = list(self.fruit_rarity.values())
+        
+        # Selecionar fruta baseada na probabilidade
+        selected_fruit = random.choices(fruits, weights=probabilities, k=1)[0]
+        
+        return selected_fruit
+
+    def _is_ghost_spawn_position(self, x, y):
+        """Verifica se uma posição está no spawn dos fantasmas"""
+        # Posições dos fantasmas em coordenadas de grid
+        ghost_spawn_positions = [
+            (12, 13),    # Ghost Blue
+            (12, 14),    # Ghost Orange (arredondado de 14.5)
+            (14, 13),    # Ghost Pink
+            (14, 14),    # Ghost Red (arredondado de 14.5)
+            (13, 10),    # Posição central de spawn (quando fantasmas voltam)
+            (13, 11),    # Área próxima ao spawn
+            (13, 12),    # Área próxima ao spawn
+            (13, 13),    # Área próxima ao spawn
+            (13, 14),    # Área próxima ao spawn
+            (13, 15),    # Área próxima ao spawn
+        ]
+        
+        return (x, y) in ghost_spawn_positions
+
+    def _update_fruits(self):
+        """Atualiza o estado das frutas (spawn e expiração)"""
+        # Incrementar contador de frames das frutas
+        self.fruit_frame_counter += 1
+        current_time = self.fruit_frame_counter
+
+        # Spawn de nova fruta se necessário
+        if current_time - self.last_fruit_spawn_time >= self.fruit_spawn_delay:
+            if len(self.active_fruits) < 2:  # Máximo 2 frutas ativas
+                self._spawn_fruit()
+                self.last_fruit_spawn_time = current_time
+
+        # Remover frutas expiradas
+        expired_fruits = []
+        for pos, fruit_data in self.active_fruits.items():
+            if current_time - fruit_data['spawn_time'] >= fruit_data['duration']:
+                expired_fruits.append(pos)
+
+        for pos in expired_fruits:
+            del self.active_fruits[pos]
+
+    def _get_fruit_points(self, fruit_type):
+        """Retorna os pontos correspondentes ao tipo de fruta"""
+        fruit_points = {
+            FRUIT_CHERRY: CHERRY_POINTS,
+            FRUIT_STRAWBERRY: STRAWBERRY_POINTS,
+            FRUIT_ORANGE: ORANGE_POINTS,
+            FRUIT_APPLE: APPLE_POINTS,
+            FRUIT_BELL: BELL_POINTS,
+            FRUIT_KEY: KEY_POINTS,
+            FRUIT_COCONUT: COCONUT_POINTS,
+            FRUIT_FLOWER: FLOWER_POINTS
+        }
+        return fruit_points.get(fruit_type, 0)
+    
+    def move(self, key):
+        """Processa entrada do teclado para movimento dos Pacmans"""
+        if key == 'r':
+            self.restart()
+        # Player 1 (WASD)
+        elif key == 'w':
+            self._set_direction('up', 1)
+        elif key == 'a':
+            self._set_direction('left', 1)
+        elif key == 's':
+            self._set_direction('down', 1)
+        elif key == 'd':
+            self._set_direction('right', 1)
+        # Player 2 (Arrow Keys)
+        elif key == 'up':
+            self._set_direction('up', 2)
+        elif key == 'left':
+            self._set_direction('left', 2)
+        elif key == 'down':
+            self._set_direction('down', 2)
+        elif key == 'right':
+            self._set_direction('right', 2)
+        # Player 3 (IJKL)
+        elif key == 'i':
+            self._set_direction('up', 3)
+        elif key == 'j':
+            self._set_direction('left', 3)
+        elif key == 'k':
+            self._set_direction('down', 3)
+        elif key == 'l':
+            self._set_direction('right', 3)
+    
+    def _set_direction(self, direction, player_num=1):
+        """Define a direção do Pacman baseada no input"""
+        # Selecionar variáveis baseadas no jogador
+        if player_num == 1:
+            current_dir = self.pac_man_direction
+            next_dir = self.pac_man_next_direction
+        elif player_num == 2:
+            current_dir = self.pac_man_2_direction
+            next_dir = self.pac_man_2_next_direction
+        elif player_num == 3:
+            current_dir = self.pac_man_3_direction
+            next_dir = self.pac_man_3_next_direction
+        else:
+            return
+        
+        if direction == 'up':
+            if current_dir[0] == 0 and current_dir[1] > 0:
+                current_dir[0] = 0
+                current_dir[1] = -1
+                next_dir[0] = 0
+                next_dir[1] = -1
+            elif current_dir[0] != 0 and current_dir[1] == 0:
+                next_dir[0] = 0
+                next_dir[1] = -1
+            elif current_dir[0] == 0 and current_dir[1] == 0:  # Se parado, pode começar a se mover
+                current_dir[0] = 0
+                current_dir[1] = -1
+                next_dir[0] = 0
+                next_dir[1] = -1
+        elif direction == 'left':
+            if current_dir[0] > 0 and current_dir[1] == 0:
+                current_dir[0] = -1
+                current_dir[1] = 0
+                next_dir[0] = -1
+                next_dir[1] = 0
+            elif current_dir[0] == 0 and current_dir[1] != 0:
+                next_dir[0] = -1
+                next_dir[1] = 0
+            elif current_dir[0] == 0 and current_dir[1] == 0:  # Se parado, pode começar a se mover
+                current_dir[0] = -1
+                current_dir[1] = 0
+                next_dir[0] = -1
+                next_dir[1] = 0
+        elif direction == 'down':
+            if current_dir[0] == 0 and current_dir[1] < 0:
+                current_dir[0] = 0
+                current_dir[1] = 1
+                next_dir[0] = 0
+                next_dir[1] = 1
+            elif current_dir[0] != 0 and current_dir[1] == 0:
+                next_dir[0] = 0
+                next_dir[1] = 1
+            elif current_dir[0] == 0 and current_dir[1] == 0:  # Se parado, pode começar a se mover
+                current_dir[0] = 0
+                current_dir[1] = 1
+                next_dir[0] = 0
+                next_dir[1] = 1
+        elif direction == 'right':
+            if current_dir[0] < 0 and current_dir[1] == 0:
+                current_dir[0] = 1
+                current_dir[1] = 0
+                next_dir[0] = 1
+                next_dir[1] = 0
+            elif current_dir[0] == 0 and current_dir[1] != 0:
+                next_dir[0] = 1
+                next_dir[1] = 0
+            elif current_dir[0] == 0 and current_dir[1] == 0:  # Se parado, pode começar a se mover
+                current_dir[0] = 1
+                current_dir[1] = 0
+                next_dir[0] = 1
+                next_dir[1] = 0
+    
+    def animation_step(self):
+        """Atualiza o frame de animação"""
+        if self.sprite_frame == 60:
+            self.sprite_frame = 0
+        else:
+            self.sprite_frame += self.sprite_speed
+    
+    def collider(self, position, direction):
+        """Verifica colisões com paredes"""
+        if self.end_game == False:
+            self.collision_grid.move(position, direction)
+        return position
+    
+    def turning_corner(self, position, direction, next_direction):
+        """Sistema de curvas para mudança de direção"""
+        if self.turn_table.can_turn(position, next_direction):
+            direction[0] = next_direction[0]
+            direction[1] = next_direction[1]
+        return direction, next_direction
+    
+    def collect_dots(self):
+        """Coleta pontos e power pellets para todos os jogadores ativos"""
+        # Lista de posições dos jogadores ativos
+        active_players = [self.pac_man_pos]  # Player 1 sempre ativo
+        
+        # Adicionar Player 2 se estiver ativo
+        if self.game_mode in ["Player 2", "Player 3"]:
+            active_players.append(self.pac_man_2_pos)
+        
+        # Adicionar Player 3 se estiver ativo
+        if self.game_mode == "Player 3":
+            active_players.append(self.pac_man_3_pos)
+        
+        for player_pos in active_players:
+            x_pac_man = player_pos[0]
+            y_pac_man = player_pos[1]
+            tile_x, tile_y = self.position_to_tile(player_pos)
+
+            # Apenas os tiles vizinhos ao centro do jogador podem ter pontos ao alcance
+            for y in (tile_y - 1, tile_y, tile_y + 1):
+                for x in (tile_x - 1, tile_x, tile_x + 1):
+                    if (x, y) in self.dot_index.dots:
+                        x_dot = x * SUBSTEPS
+                        y_dot = y * SUBSTEPS
+                        if (x_dot + DOT_HIT_START <= x_pac_man <= x_dot + DOT_HIT_END and
+                                y_dot + DOT_HIT_START <= y_pac_man <= y_dot + DOT_HIT_END):
+                            self.map[y][x] = EMPTY
+                            self.dot_index.remove_dot((x, y))
+                            self.score += DOT_POINTS
+
+                    elif (x, y) in self.dot_index.power_pellets:
+                        x_dot = x * SUBSTEPS
+                        y_dot = y * SUBSTEPS
+                        if (x_dot + POWER_PELLET_HIT_START <= x_pac_man <= x_dot + POWER_PELLET_HIT_END and
+                                y_dot + POWER_PELLET_HIT_START <= y_pac_man <= y_dot + POWER_PELLET_HIT_END):
+                            self.map[y][x] = EMPTY
+                            self.dot_index.remove_power_pellet((x, y))
+                            self.score += POWER_PELLET_POINTS
+                            self.harmless_mode = True
+                            self.harmless_mode_ghost_blue = True
+                            self.harmless_mode_ghost_orange = True
+                            self.harmless_mode_ghost_pink = True
+                            self.harmless_mode_ghost_red = True
+
+    def collect_fruits(self):
+        """Coleta frutas para todos os jogadores ativos"""
+        # Lista de posições dos jogadores ativos
+        active_players = [self.pac_man_pos]  # Player 1 sempre ativo
+
+        # Adicionar Player 2 se estiver ativo
+        if self.game_mode in ["Player 2", "Player 3"]:
+            active_players.append(self.pac_man_2_pos)
+
+        # Adicionar Player 3 se estiver ativo
+        if self.game_mode == "Player 3":
+            active_players.append(self.pac_man_3_pos)
+
+        # Verificar colisão com frutas ativas
+        collected_fruits = []
+        for pos, fruit_data in self.active_fruits.items():
+            x, y = pos
+            x_fruit = x * SUBSTEPS
+            y_fruit = y * SUBSTEPS
+
+            # Verificar colisão com todos os jogadores ativos
+            for player_pos in active_players:
+                x_pac_man = player_pos[0]
+                y_pac_man = player_pos[1]
+
+                if (x_fruit <= x_pac_man <= x_fruit + SUBSTEPS and
+                    y_fruit <= y_pac_man <= y_fruit + SUBSTEPS):
+                    # Fruta coletada!
+                    fruit_points = self._get_fruit_points(fruit_data['type'])
+                    self.score += fruit_points
+                    collected_fruits.append(pos)
+                    break  # Sair do loop de jogadores se coletou a fruta
+
+        # Remover frutas coletadas
+        for pos in collected_fruits:
+            if pos in self.active_fruits:
+                del self.active_fruits[pos]
+    
+    def pacman_tunnel(self, position):
+        """Implementa túneis laterais"""
+        x_pos = position[0]
+        y_pos = position[1]
+        if position[0] >= TUNNEL_RIGHT_EDGE:
+            x_pos = TUNNEL_LEFT_ENTRY
+        elif position[0] <= TUNNEL_LEFT_EDGE:
+            x_pos = TUNNEL_RIGHT_ENTRY
+        return [x_pos, y_pos]
+    
+    def player(self):
+        """Move os Pacmans ativos no modo de jogo atual"""
+        if self.movement_engine is not None:
+            self._move_players_batched()
+        else:
+            # Player 1 (sempre ativo)
+            self.pac_man_direction, self.pac_man_next_direction = self.turning_corner(self.pac_man_pos, self.pac_man_direction, self.pac_man_next_direction)
+            self.pac_man_pos = self.collider(self.pac_man_pos, self.pac_man_direction)
+            self.pac_man_pos = self.pacman_tunnel(self.pac_man_pos)
+            
+            # Player 2 (se modo Player 2 ou Player 3)
+            if self.game_mode in ["Player 2", "Player 3"]:
+                self.pac_man_2_direction, self.pac_man_2_next_direction = self.turning_corner(self.pac_man_2_pos, self.pac_man_2_direction, self.pac_man_2_next_direction)
+                self.pac_man_2_pos = self.collider(self.pac_man_2_pos, self.pac_man_2_direction)
+                self.pac_man_2_pos = self.pacman_tunnel(self.pac_man_2_pos)
+            
+            # Player 3 (se modo Player 3)
+            if self.game_mode == "Player 3":
+                self.pac_man_3_direction, self.pac_man_3_next_direction = self.turning_corner(self.pac_man_3_pos, self.pac_man_3_direction, self.pac_man_3_next_direction)
+                self.pac_man_3_pos = self.collider(self.pac_man_3_pos, self.pac_man_3_direction)
+                self.pac_man_3_pos = self.pacman_tunnel(self.pac_man_3_pos)
+    
+    def _active_players(self):
+        """Prefixos dos atributos dos Pacmans ativos no modo de jogo atual"""
+        if self.game_mode == "Player 3":
+            return ["pac_man", "pac_man_2", "pac_man_3"]
+        if self.game_mode == "Player 2":
+            return ["pac_man", "pac_man_2"]
+        return ["pac_man"]
+    
+    def _move_players_batched(self):
+        """Curvas, colisão e túnel de todos os Pacmans num único passo vetorizado"""
+        players = self._active_players()
+        positions = self.movement_engine.move_agents(
+            [getattr(self, f"{player}_pos") for player in players],
+            [getattr(self, f"{player}_direction") for player in players],
+            [getattr(self, f"{player}_next_direction") for player in players],
+            frozen=self.end_game
+        )
+        for player, position in zip(players, positions):
+            setattr(self, f"{player}_pos", position)
+    
+    def position_to_tile(self, position):
+        """Converte uma posição em ponto fixo no tile onde está o centro do agente"""
+        return (position[0] // SUBSTEPS, position[1] // SUBSTEPS)
+    
+    def distance_ghost_to_pac_man(self, ghost_pos):
+        """Calcula distância entre fantasma e Pacman"""
+        delta_x = (ghost_pos[0] - self.pac_man_pos[0]) ** 2
+        delta_y = (ghost_pos[1] - self.pac_man_pos[1]) ** 2
+        distance = (delta_x + delta_y) ** (1 / 2)
+        return distance
+    
+    def random_direction_for_ghost(self):
+        """Gera direção aleatória para fantasma"""
+        move_up_or_sideways = random.randint(0, 1)
+        x_direction = random.randint(0, 1)
+        y_direction = random.randint(0, 1)
+        direction = []
+        if move_up_or_sideways == 0:
+            if x_direction == 0:
+                direction = [-1, 0]
+            else:
+                direction = [1, 0]
+        else:
+            if y_direction == 0:
+                direction = [0, -1]
+            else:
+                direction = [0, 1]
+        return direction
+    
+    def random_next_direction_for_ghost(self, direction):
+        """Gera próxima direção aleatória para fantasma"""
+        new_direction = [0, 0]
+        if direction[0] != 0:
+            if random.randint(0, 1) == 0:
+                new_direction[1] = -1
+            else:
+                new_direction[1] = 1
+        elif direction[1] != 0:
+            if random.randint(0, 1) == 0:
+                new_direction[0] = -1
+            else:
+                new_direction[0] = 1
+        return new_direction
+    
+    def direction_ghost_to_pac_man(self, position, direction):
+        """Calcula direção para fantasma perseguir Pacman"""
+        new_direction = [0, 0]
+        ghost_x = position[0]
+        ghost_y = position[1]
+        pac_man_x = self.pac_man_pos[0]
+        pac_man_y = self.pac_man_pos[1]
+        delta_x = ghost_x - pac_man_x
+        delta_y = ghost_y - pac_man_y
+        if direction[1] != 0:
+            if delta_x <= 0:
+                new_direction[0] = 1
+            else:
+                new_direction[0] = -1
+        if direction[0] != 0:
+            if delta_y <= 0:
+                new_direction[1] = 1
+            else:
+                new_direction[1] = -1
+        return new_direction
+    
+    def direction_harmless_ghost_to_pac_man(self, position, direction):
+        """Calcula direção para fantasma fugir do Pacman"""
+        new_direction = [0, 0]
+        ghost_x = position[0]
+        ghost_y = position[1]
+        pac_man_x = self.pac_man_pos[0]
+        pac_man_y = self.pac_man_pos[1]
+        delta_x = ghost_x - pac_man_x
+        delta_y = ghost_y - pac_man_y
+        if direction[1] != 0:
+            if delta_x <= 0:
+                new_direction[0] = -1
+            else:
+                new_direction[0] = 1
+        if direction[0] != 0:
+            if delta_y <= 0:
+                new_direction[1] = -1
+            else:
+                new_direction[1] = 1
+        return new_direction
+    
+    def new_random_direction_for_ghost(self, position, direction):
+        """Gera nova direção aleatória para fantasma quando está preso"""
+        new_direction = [0, 0]
+        pos = [0, 0]
+        pos[0] = position[0]
+        pos[1] = position[1]
+        
+        if direction[0] != 0:
+            if random.randint(0, 1) == 0:
+                new_direction[1] = -2
+            else:
+                new_direction[1] = 2
+        elif direction[1] != 0:
+            if random.randint(0, 1) == 0:
+                new_direction[0] = -2
+            else:
+                new_direction[0] = 2
+        
+        new_position = self.collider(pos, new_direction)
+        
+        if position == new_position:
+            new_direction[0] *= -1
+            new_direction[1] *= -1
+            new_position = self.collider(pos, new_direction)
+        
+        new_direction[0] //= 2
+        new_direction[1] //= 2
+        
+        return new_position, new_direction
+    
+    def enhanced_ghost_intelligence(self, ghost_pos, ghost_direction, ghost_next_direction, distance_ghost_to_pac_man, harmless_ghost_mode, ghost_color='blue'):
+        """
+        Versão melhorada da ghost_intelligence que usa a IA aprimorada
+        """
+        if not hasattr(self, 'ghost_ai'):
+            self.ghost_ai = ImprovedGhostAI(self)
+        
+        # Usar a IA melhorada
+        return self.ghost_ai.improved_ghost_intelligence(
+            ghost_color, ghost_pos, ghost_direction, ghost_next_direction, distance_ghost_to_pac_man
+        )
+
+    def ghost_intelligence(self, ghost_pos, ghost_direction, ghost_next_direction, distance_ghost_to_pac_man, harmless_ghost_mode):
+        """IA do fantasma - decide movimento baseado na distância e modo"""
+        ghost_blue_pos = [0, 0]
+        ghost_blue_pos[0] = ghost_pos[0]
+        ghost_blue_pos[1] = ghost_pos[1]
+        distance_ghost_to_pac_man = self.distance_ghost_to_pac_man(ghost_pos)
+        if distance_ghost_to_pac_man <= HUNT_DISTANCE:
+            if harmless_ghost_mode:
+                ghost_next_direction = self.direction_harmless_ghost_to_pac_man(ghost_pos, ghost_direction)
+            else:
+                ghost_next_direction = self.direction_ghost_to_pac_man(ghost_pos, ghost_direction)
+            ghost_direction, ghost_next_direction = self.turning_corner(ghost_pos, ghost_direction, ghost_next_direction)
+        if ghost_direction == ghost_next_direction:
+            if harmless_ghost_mode:
+                ghost_next_direction = self.direction_harmless_ghost_to_pac_man(ghost_pos, ghost_direction)
+            else:
+                ghost_next_direction = self.direction_ghost_to_pac_man(ghost_pos, ghost_direction)
+            ghost_pos = self.collider(ghost_pos, ghost_direction)
+        ghost_pos = self.pacman_tunnel(ghost_pos)
+        ghost_pos = self.collider(ghost_pos, ghost_direction)
+        if ghost_blue_pos == ghost_pos:
+            ghost_pos, ghost_direction = self.new_random_direction_for_ghost(ghost_pos, ghost_direction)
+        return ghost_pos, ghost_direction, ghost_next_direction, distance_ghost_to_pac_man
+    
+    def ghost(self):
+        """Atualiza e move todos os fantasmas com IA melhorada"""
+        if self.movement_engine is not None:
+            self._move_ghosts_batched()
+            return
+        
+        # Coletar posições de todos os fantasmas para comportamento cooperativo
+        all_ghost_positions = {
+            'blue': self.ghost_blue_pos,
+            'orange': self.ghost_orange_pos,
+            'pink': self.ghost_pink_pos,
+            'red': self.ghost_red_pos
+        }
+        
+        # Fantasma azul
+        if self.ghost_blue_pos != GHOST_BLUE_POS:
+            output_1, output_2, output_3, output_4 = self.enhanced_ghost_intelligence(
+                self.ghost_blue_pos, self.ghost_blue_direction, 
+                self.ghost_blue_next_direction, self.distance_ghost_blue_to_pac_man, 
+                self.harmless_mode_ghost_blue, 'blue'
+            )
+            self.ghost_blue_pos = output_1
+            self.ghost_blue_direction = output_2
+            self.ghost_blue_next_direction = output_3
+            self.distance_ghost_blue_to_pac_man = output_4
+        
+        # Fantasma laranja
+        if self.ghost_orange_pos != GHOST_ORANGE_POS:
+            output_1, output_2, output_3, output_4 = self.enhanced_ghost_intelligence(
+                self.ghost_orange_pos, self.ghost_orange_direction, 
+                self.ghost_orange_next_direction, self.distance_ghost_orange_to_pac_man, 
+                self.harmless_mode_ghost_orange, 'orange'
+            )
+            self.ghost_orange_pos = output_1
+            self.ghost_orange_direction = output_2
+            self.ghost_orange_next_direction = output_3
+            self.distance_ghost_orange_to_pac_man = output_4
+        
+        # Fantasma rosa
+        if self.ghost_pink_pos != GHOST_PINK_POS:
+            output_1, output_2, output_3, output_4 = self.enhanced_ghost_intelligence(
+                self.ghost_pink_pos, self.ghost_pink_direction, 
+                self.ghost_pink_next_direction, self.distance_ghost_pink_to_pac_man, 
+                self.harmless_mode_ghost_pink, 'pink'
+            )
+            self.ghost_pink_pos = output_1
+            self.ghost_pink_direction = output_2
+            self.ghost_pink_next_direction = output_3
+            self.distance_ghost_pink_to_pac_man = output_4
+        
+        # Fantasma vermelho
+        if self.ghost_red_pos != GHOST_RED_POS:
+            output_1, output_2, output_3, output_4 = self.enhanced_ghost_intelligence(
+                self.ghost_red_pos, self.ghost_red_direction, 
+                self.ghost_red_next_direction, self.distance_ghost_red_to_pac_man, 
+                self.harmless_mode_ghost_red, 'red'
+            )
+            self.ghost_red_pos = output_1
+            self.ghost_red_direction = output_2
+            self.ghost_red_next_direction = output_3
+            self.distance_ghost_red_to_pac_man = output_4
+    
+    def _move_ghosts_batched(self):
+        """Decide a direção de cada fantasma e move todos num único passo vetorizado
+
+        As decisões da IA dependem apenas da posição de cada fantasma e do
+        Pacman, então decidir todas antes de mover dá o mesmo resultado que o
+        laço por fantasma de ghost().
+        """
+        if not hasattr(self, 'ghost_ai'):
+            self.ghost_ai = ImprovedGhostAI(self)
+        
+        spawns = {'blue': GHOST_BLUE_POS, 'orange': GHOST_ORANGE_POS,
+                  'pink': GHOST_PINK_POS, 'red': GHOST_RED_POS}
+        colors = [color for color, spawn in spawns.items() if getattr(self, f"ghost_{color}_pos") != spawn]
+        
+        for color in colors:
+            direction, next_direction = self.ghost_ai.choose_direction(
+                color, getattr(self, f"ghost_{color}_pos"),
+                getattr(self, f"ghost_{color}_direction"), getattr(self, f"ghost_{color}_next_direction")
+            )
+            setattr(self, f"ghost_{color}_direction", direction)
+            setattr(self, f"ghost_{color}_next_direction", next_direction)
+        
+        positions = self.movement_engine.move_agents(
+            [getattr(self, f"ghost_{color}_pos") for color in colors],
+            [getattr(self, f"ghost_{color}_direction") for color in colors],
+            frozen=self.end_game
+        )
+        
+        for color, position in zip(colors, positions):
+            setattr(self, f"ghost_{color}_pos", position)
+            setattr(self, f"distance_ghost_{color}_to_pac_man", self.distance_ghost_to_pac_man(position))
+            direction, next_direction = self.ghost_ai.check_stuck(
+                color, position,
+                getattr(self, f"ghost_{color}_direction"), getattr(self, f"ghost_{color}_next_direction")
+            )
+            setattr(self, f"ghost_{color}_direction", direction)
+            setattr(self, f"ghost_{color}_next_direction", next_direction)
+    
+    def moving_ghost_into_the_game(self, color):
+        """Move fantasma para o jogo quando sai da posição inicial"""
+        if hasattr(self, 'ghost_ai'):
+            self.ghost_ai.reset_decision(color)
+        if color == 'blue':
+            self.ghost_blue_pos = list(GHOST_EXIT_POS)
+            self.ghost_blue_direction = self.random_direction_for_ghost()
+            self.ghost_blue_next_direction = self.random_next_direction_for_ghost(self.ghost_blue_direction)
+        elif color == 'orange':
+            self.ghost_orange_pos = list(GHOST_EXIT_POS)
+            self.ghost_orange_direction = self.random_direction_for_ghost()
+            self.ghost_orange_next_direction = self.random_next_direction_for_ghost(self.ghost_orange_direction)
+        elif color == 'pink':
+            self.ghost_pink_pos = list(GHOST_EXIT_POS)
+            self.ghost_pink_direction = self.random_direction_for_ghost()
+            self.ghost_pink_next_direction = self.random_next_direction_for_ghost(self.ghost_pink_direction)
+        elif color == 'red':
+            self.ghost_red_pos = list(GHOST_EXIT_POS)
+            self.ghost_red_direction = self.random_direction_for_ghost()
+            self.ghost_red_next_direction = self.random_next_direction_for_ghost(self.ghost_red_direction)
+    
+    def ghost_manager(self):
+        """Gerencia o estado dos fantasmas e modo inofensivo"""
+        if self.harmless_mode:
+            if self.sprite_frame == 60:
+                self.harmless_mode_timer += 1
+            if self.harmless_mode_timer == HARMLESS_MODE_DURATION:
+                self.harmless_mode = False
+                self.harmless_mode_ghost_blue = False
+                self.harmless_mode_ghost_orange = False
+                self.harmless_mode_ghost_pink = False
+                self.harmless_mode_ghost_red = False
+                self.harmless_mode_timer = 0
+        
+        # Mover fantasmas para o jogo quando necessário
+        if self.sprite_frame == 60:
+            if self.ghost_blue_pos == GHOST_BLUE_POS:
+                self.moving_ghost_into_the_game('blue')
+            elif self.ghost_orange_pos == GHOST_ORANGE_POS:
+                self.moving_ghost_into_the_game('orange')
+            elif self.ghost_pink_pos == GHOST_PINK_POS:
+                self.moving_ghost_into_the_game('pink')
+            elif self.ghost_red_pos == GHOST_RED_POS:
+                self.moving_ghost_into_the_game('red')
+    
+    def check_rectangular_collision(self, pacman_pos, ghost_pos):
+        """Verifica colisão retangular mais precisa entre Pacman e fantasma"""
+        # As posições já são os centros dos sprites; as áreas de colisão
+        # (0.4 tile para cada lado) se sobrepõem quando os centros estão a
+        # até COLLISION_DISTANCE passos em cada eixo
+        return (abs(pacman_pos[0] - ghost_pos[0]) <= COLLISION_DISTANCE and
+                abs(pacman_pos[1] - ghost_pos[1]) <= COLLISION_DISTANCE)
+
+    def _check_pacman_ghost_collision(self, pacman_pos):
+        """Verifica colisão entre um Pacman específico e todos os fantasmas"""
+        # Colisão com fantasma azul
+        if self.check_rectangular_collision(pacman_pos, self.ghost_blue_pos):
+            if self.harmless_mode_ghost_blue:
+                self.ghost_blue_pos = list(GHOST_BLUE_POS)
+                self.harmless_mode_ghost_blue = False
+                self.distance_ghost_blue_to_pac_man = self.distance_ghost_to_pac_man(self.ghost_blue_pos)
+                self.score += GHOST_POINTS
+            else:
+                if self.end_game == False:
+                    self.sprite_frame = 0
+                    self.sprite_speed = 1
+                    self.lives -= 1
+                self.end_game = True
+            return True
+        
+        # Colisão com fantasma laranja
+        elif self.check_rectangular_collision(pacman_pos, self.ghost_orange_pos):
+            if self.harmless_mode_ghost_orange:
+                self.ghost_orange_pos = list(GHOST_ORANGE_POS)
+                self.harmless_mode_ghost_orange = False
+                self.distance_ghost_orange_to_pac_man = self.distance_ghost_to_pac_man(self.ghost_orange_pos)
+                self.score += GHOST_POINTS
+            else:
+                if self.end_game == False:
+                    self.sprite_frame = 0
+                    self.sprite_speed = 1
+                    self.lives -= 1
+                self.end_game = True
+            return True
+        
+        # Colisão com fantasma rosa
+        elif self.check_rectangular_collision(pacman_pos, self.ghost_pink_pos):
+            if self.harmless_mode_ghost_pink:
+                self.ghost_pink_pos = list(GHOST_PINK_POS)
+                self.harmless_mode_ghost_pink = False
+                self.distance_ghost_pink_to_pac_man = self.distance_ghost_to_pac_man(self.ghost_pink_pos)
+                self.score += GHOST_POINTS
+            else:
+                if self.end_game == False:
+                    self.sprite_frame = 0
+                    self.sprite_speed = 1
+                    self.lives -= 1
+                self.end_game = True
+            return True
+        
+        # Colisão com fantasma vermelho
+        elif self.check_rectangular_collision(pacman_pos, self.ghost_red_pos):
+            if self.harmless_mode_ghost_red:
+                self.ghost_red_pos = list(GHOST_RED_POS)
+                self.harmless_mode_ghost_red = False
+                self.distance_ghost_red_to_pac_man = self.distance_ghost_to_pac_man(self.ghost_red_pos)
+                self.score += GHOST_POINTS
+            else:
+                if self.end_game == False:
+                    self.sprite_frame = 0
+                    self.sprite_speed = 1
+                    self.lives -= 1
+                self.end_game = True
+            return True
+        
+        return False
+
+    def ghost_and_pacman_collider(self):
+        """Verifica colisões entre todos os Pacmans ativos e fantasmas"""
+        # Player 1 (sempre ativo)
+        if self._check_pacman_ghost_collision(self.pac_man_pos):
+            return
+        
+        # Player 2 (se modo Player 2 ou Player 3)
+        if self.game_mode in ["Player 2", "Player 3"]:
+            if self._check_pacman_ghost_collision(self.pac_man_2_pos):
+                return
+        
+        # Player 3 (se modo Player 3)
+        if self.game_mode == "Player 3":
+            if self._check_pacman_ghost_collision(self.pac_man_3_pos):
+                return
+    
+    def restart_ghost_collision(self):
+        """Reinicia após colisão com fantasma"""
+        if self.sprite_frame == 60 and self.end_game == True and self.lives > -1:
+            self.end_game = False
+            self.harmless_mode = False
+            self.harmless_mode_timer = 0
+            self.harmless_mode_ghost_blue = False
+            self.harmless_mode_ghost_orange = False
+            self.harmless_mode_ghost_pink = False
+            self.harmless_mode_ghost_red = False
+            self.pac_man_pos = list(PACMAN_START_POS)
+            self.pac_man_direction = list(PACMAN_START_DIR)
+            self.pac_man_next_direction = list(PACMAN_START_DIR)
+            self.ghost_blue_pos = list(GHOST_BLUE_POS)
+            self.ghost_orange_pos = list(GHOST_ORANGE_POS)
+            self.ghost_pink_pos = list(GHOST_PINK_POS)
+            self.ghost_red_pos = list(GHOST_RED_POS)
+            self.distance_ghost_blue_to_pac_man = self.distance_ghost_to_pac_man(self.ghost_blue_pos)
+            self.distance_ghost_orange_to_pac_man = self.distance_ghost_to_pac_man(self.ghost_orange_pos)
+            self.distance_ghost_pink_to_pac_man = self.distance_ghost_to_pac_man(self.ghost_pink_pos)
+            self.distance_ghost_red_to_pac_man = self.distance_ghost_to_pac_man(self.ghost_red_pos)
+            self.sprite_speed = SPRITE_SPEED
+            self.end_game = False
+    
+    def collect_all_dots(self):
+        """Verifica se todos os pontos foram coletados"""
+        if self.dot_index.is_empty():
+            self.end_game = False
+            self.harmless_mode = False
+            self.harmless_mode_timer = 0
+            self.harmless_mode_ghost_blue = False
+            self.harmless_mode_ghost_orange = False
+            self.harmless_mode_ghost_pink = False
+            self.harmless_mode_ghost_red = False
+            self.pac_man_pos = list(PACMAN_START_POS)
+            self.pac_man_direction = list(PACMAN_START_DIR)
+            self.pac_man_next_direction = list(PACMAN_START_DIR)
+            self.ghost_blue_pos = list(GHOST_BLUE_POS)
+            self.ghost_orange_pos = list(GHOST_ORANGE_POS)
+            self.ghost_pink_pos = list(GHOST_PINK_POS)
+            self.ghost_red_pos = list(GHOST_RED_POS)
+            self.distance_ghost_blue_to_pac_man = self.distance_ghost_to_pac_man(self.ghost_blue_pos)
+            self.distance_ghost_orange_to_pac_man = self.distance_ghost_to_pac_man(self.ghost_orange_pos)
+            self.distance_ghost_pink_to_pac_man = self.distance_ghost_to_pac_man(self.ghost_pink_pos)
+            self.distance_ghost_red_to_pac_man = self.distance_ghost_to_pac_man(self.ghost_red_pos)
+            self.sprite_speed = SPRITE_SPEED
+            self.end_game = False
+            self._load_map()
+
+            # Reinicializar frutas
+            self._initialize_fruits()
+    
+    def restart(self):
+        """Reinicia o jogo"""
+        self.sprite_frame = 0
+        self.sprite_speed = SPRITE_SPEED
+        self.score = 0
+        self.lives = 5
+        self.end_game = False
+        self.harmless_mode = False
+        self.harmless_mode_timer = 0
+        self.harmless_mode_ghost_blue = False
+        self.harmless_mode_ghost_orange = False
+        self.harmless_mode_ghost_pink = False
+        self.harmless_mode_ghost_red = False
+        self.pac_man_pos = list(PACMAN_START_POS)
+        self.pac_man_direction = list(PACMAN_START_DIR)
+        self.pac_man_next_direction = list(PACMAN_START_DIR)
+        self.pac_man_2_pos = list(PACMAN_2_START_POS)
+        self.pac_man_2_direction = [0, 0]
+        self.pac_man_2_next_direction = [0, 0]
+        self.pac_man_3_pos = list(PACMAN_3_START_POS)
+        self.pac_man_3_direction = [0, 0]
+        self.pac_man_3_next_direction = [0, 0]
+        self.ghost_blue_pos = list(GHOST_BLUE_POS)
+        self.ghost_orange_pos = list(GHOST_ORANGE_POS)
+        self.ghost_pink_pos = list(GHOST_PINK_POS)
+        self.ghost_red_pos = list(GHOST_RED_POS)
+        self.ghost_blue_direction = [0, 0]
+        self.ghost_orange_direction = [0, 0]
+        self.ghost_pink_direction = [0, 0]
+        self.ghost_red_direction = [0, 0]
+        self.ghost_blue_next_direction = [0, 0]
+        self.ghost_orange_next_direction = [0, 0]
+        self.ghost_pink_next_direction = [0, 0]
+        self.ghost_red_next_direction = [0, 0]
+        self.distance_ghost_blue_to_pac_man = self.distance_ghost_to_pac_man(self.ghost_blue_pos)
+        self.distance_ghost_orange_to_pac_man = self.distance_ghost_to_pac_man(self.ghost_orange_pos)
+        self.distance_ghost_pink_to_pac_man = self.distance_ghost_to_pac_man(self.ghost_pink_pos)
+        self.distance_ghost_red_to_pac_man = self.distance_ghost_to_pac_man(self.ghost_red_pos)
+        self._load_map()
+        self.game_mode = "Player 1"  # Reset para modo padrão
+
+        # Reinicializar frutas
+        self._initialize_fruits()
+    
+
+    def step(self):
+        """Avança a simulação em um frame, na mesma ordem do loop principal"""
+        self.animation_step()
+
+        # Atualizar frutas (spawn e expiração)
+        self._update_fruits()
+
+        self.player()
+        self.ghost()
+        self.collect_dots()
+        self.collect_fruits()
+        self.ghost_manager()
+        self.ghost_and_pacman_collider()
+        self.restart_ghost_collision()
+        self.collect_all_dots()
+
+    @property
+    def game_over(self):
+        """Indica se todas as vidas foram perdidas"""
+        return self.lives == -1
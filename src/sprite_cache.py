@@ -0,0 +1,136 @@
+"""
+Cache em disco dos sprites processados do Pac-Man
+Guarda os sprites já redimensionados e coloridos para evitar decodificar
+e processar os PNGs a cada inicialização
+"""
+
+import os
+import struct
+import hashlib
+import pygame as pg
+
+from .table_cache import default_cache_dir
+
+# Cabeçalho do arquivo e de cada entrada (tamanho da chave, largura, altura, formato, bytes)
+MAGIC = b"PMSC1\n"
+ENTRY_HEADER = struct.Struct("<HHHBI")
+FORMATS = ["RGB", "RGBA"]
+
+
+class SpriteCache:
+    """Sprites processados por (hash do PNG, tamanho, cor, processamento) num arquivo por escala
+
+    Na criação o arquivo da escala é lido de uma vez. Cada pedido calcula o
+    hash do conteúdo do PNG: se a chave existe o sprite sai direto dos bytes
+    guardados; senão o PNG é decodificado e processado, e o arquivo é
+    regravado em save() apenas com as entradas usadas nesta execução. Um
+    PNG alterado muda o hash, então a entrada antiga deixa de ser usada e
+    some na próxima gravação. Com enabled=False nada é lido nem gravado,
+    mas cada PNG continua sendo decodificado uma única vez por execução.
+    """
+
+    def __init__(self, scale, cache_dir=None, enabled=True):
+        """Lê o arquivo de cache da escala (ausente ou inválido vira cache vazio)"""
+        self.enabled = enabled
+        self.path = os.path.join(cache_dir or default_cache_dir(), f"sprites_{scale}.bin")
+        self._entries = self._read() if enabled else {}
+        self._used = {}
+        self._hashes = {}
+        self._scaled = {}  # (path, size) -> sprite redimensionado, para decodificar cada PNG uma vez
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+
+    def _read(self):
+        """Lê todas as entradas do arquivo: chave -> (largura, altura, formato, bytes)"""
+        try:
+            with open(self.path, "rb") as cache_file:
+                data = cache_file.read()
+        except OSError:
+            return {}
+        if not data.startswith(MAGIC):
+            return {}
+
+        entries = {}
+        offset = len(MAGIC)
+        try:
+            while offset < len(data):
+                key_size, width, height, format_index, size = ENTRY_HEADER.unpack_from(data, offset)
+                offset += ENTRY_HEADER.size
+                key = data[offset:offset + key_size].decode("utf-8")
+                offset += key_size
+                pixels = data[offset:offset + size]
+                offset += size
+                if len(pixels) != size:
+                    return {}  # Arquivo truncado
+                entries[key] = (width, height, FORMATS[format_index], pixels)
+        except (struct.error, IndexError, UnicodeDecodeError):
+            return {}
+        return entries
+
+    def _file_hash(self, path):
+        """Hash do conteúdo do PNG (calculado uma vez por arquivo)"""
+        if path not in self._hashes:
+            with open(path, "rb") as image_file:
+                self._hashes[path] = hashlib.sha1(image_file.read()).hexdigest()
+        return self._hashes[path]
+
+    def get(self, path, size, tint=None, process=None, version=0):
+        """Retorna o sprite do PNG em path redimensionado para size e colorido com tint
+
+        process(sprite, tint) é chamado após o redimensionamento quando há
+        tint, apenas em caso de falta no cache. O nome de process e version
+        entram na chave: mudar o processamento (e a versão) invalida as
+        entradas antigas.
+        """
+        key = None
+        if self.enabled:
+            key = f"{self._file_hash(path)}:{size[0]}x{size[1]}:{tint}"
+            if tint is not None and process is not None:
+                key += f":{process.__qualname__}@{version}"
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            width, height, pixel_format, pixels = entry
+            self._used[key] = entry
+            return pg.image.frombytes(pixels, (width, height), pixel_format)
+
+        self.misses += 1
+        if (path, size) not in self._scaled:
+            self._scaled[(path, size)] = pg.transform.scale(pg.image.load(path), size)
+        sprite = self._scaled[(path, size)]
+        if tint is not None and process is not None:
+            sprite = process(sprite, tint)
+        if self.enabled:
+            self._store(key, sprite)
+        return sprite
+
+    def _store(self, key, sprite):
+        """Guarda o sprite processado para a próxima gravação"""
+        pixel_format = "RGBA" if sprite.get_flags() & pg.SRCALPHA else "RGB"
+        width, height = sprite.get_size()
+        self._used[key] = (width, height, pixel_format, pg.image.tobytes(sprite, pixel_format))
+        self._dirty = True
+
+    def save(self):
+        """Grava o arquivo se algo mudou (entradas não usadas nesta execução são descartadas)"""
+        self._scaled.clear()
+        if not self.enabled or not self._dirty and len(self._used) == len(self._entries):
+            return
+        chunks = [MAGIC]
+        for key, (width, height, pixel_format, pixels) in self._used.items():
+            encoded_key = key.encode("utf-8")
+            chunks.append(ENTRY_HEADER.pack(len(encoded_key), width, height,
+                                            FORMATS.index(pixel_format), len(pixels)))
+            chunks.append(encoded_key)
+            chunks.append(pixels)
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            temporary_path = self.path + ".tmp"
+            with open(temporary_path, "wb") as cache_file:
+                cache_file.write(b"".join(chunks))
+            os.replace(temporary_path, self.path)
+        except OSError:
+            pass  # Sem permissão de escrita: o jogo segue sem cache
+        self._entries = dict(self._used)
+        self._dirty = False
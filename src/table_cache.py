@@ -0,0 +1,83 @@
+"""
+Cache em disco das tabelas pré-calculadas do labirinto do Pac-Man
+Guarda as tabelas de distâncias e de curvas ao lado do cache de sprites, para
+não refazer as buscas do labirinto a cada inicialização
+"""
+
+import os
+import sys
+import struct
+import hashlib
+from array import array
+
+from .constants import TABLE_CACHE
+
+# Cabeçalho do arquivo e de cada tabela (código de tipo do array, quantidade de itens)
+MAGIC = b"PMTC1\n"
+TABLE_HEADER = struct.Struct("<cI")
+
+
+def default_cache_dir():
+    """Diretório padrão do cache (PACMAN_CACHE_DIR ou o cache do usuário)"""
+    if os.environ.get("PACMAN_CACHE_DIR"):
+        return os.environ["PACMAN_CACHE_DIR"]
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "pacman")
+
+
+def table_path(name, key_parts, cache_dir=None):
+    """Arquivo das tabelas de name para a chave (sha1 do layout e dos parâmetros)"""
+    parts = [*key_parts, sys.byteorder]  # Os arrays são gravados na ordem de bytes da máquina
+    digest = hashlib.sha1("\n".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+    return os.path.join(cache_dir or default_cache_dir(), f"{name}_{digest}.bin")
+
+
+def load_tables(name, key_parts, typecodes, cache_dir=None):
+    """Lê os arrays guardados para a chave (None se ausente, inválido ou desativado)"""
+    if not TABLE_CACHE:
+        return None
+    try:
+        with open(table_path(name, key_parts, cache_dir), "rb") as cache_file:
+            data = cache_file.read()
+    except OSError:
+        return None
+    if not data.startswith(MAGIC):
+        return None
+
+    tables = []
+    offset = len(MAGIC)
+    try:
+        for typecode in typecodes:
+            stored_typecode, count = TABLE_HEADER.unpack_from(data, offset)
+            offset += TABLE_HEADER.size
+            if stored_typecode.decode("ascii") != typecode:
+                return None
+            table = array(typecode)
+            size = count * table.itemsize
+            table.frombytes(data[offset:offset + size])  # ValueError se truncado no meio de um item
+            if len(table) != count:
+                return None  # Arquivo truncado
+            offset += size
+            tables.append(table)
+    except (struct.error, ValueError, UnicodeDecodeError):
+        return None
+    return tables
+
+
+def save_tables(name, key_parts, tables, cache_dir=None):
+    """Grava os arrays para a chave (sem permissão de escrita, segue sem cache)"""
+    if not TABLE_CACHE:
+        return
+    chunks = [MAGIC]
+    for table in tables:
+        chunks.append(TABLE_HEADER.pack(table.typecode.encode("ascii"), len(table)))
+        chunks.append(table.tobytes())
+    path = table_path(name, key_parts, cache_dir)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temporary_path = path + ".tmp"
+        with open(temporary_path, "wb") as cache_file:
+            cache_file.write(b"".join(chunks))
+        os.replace(temporary_path, path)
+    except OSError:
+        pass
@@ -0,0 +1,45 @@
+"""
+Cache de textos renderizados do Pac-Man
+Evita rasterizar com a fonte, a cada frame, textos que não mudaram
+"""
+
+from collections import OrderedDict
+
+
+class TextCache:
+    """Superfícies de texto por (texto, cor) com descarte LRU
+
+    Textos fixos (modo, teclas dos jogadores) são rasterizados uma única
+    vez; a pontuação e as vidas só geram uma nova superfície quando o valor
+    muda. O cache guarda no máximo max_entries superfícies, descartando a
+    usada há mais tempo. As superfícies devolvidas são compartilhadas e só
+    devem ser usadas em blits.
+    """
+
+    def __init__(self, font, max_entries):
+        """Cria o cache para uma fonte (sempre com antialiasing, como o placar)"""
+        self.font = font
+        self.max_entries = max_entries
+        self._surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, text, color):
+        """Retorna o texto renderizado, rasterizando apenas se não estiver no cache"""
+        key = (text, tuple(color))
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = self.font.render(text, 1, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        """Descarta todas as superfícies (por exemplo, ao trocar de fonte)"""
+        self._surfaces.clear()
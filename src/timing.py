@@ -0,0 +1,89 @@
+"""
+Controle de tempo do loop principal do Pac-Man
+Passo fixo da lógica desacoplado da taxa de renderização
+"""
+
+
+class FixedTimestep:
+    """Acumulador de tempo real que decide quantos passos de lógica executar
+
+    A cada frame renderizado o tempo decorrido entra no acumulador e sai em
+    passos de 1/rate segundos, então a velocidade do jogo não depende do FPS
+    de renderização. Para não entrar em espiral quando a máquina não dá
+    conta, no máximo max_steps passos rodam por frame e o atraso restante é
+    descartado (o jogo desacelera em vez de travar). O que sobra no
+    acumulador (alpha, entre 0 e 1) indica quanto do próximo passo já
+    passou, para interpolar as posições desenhadas.
+    """
+
+    def __init__(self, rate, max_steps):
+        """Configura a taxa da lógica (passos por segundo) e o limite de recuperação"""
+        self.step_time = 1.0 / rate
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.dropped_steps = 0  # Passos descartados pelo limite (diagnóstico)
+
+    def advance(self, elapsed):
+        """Acumula elapsed segundos e retorna quantos passos de lógica executar"""
+        self.accumulator += elapsed
+        steps = int(self.accumulator / self.step_time)
+        if steps > self.max_steps:
+            self.dropped_steps += steps - self.max_steps
+            steps = self.max_steps
+            self.accumulator = self.accumulator % self.step_time + steps * self.step_time
+        self.accumulator -= steps * self.step_time
+        return steps
+
+    @property
+    def alpha(self):
+        """Fração do próximo passo já decorrida (0 a 1)"""
+        return min(self.accumulator / self.step_time, 1.0)
+
+    def reset(self):
+        """Descarta o tempo acumulado (após pausas, menus ou contagens)"""
+        self.accumulator = 0.0
+
+
+class FramePacer:
+    """Nível de degradação do trabalho opcional conforme a carga recente
+
+    A cada window voltas do loop compara as médias com o orçamento (o tempo
+    de um passo da lógica): se a volta média passou do orçamento, o nível
+    sobe um degrau; se o tempo de trabalho médio (sem a espera do limitador
+    de FPS) caiu abaixo de recovery * orçamento, desce um degrau. A faixa
+    entre os dois limites mantém o nível, evitando oscilar a cada janela.
+    O significado de cada nível fica com quem consulta level.
+    """
+
+    def __init__(self, budget, window, recovery, max_level):
+        """Configura o orçamento (segundos), a janela (voltas) e o nível máximo"""
+        self.budget = budget
+        self.window = window
+        self.recovery = recovery
+        self.max_level = max_level
+        self.level = 0
+        self.changes = 0  # Mudanças de nível (diagnóstico)
+        self._wall = 0.0
+        self._busy = 0.0
+        self._count = 0
+
+    def record(self, wall, busy):
+        """Registra uma volta (duração total e tempo de trabalho); retorna True se o nível mudou"""
+        self._wall += wall
+        self._busy += busy
+        self._count += 1
+        if self._count < self.window:
+            return False
+
+        wall = self._wall / self._count
+        busy = self._busy / self._count
+        self._wall = self._busy = 0.0
+        self._count = 0
+        if wall > self.budget and self.level < self.max_level:
+            self.level += 1
+        elif busy < self.budget * self.recovery and self.level > 0:
+            self.level -= 1
+        else:
+            return False
+        self.changes += 1
+        return True
@@ -0,0 +1,13 @@
+"""
+Configuração dos testes: torna o pacote src importável a partir da raiz do repositório
+e grava os caches em disco num diretório temporário
+"""
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+_cache_dir = tempfile.TemporaryDirectory(prefix="pacman-tests-")
+os.environ["PACMAN_CACHE_DIR"] = _cache_dir.name
@@ -0,0 +1,70 @@
+"""
+Índice de pontos (DotIndex) sincronizado com o mapa
+"""
+
+import random
+
+from src.constants import GAME_MAP, DOT, POWER_PELLET, EMPTY
+from src.dots import DotIndex
+from src.simulation import GameSimulation
+
+
+def scan(game_map, cell_type):
+    """Tiles do mapa com o tipo de célula dado (a varredura que o índice substitui)"""
+    return {(x, y) for y, row in enumerate(game_map) for x, cell in enumerate(row) if cell == cell_type}
+
+
+def assert_in_sync(index, game_map):
+    assert index.dots == scan(game_map, DOT)
+    assert index.power_pellets == scan(game_map, POWER_PELLET)
+    assert index.remaining == len(index.dots) + len(index.power_pellets)
+    assert index.is_empty() == (index.remaining == 0)
+
+
+def test_remove_keeps_counts_in_sync():
+    game_map = [row[:] for row in GAME_MAP]
+    index = DotIndex(game_map)
+    assert_in_sync(index, game_map)
+    assert index.remaining > 0
+
+    for x, y in sorted(index.power_pellets):
+        game_map[y][x] = EMPTY
+        index.remove_power_pellet((x, y))
+        assert_in_sync(index, game_map)
+    for x, y in sorted(index.dots):
+        game_map[y][x] = EMPTY
+        index.remove_dot((x, y))
+    assert_in_sync(index, game_map)
+    assert index.is_empty()
+
+
+def test_simulation_keeps_index_in_sync_with_map():
+    random.seed(7)
+    rng = random.Random(3)
+    sim = GameSimulation("Player 3")
+    keys = list("wasdijkl") + ["up", "down", "left", "right"]
+    collected = 0
+    for _ in range(2000):
+        if rng.random() < 0.05:
+            sim.move(rng.choice(keys))
+        if sim.lives < 1:
+            sim.lives = 2
+        before = sim.dot_index.remaining
+        sim.step()
+        collected += max(0, before - sim.dot_index.remaining)
+        assert_in_sync(sim.dot_index, sim.map)
+    assert collected > 0
+
+
+def test_level_clear_rebuilds_the_index():
+    sim = GameSimulation()
+    total = sim.dot_index.remaining
+    for x, y in list(sim.dot_index.dots):
+        sim.map[y][x] = EMPTY
+        sim.dot_index.remove_dot((x, y))
+    for x, y in list(sim.dot_index.power_pellets):
+        sim.map[y][x] = EMPTY
+        sim.dot_index.remove_power_pellet((x, y))
+    sim.collect_all_dots()
+    assert sim.dot_index.remaining == total
+    assert_in_sync(sim.dot_index, sim.map)
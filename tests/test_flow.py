@@ -0,0 +1,62 @@
+"""
+Transições da partida (GameFlow): contagem, fim de nível e renascimento
+"""
+
+import pytest
+
+from src.constants import (STARTING, PLAYING, FAILED, WON, START_COUNTDOWN, COUNTDOWN_GO_TIME,
+                           LEVEL_CLEAR_TIME)
+from src.flow import GameFlow
+
+FRAME = 1 / 60
+
+
+def run_until_playing(flow, frame=FRAME):
+    """Avança a transição em frames de duração fixa; retorna (tempo até PLAYING, rótulos exibidos)"""
+    elapsed = 0.0
+    labels = []
+    while flow.state != PLAYING:
+        label = flow.label()
+        if not labels or labels[-1] != label:
+            labels.append(label)
+        assert not flow.simulating
+        flow.update(frame)
+        elapsed += frame
+    return elapsed, labels
+
+
+def test_start_countdown():
+    flow = GameFlow()
+    flow.enter(STARTING, START_COUNTDOWN + COUNTDOWN_GO_TIME)
+    elapsed, labels = run_until_playing(flow)
+    assert elapsed == pytest.approx(START_COUNTDOWN + COUNTDOWN_GO_TIME, abs=FRAME)
+    assert labels == [str(n) for n in range(START_COUNTDOWN, 0, -1)] + ["GO"]
+    assert flow.simulating and flow.label() is None
+
+
+def test_level_clear_pauses_then_shows_go():
+    flow = GameFlow()
+    flow.enter(WON, LEVEL_CLEAR_TIME)
+    elapsed, labels = run_until_playing(flow)
+    assert elapsed == pytest.approx(LEVEL_CLEAR_TIME + COUNTDOWN_GO_TIME, abs=2 * FRAME)
+    assert labels == ["LEVEL UP", "GO"]
+
+
+def test_failed_keeps_simulating_until_respawn():
+    flow = GameFlow()
+    flow.enter(FAILED)
+    for _ in range(600):
+        flow.update(FRAME)
+    assert flow.state == FAILED and flow.simulating and flow.label() is None
+
+    flow.enter(STARTING, COUNTDOWN_GO_TIME)
+    elapsed, labels = run_until_playing(flow)
+    assert elapsed == pytest.approx(COUNTDOWN_GO_TIME, abs=FRAME)
+    assert labels == ["GO"]
+
+
+def test_a_single_long_frame_ends_the_transition():
+    flow = GameFlow()
+    flow.enter(STARTING, START_COUNTDOWN + COUNTDOWN_GO_TIME)
+    flow.update(START_COUNTDOWN + COUNTDOWN_GO_TIME + 1.0)
+    assert flow.state == PLAYING
@@ -0,0 +1,113 @@
+"""
+Estruturas do labirinto contra o mapa: distâncias (MazeDistances) comparadas com
+uma BFS direta e grafo de cruzamentos (JunctionGraph) comparado com os corredores
+"""
+
+from collections import deque
+
+import pytest
+
+from src.constants import GAME_MAP, WALL
+from src.maze import MazeDistances, JunctionGraph, TILE_DIRECTIONS
+
+HEIGHT = len(GAME_MAP)
+WIDTH = len(GAME_MAP[0])
+WALKABLE = [(x, y) for y in range(HEIGHT) for x in range(WIDTH) if GAME_MAP[y][x] != WALL]
+
+
+def neighbors(tile):
+    """Vizinhos transitáveis, com a ligação do túnel entre a primeira e a última coluna"""
+    x, y = tile
+    for dx, dy in TILE_DIRECTIONS:
+        nx, ny = (x + dx) % WIDTH, y + dy
+        if 0 <= ny < HEIGHT and GAME_MAP[ny][nx] != WALL:
+            yield nx, ny
+
+
+def brute_force_distances(source):
+    """Distâncias de source a todos os tiles alcançáveis"""
+    distances = {source: 0}
+    queue = deque([source])
+    while queue:
+        tile = queue.popleft()
+        for neighbor in neighbors(tile):
+            if neighbor not in distances:
+                distances[neighbor] = distances[tile] + 1
+                queue.append(neighbor)
+    return distances
+
+
+@pytest.fixture(scope="module")
+def maze():
+    return MazeDistances([row[:] for row in GAME_MAP])
+
+
+@pytest.fixture(scope="module")
+def expected():
+    return {source: brute_force_distances(source) for source in WALKABLE}
+
+
+def test_distances_match_brute_force_bfs(maze, expected):
+    mismatches = [
+        (a, b) for a in WALKABLE for b in WALKABLE
+        if maze.distance(a, b) != expected[a].get(b)
+    ]
+    assert mismatches == []
+
+
+def test_best_step_starts_a_shortest_path(maze, expected):
+    for a in WALKABLE:
+        assert maze.best_step(a, a) is None
+        for b, distance in expected[a].items():
+            if a == b:
+                continue
+            dx, dy = maze.best_step(a, b)
+            step = ((a[0] + dx) % WIDTH, a[1] + dy)
+            assert step in set(neighbors(a))
+            assert expected[step][b] == distance - 1
+
+
+def test_tunnel_links_the_edge_columns(maze):
+    tunnel_rows = [y for y in range(HEIGHT) if GAME_MAP[y][0] != WALL and GAME_MAP[y][WIDTH - 1] != WALL]
+    assert tunnel_rows
+    for y in tunnel_rows:
+        assert maze.distance((0, y), (WIDTH - 1, y)) == 1
+        assert maze.best_step((0, y), (WIDTH - 1, y)) == (-1, 0)
+        assert maze.distance((-1, y), (WIDTH - 1, y)) == 0  # Agente dentro do túnel
+
+
+@pytest.fixture(scope="module")
+def graph():
+    return JunctionGraph([row[:] for row in GAME_MAP])
+
+
+def test_nodes_are_junctions_and_dead_ends(graph):
+    for tile in WALKABLE:
+        exits = len(set(neighbors(tile)))
+        assert graph.is_junction(tile) == (exits != 2)
+        assert len(graph.tile_exits(tile)) == exits
+
+
+def test_edge_lengths_cover_every_corridor_tile(graph):
+    corridor_tiles = [tile for tile in WALKABLE if not graph.is_junction(tile)]
+    edges = [edge for node in graph.nodes for edge in graph.edges_from(node)]
+    # Cada corredor é percorrido a partir dos seus dois nós: os tiles internos contam duas vezes
+    assert sum(length - 1 for _, _, length in edges) == 2 * len(corridor_tiles)
+
+
+def test_edges_are_symmetric_and_match_distances(graph, expected):
+    for node in graph.nodes:
+        for _, end, length in graph.edges_from(node):
+            assert graph.is_junction(end)
+            assert length >= expected[node][end]
+            assert any(other == node and other_length == length
+                       for _, other, other_length in graph.edges_from(end))
+
+
+def test_tunnel_corridor_wraps(graph):
+    tunnel_rows = [y for y in range(HEIGHT) if GAME_MAP[y][0] != WALL and GAME_MAP[y][WIDTH - 1] != WALL]
+    crossing = [
+        (node, end) for node in graph.nodes for (dx, _), end, _ in graph.edges_from(node)
+        if node[1] == end[1] and node[1] in tunnel_rows and dx * (end[0] - node[0]) < 0
+    ]
+    assert crossing  # Alguma aresta sai por um lado do túnel e chega pelo outro
@@ -0,0 +1,93 @@
+"""
+Equivalência do motor de movimento vetorizado (MovementEngine) com o caminho por agente
+"""
+
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src import simulation
+from src.collision import CollisionGrid
+from src.constants import (GAME_MAP, SUBSTEPS, TUNNEL_LEFT_EDGE, TUNNEL_RIGHT_EDGE,
+                           TUNNEL_LEFT_ENTRY, TUNNEL_RIGHT_ENTRY)
+from src.movement import MovementEngine
+
+DIRECTIONS = [[1, 0], [0, 1], [-1, 0], [0, -1], [0, 0]]
+
+
+@pytest.fixture(scope="module")
+def engine():
+    return MovementEngine(CollisionGrid([row[:] for row in GAME_MAP]))
+
+
+def scalar_step(grid, position, direction, next_direction):
+    """Um passo do agente como turning_corner, collider e pacman_tunnel"""
+    if not grid.point_collides(position[0] + next_direction[0] * SUBSTEPS,
+                              position[1] + next_direction[1] * SUBSTEPS):
+        direction[:] = next_direction
+    grid.move(position, direction)
+    if position[0] >= TUNNEL_RIGHT_EDGE:
+        position[0] = TUNNEL_LEFT_ENTRY
+    elif position[0] <= TUNNEL_LEFT_EDGE:
+        position[0] = TUNNEL_RIGHT_ENTRY
+
+
+def test_blocked_matrix_matches_point_collides(engine):
+    grid = engine.grid
+    height, width = engine.blocked.shape
+    mismatches = [
+        (x, y)
+        for y in range(-engine.MARGIN, height - engine.MARGIN)
+        for x in range(-engine.MARGIN, width - engine.MARGIN)
+        if engine.blocked[y + engine.MARGIN, x + engine.MARGIN] != grid.point_collides(x, y)
+    ]
+    assert mismatches == []
+
+
+def test_many_agents_match_the_per_agent_path(engine):
+    grid = engine.grid
+    rng = random.Random(8)
+    count = 500
+    positions = [[rng.randrange(grid.width * SUBSTEPS), rng.randrange(grid.height * SUBSTEPS)]
+                 for _ in range(count)]
+    directions = [list(rng.choice(DIRECTIONS)) for _ in range(count)]
+    next_directions = [list(rng.choice(DIRECTIONS)) for _ in range(count)]
+
+    engine.load(positions, directions, next_directions)
+    for _ in range(100):
+        for index in rng.sample(range(count), 20):
+            next_directions[index] = list(rng.choice(DIRECTIONS))
+            engine.next_directions[index] = next_directions[index]
+        for position, direction, next_direction in zip(positions, directions, next_directions):
+            scalar_step(grid, position, direction, next_direction)
+        engine.step()
+
+    assert engine.positions.tolist() == positions
+    assert engine.directions.tolist() == directions
+
+
+def run_game(batched, monkeypatch, frames=1500):
+    """Estados da simulação com entradas roteirizadas"""
+    monkeypatch.setattr(simulation, "BATCHED_MOVEMENT", batched)
+    random.seed(1234)
+    rng = random.Random(99)
+    sim = simulation.GameSimulation("Player 3")
+    assert (sim.movement_engine is not None) == batched
+    keys = list("wasdijkl") + ["up", "down", "left", "right"]
+    states = []
+    for _ in range(frames):
+        if rng.random() < 0.05:
+            sim.move(rng.choice(keys))
+        if sim.lives < 1:
+            sim.lives = 2
+        sim.step()
+        states.append((sim.score, sim.end_game, tuple(sim.pac_man_pos), tuple(sim.pac_man_2_pos),
+                       tuple(sim.pac_man_3_pos), tuple(sim.ghost_blue_pos), tuple(sim.ghost_orange_pos),
+                       tuple(sim.ghost_pink_pos), tuple(sim.ghost_red_pos)))
+    return states
+
+
+def test_batched_game_matches_scalar_game(monkeypatch):
+    assert run_game(True, monkeypatch) == run_game(False, monkeypatch)
@@ -0,0 +1,22 @@
+"""
+A simulação roda sem importar o pygame
+"""
+
+import os
+import subprocess
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_simulation_does_not_import_pygame():
+    code = (
+        "import sys\n"
+        "from src.simulation import GameSimulation\n"
+        "sim = GameSimulation('Player 3')\n"
+        "for _ in range(300):\n"
+        "    sim.step()\n"
+        "assert 'pygame' not in sys.modules, 'pygame importado'\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT_DIR, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
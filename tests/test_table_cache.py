@@ -0,0 +1,64 @@
+"""
+Cache em disco das tabelas do labirinto (distâncias e curvas)
+"""
+
+import os
+from array import array
+
+from src import collision, maze
+from src.collision import CollisionGrid, TurnTable
+from src.constants import GAME_MAP
+from src.maze import MazeDistances
+from src.table_cache import load_tables, save_tables, table_path
+
+
+def test_round_trip(tmp_path):
+    tables = [array('H', [1, 2, 0xFFFF]), array('b', [-1, 0, 3])]
+    save_tables("maze", ("layout", 1), tables, tmp_path)
+    assert load_tables("maze", ("layout", 1), "Hb", tmp_path) == tables
+    assert load_tables("maze", ("layout", 2), "Hb", tmp_path) is None  # Outra chave, outro arquivo
+    assert load_tables("maze", ("layout", 1), "HB", tmp_path) is None  # Tipo diferente
+
+
+def test_invalid_files_are_ignored(tmp_path):
+    tables = [array('H', range(100))]
+    save_tables("maze", ("layout",), tables, tmp_path)
+    path = table_path("maze", ("layout",), tmp_path)
+    with open(path, "rb") as cache_file:
+        data = cache_file.read()
+    with open(path, "wb") as cache_file:
+        cache_file.write(data[:-3])  # Truncado
+    assert load_tables("maze", ("layout",), "H", tmp_path) is None
+    with open(path, "wb") as cache_file:
+        cache_file.write(b"lixo")
+    assert load_tables("maze", ("layout",), "H", tmp_path) is None
+
+
+def test_maze_tables_are_read_back_from_disk(monkeypatch, tmp_path):
+    monkeypatch.setenv("PACMAN_CACHE_DIR", str(tmp_path))
+    game_map = [row[:] for row in GAME_MAP]
+    computed = MazeDistances(game_map)
+
+    monkeypatch.setattr(maze, "_distance_cache", {})
+    first = MazeDistances.for_map(game_map)  # Calcula e grava
+    assert any(name.startswith("maze_") for name in os.listdir(tmp_path))
+
+    monkeypatch.setattr(maze, "_distance_cache", {})
+    monkeypatch.setattr(MazeDistances, "_breadth_first_search", None)  # Não pode recalcular
+    loaded = MazeDistances.for_map(game_map)
+    assert loaded is not first
+    assert loaded.distances == computed.distances
+    assert loaded.next_steps == computed.next_steps
+
+
+def test_turn_table_is_read_back_from_disk(monkeypatch, tmp_path):
+    monkeypatch.setenv("PACMAN_CACHE_DIR", str(tmp_path))
+    grid = CollisionGrid([row[:] for row in GAME_MAP])
+    computed = TurnTable(grid)
+
+    monkeypatch.setattr(collision, "_turn_table_cache", {})
+    TurnTable.for_grid(grid)
+
+    monkeypatch.setattr(collision, "_turn_table_cache", {})
+    monkeypatch.setattr(TurnTable, "_build_blocked_table", None)  # Não pode recalcular
+    assert TurnTable.for_grid(grid).masks == computed.masks
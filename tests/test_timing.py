@@ -0,0 +1,104 @@
+"""
+Controle de tempo do loop principal: passo fixo (FixedTimestep) e ritmo adaptativo (FramePacer)
+"""
+
+import random
+
+import pytest
+
+from src.constants import (LOGIC_RATE, MAX_CATCH_UP_STEPS, PACING_WINDOW, PACING_RECOVERY,
+                           PACING_SKIP_FRAMES)
+from src.timing import FixedTimestep, FramePacer
+
+
+@pytest.mark.parametrize("steps_per_frame", [0.25, 0.5, 1, 2])
+def test_steady_frames_give_exactly_elapsed_times_rate(steps_per_frame):
+    timestep = FixedTimestep(LOGIC_RATE, MAX_CATCH_UP_STEPS)
+    frames = 600
+    steps = sum(timestep.advance(steps_per_frame / LOGIC_RATE) for _ in range(frames))
+    assert steps == frames * steps_per_frame
+    assert timestep.dropped_steps == 0
+
+
+def test_irregular_frames_keep_the_remainder():
+    timestep = FixedTimestep(LOGIC_RATE, MAX_CATCH_UP_STEPS)
+    rng = random.Random(5)
+    elapsed = 0.0
+    steps = 0
+    for _ in range(5000):
+        frame_time = rng.uniform(0.001, (MAX_CATCH_UP_STEPS - 1) / LOGIC_RATE)
+        elapsed += frame_time
+        steps += timestep.advance(frame_time)
+        assert 0.0 <= timestep.alpha <= 1.0
+    # Nada se perde: passos executados mais a fração acumulada somam o tempo decorrido
+    assert steps + timestep.alpha == pytest.approx(elapsed * LOGIC_RATE)
+    assert timestep.dropped_steps == 0
+
+
+def test_long_frame_is_capped_and_the_backlog_dropped():
+    timestep = FixedTimestep(LOGIC_RATE, MAX_CATCH_UP_STEPS)
+    timestep.advance(0.25 / LOGIC_RATE)
+    assert timestep.advance(1.0) == MAX_CATCH_UP_STEPS
+    assert timestep.dropped_steps == LOGIC_RATE - MAX_CATCH_UP_STEPS
+    assert timestep.alpha == pytest.approx(0.25)  # Só a fração do passo é mantida
+    assert timestep.advance(0.0) == 0
+
+
+def test_reset_discards_accumulated_time():
+    timestep = FixedTimestep(LOGIC_RATE, MAX_CATCH_UP_STEPS)
+    timestep.advance(0.9 / LOGIC_RATE)
+    timestep.reset()
+    assert timestep.alpha == 0.0
+    assert timestep.advance(0.5 / LOGIC_RATE) == 0
+
+
+BUDGET = 1 / LOGIC_RATE
+
+
+def new_pacer():
+    return FramePacer(BUDGET, PACING_WINDOW, PACING_RECOVERY, PACING_SKIP_FRAMES)
+
+
+def run_window(pacer, wall, busy):
+    """Registra uma janela inteira de voltas iguais; retorna se o nível mudou na última"""
+    changes = [pacer.record(wall, busy) for _ in range(PACING_WINDOW)]
+    assert not any(changes[:-1])  # O nível só é reavaliado no fim da janela
+    return changes[-1]
+
+
+def test_level_rises_one_step_per_overloaded_window():
+    pacer = new_pacer()
+    for level in range(1, PACING_SKIP_FRAMES + 1):
+        assert run_window(pacer, BUDGET * 1.5, BUDGET * 1.5)
+        assert pacer.level == level
+    assert not run_window(pacer, BUDGET * 3, BUDGET * 3)  # Limitado ao nível máximo
+    assert pacer.level == PACING_SKIP_FRAMES
+
+
+def test_level_holds_between_the_thresholds():
+    pacer = new_pacer()
+    run_window(pacer, BUDGET * 2, BUDGET * 2)
+    # Volta dentro do orçamento, mas trabalho acima de PACING_RECOVERY do orçamento
+    assert not run_window(pacer, BUDGET * 0.95, BUDGET * (PACING_RECOVERY + 0.1))
+    assert pacer.level == 1
+
+
+def test_level_falls_back_when_work_drops_below_recovery():
+    pacer = new_pacer()
+    for _ in range(3):
+        run_window(pacer, BUDGET * 2, BUDGET * 2)
+    for level in (2, 1, 0):
+        # O limitador de FPS completa a volta: conta só o tempo de trabalho
+        assert run_window(pacer, BUDGET * 0.95, BUDGET * (PACING_RECOVERY - 0.1))
+        assert pacer.level == level
+    assert not run_window(pacer, BUDGET * 0.95, 0.0)
+    assert pacer.level == 0
+    assert pacer.changes == 6
+
+
+def test_a_single_spike_is_averaged_out():
+    pacer = new_pacer()
+    for _ in range(PACING_WINDOW - 1):
+        pacer.record(BUDGET * 0.5, BUDGET * 0.5)
+    pacer.record(BUDGET * 2, BUDGET * 2)
+    assert pacer.level == 0
@@ -0,0 +1,91 @@
+"""
+Equivalência da tabela de curvas (TurnTable) com a varredura original do mapa
+"""
+
+from collections import deque
+
+import pytest
+
+from src.collision import CollisionGrid, TurnTable
+from src.constants import (GAME_MAP, WALL, TUNNEL, DOT, EMPTY, SUBSTEPS, WALL_BOX_START,
+                           WALL_BOX_END, PACMAN_START_POS, PACMAN_2_START_POS, PACMAN_3_START_POS,
+                           GHOST_BLUE_POS, GHOST_ORANGE_POS, GHOST_PINK_POS, GHOST_RED_POS,
+                           GHOST_EXIT_POS, TUNNEL_LEFT_EDGE, TUNNEL_RIGHT_EDGE,
+                           TUNNEL_LEFT_ENTRY, TUNNEL_RIGHT_ENTRY)
+
+DIRECTIONS = [(1, 0), (0, 1), (-1, 0), (0, -1), (0, 0)]
+SPAWNS = [PACMAN_START_POS, PACMAN_2_START_POS, PACMAN_3_START_POS, GHOST_BLUE_POS,
+          GHOST_ORANGE_POS, GHOST_PINK_POS, GHOST_RED_POS, GHOST_EXIT_POS]
+
+
+def legacy_can_turn(game_map, position, next_direction):
+    """Varredura do mapa inteiro como no turning_corner original (em ponto fixo)"""
+    x_agent = position[0] + next_direction[0] * SUBSTEPS
+    y_agent = position[1] + next_direction[1] * SUBSTEPS
+    for y, row in enumerate(game_map):
+        for x, cell in enumerate(row):
+            if cell == WALL or cell == TUNNEL:
+                if (x * SUBSTEPS + WALL_BOX_START <= x_agent <= x * SUBSTEPS + WALL_BOX_END and
+                        y * SUBSTEPS + WALL_BOX_START <= y_agent <= y * SUBSTEPS + WALL_BOX_END):
+                    return False
+    return True
+
+
+def tunnel(position):
+    """Mesma regra de GameSimulation.pacman_tunnel"""
+    if position[0] >= TUNNEL_RIGHT_EDGE:
+        return (TUNNEL_LEFT_ENTRY, position[1])
+    if position[0] <= TUNNEL_LEFT_EDGE:
+        return (TUNNEL_RIGHT_ENTRY, position[1])
+    return tuple(position)
+
+
+def reachable_positions(grid):
+    """Posições alcançáveis a partir dos pontos de partida, andando pelo collider"""
+    seen = {tuple(spawn) for spawn in SPAWNS}
+    queue = deque(seen)
+    while queue:
+        position = queue.popleft()
+        for direction in DIRECTIONS[:4]:
+            moved = tunnel(grid.move(list(position), direction))
+            if moved not in seen:
+                seen.add(moved)
+                queue.append(moved)
+    return sorted(seen)
+
+
+@pytest.fixture(scope="module")
+def maze():
+    game_map = [row[:] for row in GAME_MAP]
+    grid = CollisionGrid(game_map)
+    return game_map, grid, TurnTable(grid)
+
+
+def test_reachable_positions_cover_the_maze(maze):
+    _, grid, _ = maze
+    positions = reachable_positions(grid)
+    tiles = {(x // SUBSTEPS, y // SUBSTEPS) for x, y in positions}
+    assert len(positions) > 1000
+    assert len(tiles) > 250
+
+
+def test_turn_table_matches_legacy_scan(maze):
+    game_map, grid, table = maze
+    mismatches = []
+    for position in reachable_positions(grid):
+        for direction in DIRECTIONS:
+            expected = legacy_can_turn(game_map, position, direction)
+            if table.can_turn(position, direction) != expected:
+                mismatches.append((position, direction))
+            assert grid.point_collides(position[0] + direction[0] * SUBSTEPS,
+                                       position[1] + direction[1] * SUBSTEPS) == (not expected)
+    assert mismatches == []
+
+
+def test_tables_are_reused_for_the_same_layout():
+    first = [row[:] for row in GAME_MAP]
+    second = [row[:] for row in GAME_MAP]
+    second[1] = [EMPTY if cell == DOT else cell for cell in second[1]]  # Pontos comidos
+    grid = CollisionGrid.for_map(first)
+    assert CollisionGrid.for_map(second) is grid
+    assert TurnTable.for_grid(grid) is TurnTable.for_grid(CollisionGrid.for_map(second))